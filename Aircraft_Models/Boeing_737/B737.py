@@ -36,12 +36,17 @@ from SUAVE.Methods.Noise.Certification import sideline_noise
 from SUAVE.Methods.Noise.Certification import flyover_noise 
 from SUAVE.Methods.Noise.Certification import approach_noise
 
+import sys 
+sys.path.append('../Mission_Tools')
+import Certification_Runner
+
 # ----------------------------------------------------------------------
 #   Main
 # ----------------------------------------------------------------------
 
 def main():
     ti = time.time()
+    run_certification = False  # evaluate the sideline, flyover and approach certification noise
     configs, analyses = full_setup()
 
     simple_sizing(configs)
@@ -57,10 +62,10 @@ def main():
     mission = analyses.missions.base
     results = mission.evaluate() 
     
-    # certification calcula 
-    #sideline_SPL  = sideline_noise(analyses,configs) 
-    #flyover_SPL   = flyover_noise(analyses,configs)  
-    #approach_SPL  = approach_noise(analyses,configs)
+    # certification calculations, sideline, flyover and approach run concurrently 
+    if run_certification:
+        certification = Certification_Runner.run_certification_noise(os.path.dirname(os.path.abspath(__file__)),'B737',
+                                                                      filename = 'B737',configs = configs,analyses = analyses)
       
     tf = time.time()
     print ('Time taken: ' + str(round((tf-ti)/60,3))  + ' min')
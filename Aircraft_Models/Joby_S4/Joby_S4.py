@@ -30,6 +30,11 @@ import numpy as np
 import pylab as plt
 from copy import deepcopy 
 
+import sys 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','Mission_Tools'))
+from BEM_Rotor_IO   import read_bem_rotor, set_design_point
+from Rotor_Grouping import group_identical_rotors
+
 
 # ----------------------------------------------------------------------
 #   Main
@@ -82,7 +87,7 @@ def full_setup():
 # ----------------------------------------------------------------------
 #   Build the Vehicle
 # ----------------------------------------------------------------------
-def vehicle_setup():
+def vehicle_setup(from_bem = False,group_rotors = False):
 
     # ------------------------------------------------------------------
     #   Initialize the Vehicle
@@ -465,10 +470,21 @@ def vehicle_setup():
                                                      rel_path +'../Airfoils/Polars/NACA_4412_polar_Re_200000.txt' ,
                                                      rel_path +'../Airfoils/Polars/NACA_4412_polar_Re_500000.txt' ,
                                                      rel_path +'../Airfoils/Polars/NACA_4412_polar_Re_1000000.txt' ] 
-    prop_rotor.append_airfoil(airfoil)   
-    prop_rotor.airfoil_polar_stations            = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]   
-    prop_rotor                                   = prop_rotor_design(prop_rotor)  
-    prop_rotor.design_Cl                         = prop_rotor.design_Cl_hover
+    if from_bem:
+        # skip the design, read the shipped blade geometry and evaluate it once in hover 
+        speed_of_sound                           = 343
+        prop_rotor                               = read_bem_rotor(rel_path + 'prop_rotor_1.bem',prop_rotor,airfoil)
+        prop_rotor                               = set_design_point(prop_rotor,prop_rotor.design_altitude_hover,prop_rotor.freestream_velocity_hover,
+                                                                    prop_rotor.design_tip_mach_hover*speed_of_sound/prop_rotor.tip_radius,lift_rotor = True)
+        prop_rotor.design_Cl_hover               = prop_rotor.design_Cl
+        prop_rotor.angular_velocity_hover        = prop_rotor.angular_velocity
+        prop_rotor.design_torque_hover           = prop_rotor.design_torque
+        prop_rotor.design_power_hover            = prop_rotor.design_power
+    else:
+        prop_rotor.append_airfoil(airfoil)   
+        prop_rotor.airfoil_polar_stations        = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]   
+        prop_rotor                               = prop_rotor_design(prop_rotor)  
+        prop_rotor.design_Cl                     = prop_rotor.design_Cl_hover
             
     # Prop Rotors                                          
     prop_rotor_origins           = [[0.208, -1.848,  1.195],[0.208, 1.848,  1.195],
@@ -480,6 +496,10 @@ def vehicle_setup():
         pr.origin                 = [prop_rotor_origins[ii]] 
         net.propellers.append(pr)  
 
+    if group_rotors:
+        # spin each set of identical prop-rotors once per control point
+        group_identical_rotors(net.propellers)
+
     # Component 7 the Motors
     # Propeller (Thrust) motor
     prop_rotor_motor                      = SUAVE.Components.Energy.Converters.Motor() 
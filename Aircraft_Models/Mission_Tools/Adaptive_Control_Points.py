@@ -0,0 +1,273 @@
+# Adaptive_Control_Points.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import numpy as np
+
+import Noise_Replay
+
+# ----------------------------------------------------------------------
+#   Default Tolerances
+# ----------------------------------------------------------------------
+def default_tolerances():
+    """Absolute interpolation error allowed on the monitored states.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    tolerances.altitude          [m]
+    tolerances.state_of_charge   [-]
+    tolerances.rpm               [rpm]
+
+    Properties Used:
+    N/A
+    """
+    tolerances                 = Data()
+    tolerances.altitude        = 1.0
+    tolerances.state_of_charge = 1E-3
+    tolerances.rpm             = 10.
+    return tolerances
+
+# ----------------------------------------------------------------------
+#   Adaptive Mission Evaluate
+# ----------------------------------------------------------------------
+def adaptive_mission_evaluate(mission_setup,coarse_control_points = 5,tolerances = None,max_control_points = 33,max_refinements = 3,
+                              noise_setup = None,number_of_workers = None,noise_metrics = None):
+    """Solves a mission with per-segment control point counts. Every segment starts
+    at a coarse count; after each solve the Chebyshev interpolation error of the
+    monitored states is estimated per segment and only the segments that miss
+    the tolerance are refined (N -> 2N-1, which keeps the previous points). The next
+    pass re-solves only the refined segments, warm-started from the interpolant of
+    their previous solution; the other segments keep their previous solution. Noise
+    is evaluated once, on the final trajectory.
+
+    Assumptions:
+    The mission is rebuilt by mission_setup for every pass, so counts hard-coded
+    in the mission (e.g. control_points*3 in a cruise) are overridden. Segment
+    tags are unique. The analyses of mission_setup run no noise model. A segment
+    that is not refined is re-solved, warm-started from its previous unknowns, if
+    the refinement of an earlier segment moved its initial altitude or state of
+    charge by more than the tolerance
+
+    Source:
+    Trefethen, L. N., "Approximation Theory and Approximation Practice", SIAM 2013,
+    for the decay of Chebyshev coefficients as an error estimate
+
+    Inputs:
+    mission_setup           - function(control_points) returning an unfinalized mission
+    coarse_control_points   - starting number of control points per segment
+    tolerances              - see default_tolerances
+    max_control_points      - upper limit per segment
+    max_refinements         - maximum number of refinement passes
+    noise_setup             - function(vehicle) returning the noise analysis of a
+                              configuration, see Noise_Replay.replay_noise. No noise
+                              is evaluated if None
+    number_of_workers       - size of the noise replay process pool
+    noise_metrics           - see Noise_Replay.replay_noise
+
+    Outputs:
+    results                 - results of the final pass
+    results.control_points  - Data of segment tag: number of control points
+    results.interpolation_errors - Data of segment tag: Data of state: error estimate
+
+    Properties Used:
+    N/A
+    """
+    if tolerances == None:
+        tolerances = default_tolerances()
+
+    counts   = Data()
+    previous = Data()
+    refined  = []
+    for refinement in range(max_refinements + 1):
+        mission = mission_setup(coarse_control_points)
+        reused  = []
+        for segment in mission.segments.values():
+            if segment.tag not in counts:
+                counts[segment.tag] = coarse_control_points
+            segment.state.numerics.number_control_points = counts[segment.tag]
+            if segment.tag in refined:
+                segment.process.initialize.adaptive_warm_start = Interpolated_Unknowns(previous[segment.tag])
+            elif segment.tag in previous:
+                segment.process.converge = Stored_Solution(segment.process.converge,previous[segment.tag],tolerances,reused)
+        mission.finalize()
+        results = mission.evaluate()
+
+        errors     = Data()
+        new_counts = Data()
+        resolved   = 0
+        for segment in results.segments.values():
+            previous[segment.tag] = segment
+            if segment.tag not in reused:
+                resolved += 1
+            errors[segment.tag] = segment_interpolation_errors(segment)
+            N                   = counts[segment.tag]
+            misses              = [name for name in errors[segment.tag].keys() if errors[segment.tag][name] > tolerances[name]]
+            if len(misses) > 0 and N < max_control_points:
+                new_counts[segment.tag] = min(2*N - 1,max_control_points)
+
+        print('Refinement pass ' + str(refinement) + ': ' + str(sum(counts.values())) + ' control points, ' +
+              str(resolved) + ' segments solved, ' + str(len(new_counts)) + ' segments missing the tolerance')
+
+        # only refine if another pass will solve the refined segments
+        if len(new_counts) == 0 or refinement == max_refinements:
+            break
+        counts.update(new_counts)
+        refined = list(new_counts.keys())
+
+    if noise_setup != None:
+        results = Noise_Replay.replay_noise(results,noise_setup,number_of_workers,noise_metrics = noise_metrics)
+
+    results.control_points       = counts
+    results.interpolation_errors = errors
+    return results
+
+# ----------------------------------------------------------------------
+#   Interpolated Unknowns
+# ----------------------------------------------------------------------
+class Interpolated_Unknowns():
+    """Initialization step that warm-starts the unknowns of a refined segment with
+    the Chebyshev interpolant of its previous solution at the new control points.
+
+    Assumptions:
+    Runs after the state has been expanded to the control points. Unknowns whose
+    first dimension is not the previous number of control points are copied
+
+    Source:
+    None
+    """
+    def __init__(self,stored):
+        self.stored = stored
+
+    def __call__(self,segment):
+        unknowns  = segment.state.unknowns
+        stored    = self.stored.state
+        x_old     = 2*stored.numerics.dimensionless.control_points[:,0] - 1
+        x_new     = 2*segment.state.numerics.dimensionless.control_points[:,0] - 1
+        for name in unknowns.keys():
+            if name not in stored.unknowns:
+                continue
+            values = np.atleast_2d(stored.unknowns[name].T).T
+            if values.shape[0] == len(x_old) and np.shape(unknowns[name])[0] == len(x_new):
+                coefficients   = np.polynomial.chebyshev.chebfit(x_old,values,len(x_old) - 1)
+                unknowns[name] = np.polynomial.chebyshev.chebval(x_new,coefficients).T.reshape(np.shape(unknowns[name]))
+            elif np.shape(stored.unknowns[name]) == np.shape(unknowns[name]):
+                unknowns[name] = np.copy(stored.unknowns[name])
+        return
+
+# ----------------------------------------------------------------------
+#   Stored Solution
+# ----------------------------------------------------------------------
+class Stored_Solution():
+    """Converge step of a segment that is not refined: keeps the previous unknowns
+    of the segment if it starts from the same state and evaluates them once, so the
+    rest of the segment process, e.g. the finalize post-processing, runs on them.
+    Otherwise the segment is converged with its original step, warm-started from
+    the previous unknowns.
+
+    Assumptions:
+    The initials of the segment are set by the mission before it is evaluated. The
+    segment has the number of control points of the stored solution
+
+    Source:
+    None
+    """
+    def __init__(self,converge,stored,tolerances,reused):
+        self.converge   = converge
+        self.stored     = stored
+        self.tolerances = tolerances
+        self.reused     = reused
+
+    def __call__(self,segment):
+        if same_initials(segment.state,self.stored.state,self.tolerances):
+            for name,value in self.stored.state.unknowns.items():
+                segment.state.unknowns[name] = np.copy(value)
+            segment.process.iterate(segment)
+            self.reused.append(segment.tag)
+            return
+        Interpolated_Unknowns(self.stored)(segment)
+        self.converge(segment)
+        return
+
+# ----------------------------------------------------------------------
+#   Same Initials
+# ----------------------------------------------------------------------
+def same_initials(state,stored,tolerances):
+    # compares the end of the preceding segment, which a segment starts from
+    conditions        = state.get('initials',Data()).get('conditions',None)
+    stored_conditions = stored.get('initials',Data()).get('conditions',None)
+    if conditions == None or stored_conditions == None:
+        return conditions == None and stored_conditions == None
+    if 'altitude' in conditions.get('freestream',Data()) and \
+       abs(conditions.freestream.altitude[-1,0] - stored_conditions.freestream.altitude[-1,0]) > tolerances.altitude:
+        return False
+    if 'battery_state_of_charge' in conditions.get('propulsion',Data()) and \
+       abs(conditions.propulsion.battery_state_of_charge[-1,0] - stored_conditions.propulsion.battery_state_of_charge[-1,0]) > tolerances.state_of_charge:
+        return False
+    return True
+
+# ----------------------------------------------------------------------
+#   Segment Interpolation Errors
+# ----------------------------------------------------------------------
+def segment_interpolation_errors(segment):
+    """Estimates the interpolation error of altitude, battery state of charge and
+    rotor RPM over a segment from the magnitude of the two highest Chebyshev
+    coefficients of the interpolant through the control points.
+
+    Assumptions:
+    States missing from the segment conditions are not monitored
+
+    Source:
+    None
+
+    Inputs:
+    segment.conditions.frames.inertial.time
+    segment.conditions.freestream.altitude
+    segment.conditions.propulsion.battery_state_of_charge
+    segment.conditions.propulsion.*rpm
+
+    Outputs:
+    errors   - Data of altitude, state_of_charge, rpm
+
+    Properties Used:
+    N/A
+    """
+    conditions = segment.conditions
+    time       = conditions.frames.inertial.time[:,0]
+    errors     = Data()
+    if len(time) < 3 or time[-1] == time[0]:
+        return errors
+
+    # map time onto the Chebyshev interval
+    x = 2*(time - time[0])/(time[-1] - time[0]) - 1
+
+    states = Data()
+    if 'altitude' in conditions.freestream:
+        states.altitude = [conditions.freestream.altitude[:,0]]
+    if 'battery_state_of_charge' in conditions.propulsion:
+        states.state_of_charge = [conditions.propulsion.battery_state_of_charge[:,0]]
+    rpms = [conditions.propulsion[name][:,0] for name in conditions.propulsion.keys() if name.endswith('rpm')]
+    if len(rpms) > 0:
+        states.rpm = rpms
+
+    for name,values in states.items():
+        errors[name] = max([chebyshev_tail(x,value) for value in values])
+    return errors
+
+# ----------------------------------------------------------------------
+#   Chebyshev Tail
+# ----------------------------------------------------------------------
+def chebyshev_tail(x,values):
+    coefficients = np.polynomial.chebyshev.chebfit(x,values,len(x) - 1)
+    return np.sum(np.abs(coefficients[-2:]))
@@ -0,0 +1,236 @@
+# Adaptive_Stencil.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import multiprocessing
+import pickle
+import time
+import numpy as np
+
+import Noise_Replay
+import Noise_Settings
+import Rotor_Source_Cache
+
+# ----------------------------------------------------------------------
+#   Adaptive Stencil Replay
+# ----------------------------------------------------------------------
+def adaptive_stencil_replay(results,noise_setup,spl_floor = 35.,min_stencil = 1,max_stencil = None,number_of_workers = None,
+                            cache_sources = True,noise_metrics = None):
+    """Replays the noise of a converged trajectory with a ground microphone stencil
+    sized per control point. At every control point the stencil around the
+    aircraft's ground track grows (doubling its half-width) in each direction
+    whose outer ring of microphones is still above the SPL floor, and starts
+    from the trimmed stencil of the previous control point, so it shrinks again
+    where the aircraft is quiet. Levels are returned over the full grid, as a
+    stencil covering every microphone, so stencil sizes may differ between
+    control points: microphones inside the final stencil keep their computed
+    levels, microphones outside it are set to the floor.
+
+    Assumptions:
+    SPL decays away from the loudest microphone of the stencil, so the highest
+    level on the outer ring bounds the level of every microphone left out. The
+    noise analysis uses a stencil (ground_microphone_x/y_stencil or
+    microphone_x/y_stencil) over a structured ground microphone grid
+
+    Source:
+    None
+
+    Inputs:
+    results            - results of mission.evaluate(), or the filename of a results
+                         pickle (with extension)
+    noise_setup        - function(vehicle) returning the noise analysis of a configuration
+    spl_floor          - background level the outer ring must fall below   [dBA]
+    min_stencil        - smallest stencil half-width                       [microphones]
+    max_stencil        - largest stencil half-width, defaults to the grid  [microphones]
+    number_of_workers  - size of the process pool, defaults to the cpu count.
+                         A single worker runs in the calling process
+    cache_sources      - see Noise_Replay.replay_noise
+    noise_metrics      - see Noise_Replay.replay_noise
+
+    Outputs:
+    results            - results with, per segment, conditions.noise:
+                         total_SPL_dBA                         - (ctrl, N_gm_x*N_gm_y [+ N_bm]) full grid  [dBA]
+                         ground_microphone_stencil_locations   - (ctrl, 4) 0, N_gm_x, 0, N_gm_y, the window
+                                                                 of total_SPL_dBA
+                         adaptive_stencil_locations            - (ctrl, 4) x0, x1, y0, y1 grid indices of
+                                                                 the evaluated stencil
+                         stencil_size                          - (ctrl, 2) final x, y half-widths
+                         stencil_truncation_bound              - (ctrl) highest outer ring level    [dBA]
+                         number_of_stencil_evaluations         - (ctrl) noise evaluations used
+
+    Properties Used:
+    N/A
+    """
+    ti = time.time()
+    if isinstance(results,str):
+        with open(results, 'rb') as file:
+            results = pickle.load(file)
+
+    tasks = [(idx,spl_floor,min_stencil,max_stencil) for idx in range(len(results.segments))]
+
+    if number_of_workers == None:
+        number_of_workers = multiprocessing.cpu_count()
+    number_of_workers = max(1,min(number_of_workers,len(tasks)))
+
+    if number_of_workers == 1:
+        Noise_Replay.initialize_worker(results,[noise_setup],cache_sources)
+        blocks = [evaluate_segment_stencil(task) for task in tasks]
+        if cache_sources:
+            Rotor_Source_Cache.disable_source_cache()
+    else:
+        pool   = multiprocessing.Pool(processes = number_of_workers, initializer = Noise_Replay.initialize_worker,
+                                      initargs = (results,[noise_setup],cache_sources))
+        blocks = []
+        try:
+            for block in pool.imap_unordered(evaluate_segment_stencil,tasks):
+                blocks.append(block)
+                print('Completed ' + str(len(blocks)) + ' of ' + str(len(tasks)) + ' segments')
+        finally:
+            pool.close()
+            pool.join()
+
+    Noise_Replay.write_replayed_noise(results,noise_setup,blocks,noise_metrics)
+
+    evaluated = 0
+    mics      = 0
+    for block in blocks:
+        locations  = block[2].adaptive_stencil_locations
+        evaluated += np.sum(block[2].number_of_stencil_evaluations)
+        mics      += np.sum((locations[:,1] - locations[:,0])*(locations[:,3] - locations[:,2]))
+    tf        = time.time()
+    print('Adaptive stencil: ' + str(int(evaluated)) + ' noise evaluations, ' + str(int(mics)) + ' stencil microphones, ' +
+          'time taken: ' + str(round(((tf-ti)/60),3)) + ' mins')
+    return results
+
+# ----------------------------------------------------------------------
+#   Evaluate Segment Stencil
+# ----------------------------------------------------------------------
+def evaluate_segment_stencil(task):
+    """Evaluates the noise of one segment control point by control point, adapting
+    the stencil as described in adaptive_stencil_replay.
+
+    Assumptions:
+    Noise_Replay.initialize_worker has been called in this process
+
+    Source:
+    None
+
+    Inputs:
+    task     - (segment index, spl_floor, min_stencil, max_stencil)
+
+    Outputs:
+    task[0]
+    0        - first control point
+    outputs  - Data of the outputs listed in adaptive_stencil_replay
+    settings - noise settings, holding the microphone locations
+
+    Properties Used:
+    N/A
+    """
+    idx,spl_floor,min_stencil,max_stencil = task
+    worker   = Noise_Replay._worker
+    segment  = list(worker.results.segments.values())[idx]
+    geometry = segment.analyses.aerodynamics.geometry
+    key      = (0,geometry.tag)
+    if key not in worker.noise:
+        noise = worker.noise_setups[0](geometry)
+        noise.finalize()
+        worker.noise[key] = noise
+    noise    = worker.noise[key]
+    settings = noise.settings
+
+    x_resolution,y_resolution = Noise_Settings.settings_names(settings,Noise_Settings.RESOLUTION_SETTINGS)
+    x_stencil,y_stencil       = Noise_Settings.settings_names(settings,Noise_Settings.STENCIL_SETTINGS)
+    N_gm_x   = settings[x_resolution]
+    N_gm_y   = settings[y_resolution]
+    limits   = np.array([(N_gm_x - 1)//2,(N_gm_y - 1)//2])
+    if max_stencil != None:
+        limits = np.minimum(limits,max_stencil)
+
+    N_ctrl_pts = Noise_Replay.number_of_control_points(segment)
+    SPL        = []
+    locations  = np.zeros((N_ctrl_pts,4))
+    sizes      = np.zeros((N_ctrl_pts,2),dtype = int)
+    bounds     = np.zeros(N_ctrl_pts)
+    counts     = np.zeros(N_ctrl_pts,dtype = int)
+    stencil    = np.minimum(np.array([min_stencil,min_stencil]),limits)
+    for j in range(N_ctrl_pts):
+        while True:
+            settings[x_stencil] = int(stencil[0])
+            settings[y_stencil] = int(stencil[1])
+            replay = Noise_Replay.replay_segment(segment,j,j + 1,noise)
+            noise.evaluate_noise(replay)
+            counts[j] += 1
+
+            conditions = replay.state.conditions.noise
+            x0,x1,y0,y1 = [int(index) for index in conditions.ground_microphone_stencil_locations[0]]
+            levels      = np.nan_to_num(conditions.total_SPL_dBA[0])
+            ground      = levels[:(x1 - x0)*(y1 - y0)].reshape(x1 - x0,y1 - y0)
+            building    = levels[(x1 - x0)*(y1 - y0):]
+
+            ring_x = max(np.max(ground[0,:]),np.max(ground[-1,:]))
+            ring_y = max(np.max(ground[:,0]),np.max(ground[:,-1]))
+            grow_x = ring_x > spl_floor and stencil[0] < limits[0] and (x0 > 0 or x1 < N_gm_x)
+            grow_y = ring_y > spl_floor and stencil[1] < limits[1] and (y0 > 0 or y1 < N_gm_y)
+            if not grow_x and not grow_y:
+                break
+            if grow_x:
+                stencil[0] = min(max(2*stencil[0],1),limits[0])
+            if grow_y:
+                stencil[1] = min(max(2*stencil[1],1),limits[1])
+
+        grid                = np.ones((N_gm_x,N_gm_y))*spl_floor
+        grid[x0:x1,y0:y1]   = ground
+        SPL.append(np.concatenate([grid.flatten(),building]))
+        locations[j]        = [x0,x1,y0,y1]
+        sizes[j]            = stencil
+        bounds[j]           = max(ring_x,ring_y)
+
+        # start the next control point from the stencil that holds every microphone above the floor
+        stencil = np.maximum(np.minimum(trimmed_stencil(ground,spl_floor),limits),min(min_stencil,np.min(limits)))
+
+    outputs                                     = Data()
+    outputs.total_SPL_dBA                       = np.array(SPL)
+    outputs.ground_microphone_stencil_locations = np.tile([0,N_gm_x,0,N_gm_y],(N_ctrl_pts,1))
+    outputs.adaptive_stencil_locations          = locations
+    outputs.stencil_size                        = sizes
+    outputs.stencil_truncation_bound            = bounds
+    outputs.number_of_stencil_evaluations       = counts
+    return idx, 0, outputs, settings
+
+# ----------------------------------------------------------------------
+#   Trimmed Stencil
+# ----------------------------------------------------------------------
+def trimmed_stencil(ground,spl_floor):
+    """Smallest stencil half-widths around the loudest microphone that contain every
+    microphone above the floor.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    ground     - (n_x, n_y) SPL over the evaluated stencil    [dBA]
+    spl_floor  - background level                            [dBA]
+
+    Outputs:
+    stencil    - (2) x, y half-widths                         [microphones]
+
+    Properties Used:
+    N/A
+    """
+    peak_x,peak_y = np.unravel_index(np.argmax(ground),ground.shape)
+    loud_x        = np.where(np.max(ground,axis = 1) > spl_floor)[0]
+    loud_y        = np.where(np.max(ground,axis = 0) > spl_floor)[0]
+    stencil       = np.zeros(2,dtype = int)
+    if len(loud_x) > 0:
+        stencil[0] = np.max(np.abs(loud_x - peak_x)) + 1
+    if len(loud_y) > 0:
+        stencil[1] = np.max(np.abs(loud_y - peak_y)) + 1
+    return stencil
@@ -0,0 +1,234 @@
+# BEM_Rotor_IO.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_geometry    import import_airfoil_geometry
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_properties import compute_airfoil_properties
+import numpy as np
+
+# airfoil geometry and polars already processed in this process, keyed by their files
+_airfoil_cache = {}
+
+# ----------------------------------------------------------------------
+#   Read BEM Rotor
+# ----------------------------------------------------------------------
+def read_bem_rotor(filename,rotor,airfoil = None):
+    """Builds a rotor directly from an OpenVSP blade element (.bem) file instead of
+    running a rotor design.
+
+    Assumptions:
+    The first tabulated station is the hub. Sweep is the angle between the mid-chord
+    line and the radial direction, as written by write_bem_rotor
+
+    Source:
+    OpenVSP BEM file format
+
+    Inputs:
+    filename   - path to the .bem file
+    rotor      - empty Propeller/Lift_Rotor/Prop_Rotor to populate
+    airfoil    - airfoil with coordinate_file and polar_files applied at every station
+
+    Outputs:
+    rotor.number_of_blades, tip_radius, hub_radius                     [-], [m], [m]
+    rotor.radius_distribution, chord_distribution                      [m]
+    rotor.twist_distribution                                           [rad]
+    rotor.thickness_to_chord, max_thickness_distribution               [-], [m]
+    rotor.mid_chord_alignment                                          [m]
+    rotor.design_Cl, origin, bem_normal
+
+    Properties Used:
+    N/A
+    """
+    with open(filename,'r') as file:
+        lines = file.readlines()
+
+    header = Data()
+    idx    = 1
+    while not lines[idx].startswith('Radius/R'):
+        name, value  = lines[idx].split(':',1)
+        header[name.strip()] = value.strip()
+        idx += 1
+
+    num_sec = int(header['Num_Sections'])
+    table   = np.array([[float(v) for v in line.split(',')] for line in lines[idx+1:idx+1+num_sec]])
+
+    R       = float(header['Diameter'])/2
+    r_R     = table[:,0]
+    c_R     = table[:,1]
+    twist   = table[:,2]
+    sweep   = table[:,5]
+    t_c     = table[:,6]
+    CLi     = table[:,7]
+
+    rotor.number_of_blades           = int(header['Num_Blade'])
+    rotor.tip_radius                 = R
+    rotor.hub_radius                 = r_R[0]*R
+    rotor.radius_distribution        = r_R*R
+    rotor.chord_distribution         = c_R*R
+    rotor.twist_distribution         = twist*Units.degrees
+    rotor.thickness_to_chord         = t_c
+    rotor.max_thickness_distribution = t_c*rotor.chord_distribution
+    rotor.mid_chord_alignment        = np.tan(sweep)*rotor.radius_distribution
+    rotor.design_Cl                  = CLi[0]
+    rotor.origin                     = [[float(v) for v in header['Center'].split(',')]]
+    rotor.bem_normal                 = [float(v) for v in header['Normal'].split(',')]
+
+    if airfoil != None:
+        attach_cached_airfoil(rotor,airfoil)
+
+    return rotor
+
+# ----------------------------------------------------------------------
+#   Attach Cached Airfoil
+# ----------------------------------------------------------------------
+def attach_cached_airfoil(rotor,airfoil):
+    """Appends an airfoil to every station of the rotor, reusing airfoil geometry and
+    polars already processed by this process for the same files.
+
+    Assumptions:
+    A single airfoil is used along the whole blade
+
+    Source:
+    None
+
+    Inputs:
+    rotor     - rotor with radius_distribution
+    airfoil   - airfoil with coordinate_file and polar_files
+
+    Outputs:
+    rotor.Airfoils, rotor.airfoil_polar_stations
+
+    Properties Used:
+    N/A
+    """
+    key = (airfoil.coordinate_file,tuple(airfoil.polar_files))
+    if key not in _airfoil_cache:
+        geometry            = import_airfoil_geometry(airfoil.coordinate_file,airfoil.number_of_points)
+        polars              = compute_airfoil_properties(geometry,airfoil_polar_files = airfoil.polar_files)
+        _airfoil_cache[key] = (geometry,polars)
+
+    airfoil.geometry, airfoil.polars = _airfoil_cache[key]
+    rotor.append_airfoil(airfoil)
+    rotor.airfoil_polar_stations     = list(np.zeros(len(rotor.radius_distribution)).astype(int))
+    return rotor
+
+# ----------------------------------------------------------------------
+#   Set Design Point
+# ----------------------------------------------------------------------
+def set_design_point(rotor,design_altitude,freestream_velocity,angular_velocity,lift_rotor = False):
+    """Evaluates a rotor read from a .bem file once at its design condition to
+    recover the design quantities a rotor design would otherwise provide, e.g.
+    for size_optimal_motor.
+
+    Assumptions:
+    Axial inflow. Lift rotors climb vertically, propellers fly forward
+
+    Source:
+    None
+
+    Inputs:
+    rotor                - rotor from read_bem_rotor
+    design_altitude      - design altitude                  [m]
+    freestream_velocity  - axial inflow velocity            [m/s]
+    angular_velocity     - design angular velocity          [rad/s]
+    lift_rotor           - flag for vertical inflow
+
+    Outputs:
+    rotor.angular_velocity, design_torque, design_power, design_power_coefficient
+
+    Properties Used:
+    N/A
+    """
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(design_altitude)
+
+    conditions                                   = Aerodynamics()
+    conditions.freestream.density                = atmo_data.density
+    conditions.freestream.dynamic_viscosity      = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound         = atmo_data.speed_of_sound
+    conditions.freestream.temperature            = atmo_data.temperature
+    if lift_rotor:
+        conditions.frames.inertial.velocity_vector = np.array([[0.,0.,-freestream_velocity]])
+    else:
+        conditions.frames.inertial.velocity_vector = np.array([[freestream_velocity,0.,0.]])
+    conditions.propulsion.throttle               = np.ones((1,1))
+    conditions.frames.body.transform_to_inertial = np.array([[[1., 0., 0.],[0., 1., 0.],[0., 0., 1.]]])
+
+    rotor.inputs.omega                           = np.ones((1,1))*angular_velocity
+    thrust, torque, power, Cp, outputs, etap     = rotor.spin(conditions)
+
+    rotor.angular_velocity         = angular_velocity
+    rotor.design_torque            = torque[0][0]
+    rotor.design_power             = power[0][0]
+    rotor.design_power_coefficient = Cp[0][0]
+    return rotor
+
+# ----------------------------------------------------------------------
+#   Write BEM Rotor
+# ----------------------------------------------------------------------
+def write_bem_rotor(filename,rotor,normal = None):
+    """Writes a designed rotor to an OpenVSP blade element (.bem) file so that it can
+    be reloaded with read_bem_rotor.
+
+    Assumptions:
+    Airfoil section coordinates are written for every station when the first
+    airfoil has processed geometry
+
+    Source:
+    OpenVSP BEM file format
+
+    Inputs:
+    filename   - path to the .bem file
+    rotor      - designed rotor
+    normal     - thrust direction, defaults to rotor.bem_normal or [-1,0,0]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    if normal == None:
+        normal = rotor.get('bem_normal',[-1.,0.,0.])
+
+    R      = rotor.tip_radius
+    r      = np.array(rotor.radius_distribution)
+    N      = len(r)
+    r_R    = r/R
+    c_R    = np.array(rotor.chord_distribution)/R
+    beta   = np.array(rotor.twist_distribution)/Units.degrees
+    sweep  = np.arctan(np.array(rotor.mid_chord_alignment)/r)
+    t_c    = np.atleast_1d(rotor.thickness_to_chord)*np.ones(N)
+    CLi    = np.ones(N)*rotor.design_Cl
+    zeros  = np.zeros(N)
+    center = np.array(rotor.origin).flatten()
+
+    with open(filename,'w') as file:
+        file.write('...' + rotor.tag + '...\n')
+        file.write('Num_Sections: ' + str(N) + '\n')
+        file.write('Num_Blade: ' + str(int(rotor.number_of_blades)) + '\n')
+        file.write('Diameter: ' + str(2*R) + '\n')
+        file.write('Beta 3/4 (deg): ' + str(np.interp(0.75,r_R,beta)) + '\n')
+        file.write('Feather (deg): 0.00000000\n')
+        file.write('Pre_Cone (deg): 0.00000000\n')
+        file.write('Center: ' + ', '.join([str(v) for v in center]) + '\n')
+        file.write('Normal: ' + ', '.join([str(v) for v in normal]) + '\n')
+        file.write('Radius/R, Chord/R, Twist (deg), Rake/R, Skew/R, Sweep, t/c, CLi, Axial, Tangential\n')
+        for row in np.vstack((r_R,c_R,beta,zeros,zeros,sweep,t_c,CLi,zeros,zeros)).T:
+            file.write(', '.join(['%.7f' % v for v in row]) + '\n')
+
+        airfoils = list(rotor.get('Airfoils',Data()).values())
+        if len(airfoils) > 0 and airfoils[0].get('geometry',None) != None:
+            x_coords = np.array(airfoils[0].geometry.x_coordinates).flatten()
+            y_coords = np.array(airfoils[0].geometry.y_coordinates).flatten()
+            for i in range(N):
+                file.write('\nSection ' + str(i) + ' X, Y\n')
+                for x,y in zip(x_coords,y_coords):
+                    file.write('%.7f, %.7f\n' % (x,y))
+    return
@@ -0,0 +1,335 @@
+# Batch_Runner.py
+#
+# Created: Oct 2026
+#
+# Runs mission simulations described by JSON or YAML run specs on a local
+# process pool:
+#
+#     python Batch_Runner.py Batch_Specs/Example_Runs.json --workers 8
+#
+# A spec file holds one run spec or a list of them. Entries not given take the
+# values in DEFAULT_SPEC. Distances are in nautical miles, relative paths are
+# relative to the spec file.
+#
+#     vehicle            Stopped_Rotor, Tiltwing, Multirotor or Stopped_Rotor_V2
+#     mission            full_mission, approach_departure or hover, or for
+#                        Stopped_Rotor_V2 baseline, high_altitude, medium_altitude
+#                        or low_altitude
+#     simulated_days, flights_per_day, control_points, recharge_battery,
+#     reserve_segment, aircraft_range, run_noise_model, profile_mission,
+#     parallel_noise     split the microphones of the rotor noise over a process
+#                        pool, needs --workers 1 as the noise of a batch worker
+#                        is evaluated serially
+#     noise_chunk_size   microphones the rotor noise is evaluated for at once to
+#                        bound its peak memory, all if null
+#     spectrum_tables    bin third octave spectra and A-weight them with cached
+#                        tables, see Spectrum_Tables
+#     terrain_store      Stopped_Rotor_V2 only: read the topography file from a
+#                        converted store, see Terrain_Store
+#     terrain_interpolation  Stopped_Rotor_V2 only: interpolate the topography with
+#                        the lattice grid interpolation instead of scipy griddata,
+#                        see Terrain_Interpolation
+#     noise_grid         N_gm_x, N_gm_y, min_x, max_x, min_y, max_y
+#     topography         Stopped_Rotor_V2 only: file, departure_coordinates,
+#                        destination_coordinates, number_of_latitudinal_microphones,
+#                        number_of_longitudinal_microphones,
+#                        latitudinal_microphone_stencil_size,
+#                        longitudinal_microphone_stencil_size
+#     output             results filename without extension
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+import SUAVE
+from SUAVE.Core import Units, Data
+import multiprocessing
+import argparse
+import importlib
+import pickle
+import json
+import time
+import sys
+import os
+
+try:
+    import yaml
+except ImportError:
+    # YAML specs are optional, JSON specs need no extra package
+    yaml = None
+
+models_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)),'..')
+
+DEFAULT_SPEC = {'vehicle'          : 'Stopped_Rotor',
+                'mission'          : 'full_mission',
+                'simulated_days'   : 1,
+                'flights_per_day'  : 1,
+                'control_points'   : 10,
+                'recharge_battery' : False,
+                'reserve_segment'  : False,
+                'aircraft_range'   : 55.,
+                'run_noise_model'  : False,
+                'profile_mission'  : False,
+                'parallel_noise'   : False,
+                'noise_chunk_size' : None,
+                'spectrum_tables'  : False,
+                'terrain_store'    : False,
+                'terrain_interpolation' : False,
+                'noise_grid'       : {'N_gm_x':10,'N_gm_y':5,'min_x':0.,'max_x':55.,'min_y':1E-3,'max_y':0.5},
+                'topography'       : None,
+                'output'           : None}
+
+# mission functions of the models sharing the Stopped_Rotor analyses/missions interface
+STANDARD_MISSIONS = {'full_mission'       : 'full_mission_setup',
+                     'approach_departure' : 'approach_departure_mission_setup',
+                     'hover'              : 'hover_mission_setup'}
+
+# mission functions of Stopped_Rotor_V2, flown over preprocessed topography
+TOPOGRAPHY_MISSIONS = {'baseline'        : 'full_mission_setup_baseline',
+                       'high_altitude'   : 'high_altitude_constant_elevation_cruise',
+                       'medium_altitude' : 'medium_altitude_constant_elevation_cruise',
+                       'low_altitude'    : 'low_altitude_constant_elevation_cruise'}
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description = 'Run mission simulations from JSON/YAML run specs')
+    parser.add_argument('specs', nargs = '+', help = 'spec files, each holding one run spec or a list of them')
+    parser.add_argument('--workers', type = int, default = None, help = 'number of worker processes, defaults to all cores')
+    parser.add_argument('--overwrite', action = 'store_true', help = 'rerun specs whose output already exists')
+    args = parser.parse_args()
+
+    specs = []
+    for filename in args.specs:
+        specs.extend(load_specs(filename))
+    run_batch(specs,args.workers,args.overwrite)
+    return
+
+# ----------------------------------------------------------------------
+#   Load Specs
+# ----------------------------------------------------------------------
+def load_specs(filename):
+    """Reads a JSON or YAML spec file and completes every spec with DEFAULT_SPEC.
+
+    Assumptions:
+    Files ending in .yaml or .yml are YAML, everything else JSON
+
+    Source:
+    None
+
+    Inputs:
+    filename  - spec file
+
+    Outputs:
+    specs     - list of complete run specs (dict), paths made absolute
+
+    Properties Used:
+    N/A
+    """
+    with open(filename,'r') as file:
+        if filename.endswith('.yaml') or filename.endswith('.yml'):
+            if yaml == None:
+                raise ImportError('PyYAML is required to read ' + filename)
+            entries = yaml.safe_load(file)
+        else:
+            entries = json.load(file)
+    if isinstance(entries,dict):
+        entries = [entries]
+
+    spec_directory = os.path.dirname(os.path.abspath(filename))
+    specs          = []
+    for entry in entries:
+        spec = dict(DEFAULT_SPEC)
+        spec.update(entry)
+        grid = dict(DEFAULT_SPEC['noise_grid'])
+        grid.update(entry.get('noise_grid',{}))
+        spec['noise_grid'] = grid
+
+        if spec['mission'] not in STANDARD_MISSIONS and spec['mission'] not in TOPOGRAPHY_MISSIONS:
+            raise ValueError('Unknown mission ' + str(spec['mission']) + ' in ' + filename)
+        if spec['mission'] in TOPOGRAPHY_MISSIONS and spec['topography'] == None:
+            raise ValueError('Mission ' + spec['mission'] + ' in ' + filename + ' needs a topography entry')
+
+        if spec['output'] == None:
+            spec['output'] = spec['vehicle'] + '_' + spec['mission'] + '_Nx' + str(grid['N_gm_x']) + '_Ny' + str(grid['N_gm_y'])
+        spec['output'] = os.path.join(spec_directory,spec['output'])
+        if spec['topography'] != None:
+            spec['topography'] = dict(spec['topography'])
+            spec['topography']['file'] = os.path.join(spec_directory,spec['topography']['file'])
+        specs.append(spec)
+    return specs
+
+# ----------------------------------------------------------------------
+#   Run Batch
+# ----------------------------------------------------------------------
+def run_batch(specs,number_of_workers = None,overwrite = False):
+    """Runs every spec whose output does not exist yet on a process pool and
+    reports progress as runs finish.
+
+    Assumptions:
+    Each run gets a fresh worker process so runs do not share SUAVE state. With a
+    single worker the runs are evaluated one after the other in this process, so
+    that parallel_noise can start its own process pool
+
+    Source:
+    None
+
+    Inputs:
+    specs              - run specs from load_specs
+    number_of_workers  - size of the process pool, defaults to the cpu count
+    overwrite          - rerun specs whose output already exists
+
+    Outputs:
+    outputs            - output filenames of the runs that completed
+
+    Properties Used:
+    N/A
+    """
+    pending = [spec for spec in specs if overwrite or not os.path.isfile(spec['output'] + '.pkl')]
+    print('Skipping ' + str(len(specs) - len(pending)) + ' of ' + str(len(specs)) + ' runs with existing outputs')
+    if len(pending) == 0:
+        return []
+
+    if number_of_workers == None:
+        number_of_workers = multiprocessing.cpu_count()
+    number_of_workers = max(1,min(number_of_workers,len(pending)))
+
+    ti      = time.time()
+    outputs = []
+    failed  = 0
+    pool    = None
+    if number_of_workers == 1:
+        runs = map(run_spec_safely,pending)
+    else:
+        pool = multiprocessing.Pool(processes = number_of_workers, maxtasksperchild = 1)
+        runs = pool.imap_unordered(run_spec_safely,pending)
+    try:
+        for output,error,run_time in runs:
+            if error == None:
+                outputs.append(output)
+                status = 'done in ' + str(round(run_time/60,3)) + ' mins'
+            else:
+                failed += 1
+                status = 'FAILED: ' + error
+            print('[' + str(len(outputs) + failed) + '/' + str(len(pending)) + '] ' + os.path.basename(output) + ' ' + status)
+    finally:
+        if pool != None:
+            pool.close()
+            pool.join()
+
+    print('Batch time taken: ' + str(round((time.time()-ti)/60,3)) + ' mins, ' + str(failed) + ' failed')
+    return outputs
+
+# ----------------------------------------------------------------------
+#   Run Spec Safely
+# ----------------------------------------------------------------------
+def run_spec_safely(spec):
+    ti = time.time()
+    try:
+        run_spec(spec)
+        error = None
+    except Exception as exception:
+        error = type(exception).__name__ + ': ' + str(exception)
+    return spec['output'], error, time.time() - ti
+
+# ----------------------------------------------------------------------
+#   Run Spec
+# ----------------------------------------------------------------------
+def run_spec(spec):
+    """Builds the vehicle, analyses and mission of one spec, evaluates the mission
+    and pickles the results to spec['output'].pkl.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    spec     - complete run spec
+
+    Outputs:
+    results  - results of mission.evaluate()
+
+    Properties Used:
+    N/A
+    """
+    name     = spec['vehicle']
+    sys.path.append(os.path.join(models_directory,name))
+    sys.path.append(os.path.join(models_directory,'Mission_Tools'))
+    Vehicle  = importlib.import_module(name + '_Vehicle')
+    Analyses = importlib.import_module(name + '_Analyses')
+    Missions = importlib.import_module(name + '_Missions')
+
+    vehicle  = Vehicle.vehicle_setup()
+    configs  = Vehicle.configs_setup(vehicle)
+
+    if spec['mission'] in TOPOGRAPHY_MISSIONS:
+        from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points import preprocess_topography_and_route_data
+        import Terrain_Store
+        import Terrain_Interpolation
+        if spec['terrain_store']:
+            Terrain_Store.enable_terrain_store()
+        if spec['terrain_interpolation']:
+            Terrain_Interpolation.enable_terrain_interpolation()
+        topography       = spec['topography']
+        topography_data  = preprocess_topography_and_route_data(topography_file                      = topography['file'],
+                                                                departure_coordinates                = topography['departure_coordinates'],
+                                                                destination_coordinates              = topography['destination_coordinates'],
+                                                                number_of_latitudinal_microphones    = topography['number_of_latitudinal_microphones'],
+                                                                number_of_longitudinal_microphones   = topography['number_of_longitudinal_microphones'],
+                                                                latitudinal_microphone_stencil_size  = topography['latitudinal_microphone_stencil_size'],
+                                                                longitudinal_microphone_stencil_size = topography['longitudinal_microphone_stencil_size'])
+        Terrain_Store.disable_terrain_store()
+        Terrain_Interpolation.disable_terrain_interpolation()
+        configs_analyses = Analyses.topography_analyses_setup(configs,topography_data,spec['run_noise_model'])
+        mission_setup    = getattr(Missions,TOPOGRAPHY_MISSIONS[spec['mission']])
+        base_mission     = mission_setup(configs_analyses,vehicle,spec['simulated_days'],spec['flights_per_day'],
+                                         spec['control_points'],spec['recharge_battery'],topography_data)
+    else:
+        grid             = spec['noise_grid']
+        aircraft_range   = spec['aircraft_range']*Units.nmi
+        configs_analyses = Analyses.analyses_setup(configs,grid['N_gm_x'],grid['N_gm_y'],grid['min_y']*Units.nmi,grid['max_y']*Units.nmi,
+                                                   grid['min_x']*Units.nmi,grid['max_x']*Units.nmi,aircraft_range,spec['run_noise_model'])
+        mission_setup    = getattr(Missions,STANDARD_MISSIONS[spec['mission']])
+        base_mission     = mission_setup(configs_analyses,vehicle,spec['simulated_days'],spec['flights_per_day'],aircraft_range,
+                                         spec['reserve_segment'],spec['control_points'],spec['recharge_battery'])
+
+    analyses          = SUAVE.Analyses.Analysis.Container()
+    analyses.configs  = configs_analyses
+    analyses.missions = Missions.missions_setup(base_mission)
+
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions.base
+    if spec['profile_mission']:
+        import Mission_Profiler
+        Mission_Profiler.profile_mission(mission)
+    routed_noise = spec['parallel_noise'] or spec['noise_chunk_size'] != None
+    if routed_noise:
+        import Parallel_Noise
+        Parallel_Noise.enable_parallel_noise(configs_analyses,None if spec['parallel_noise'] else 1,spec['noise_chunk_size'])
+    if spec['spectrum_tables']:
+        import Spectrum_Tables
+        Spectrum_Tables.enable_spectrum_tables()
+
+    try:
+        results = mission.evaluate()
+    finally:
+        if routed_noise:
+            Parallel_Noise.disable_parallel_noise()
+        if spec['spectrum_tables']:
+            Spectrum_Tables.disable_spectrum_tables()
+
+    output_directory = os.path.dirname(spec['output'])
+    if not os.path.isdir(output_directory):
+        os.makedirs(output_directory,exist_ok = True)
+    with open(spec['output'] + '.pkl', 'wb') as file:
+        pickle.dump(results, file)
+    if spec['profile_mission']:
+        Mission_Profiler.write_profile_report(results,spec['output'])
+    return results
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,463 @@
+# Building_Visibility.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity import propeller_mid_fidelity
+import sys
+import numpy as np
+from scipy.spatial import cKDTree
+
+# prefix of the modules whose propeller noise function is replaced by the shadowed one
+NOISE_MODULES = 'SUAVE'
+
+# building hierarchies and microphones of this process, by building set
+_hierarchies = {}
+
+# ----------------------------------------------------------------------
+#   Building Boxes
+# ----------------------------------------------------------------------
+def building_boxes(building_locations,building_dimensions,microphones = None):
+    """Axis aligned boxes of the buildings of an urban canyon microphone setup.
+    Building locations may refer to the center of the footprint or to its
+    lower corner; when the building microphones are given, the convention that
+    puts them on the building surfaces is used, otherwise the center.
+
+    Assumptions:
+    Buildings stand on the ground plane of their location, dimensions are
+    length (x), width (y) and height (z)
+
+    Source:
+    None
+
+    Inputs:
+    building_locations   - (N_b, 3) x, y, z of every building          [m]
+    building_dimensions  - (N_b, 3) length, width, height              [m]
+    microphones          - (N_bm, 3) building microphone locations      [m]
+
+    Outputs:
+    lower, upper         - (N_b, 3) box corners                         [m]
+
+    Properties Used:
+    N/A
+    """
+    locations  = np.atleast_2d(np.array(building_locations,dtype = float))
+    dimensions = np.atleast_2d(np.array(building_dimensions,dtype = float))
+    half       = 0.5*dimensions
+    half[:,2]  = 0.
+    height     = np.zeros_like(dimensions)
+    height[:,2] = dimensions[:,2]
+
+    centered   = (locations - half,locations + half + height)
+    cornered   = (locations,locations + dimensions)
+    if microphones is None:
+        return centered
+    microphones = np.atleast_2d(microphones)
+    if np.max(surface_distance(microphones,*cornered)) < np.max(surface_distance(microphones,*centered)):
+        return cornered
+    return centered
+
+# ----------------------------------------------------------------------
+#   Surface Distance
+# ----------------------------------------------------------------------
+def surface_distance(points,lower,upper):
+    inside   = np.maximum(np.minimum(points[:,None,:] - lower[None],upper[None] - points[:,None,:]),0)
+    outside  = np.maximum(np.maximum(lower[None] - points[:,None,:],points[:,None,:] - upper[None]),0)
+    interior = np.all(inside > 0,axis = 2)
+    distance = np.where(interior,np.min(inside,axis = 2),np.linalg.norm(outside,axis = 2))
+    return np.min(distance,axis = 1)
+
+# ----------------------------------------------------------------------
+#   Build BVH
+# ----------------------------------------------------------------------
+def build_bvh(lower,upper,leaf_size = 2):
+    """Bounding volume hierarchy over the building boxes, split at the median
+    centroid along the longest axis of the node.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    lower, upper   - (N_b, 3) building box corners                     [m]
+    leaf_size      - maximum number of buildings per leaf
+
+    Outputs:
+    bvh.lower, bvh.upper   - (N_nodes, 3) node bounds                  [m]
+    bvh.left, bvh.right    - (N_nodes) children, -1 for leaves
+    bvh.start, bvh.count   - (N_nodes) range of a leaf in bvh.index
+    bvh.index              - building indices ordered by leaf
+    bvh.building_lower, bvh.building_upper
+
+    Properties Used:
+    N/A
+    """
+    index     = np.arange(len(lower))
+    centroids = 0.5*(lower + upper)
+    nodes     = []
+    stack     = [(0,len(index),-1,0)]
+    while len(stack) > 0:
+        start,end,parent,side = stack.pop()
+        members = index[start:end]
+        node    = [np.min(lower[members],axis = 0),np.max(upper[members],axis = 0),-1,-1,start,end - start]
+        number  = len(nodes)
+        nodes.append(node)
+        if parent >= 0:
+            nodes[parent][2 + side] = number
+        if end - start > leaf_size:
+            extent = np.ptp(centroids[members],axis = 0)
+            axis   = np.argmax(extent)
+            index[start:end] = members[np.argsort(centroids[members,axis],kind = 'stable')]
+            middle = (start + end)//2
+            stack.append((middle,end,number,1))
+            stack.append((start,middle,number,0))
+
+    bvh                = Data()
+    bvh.lower          = np.array([node[0] for node in nodes])
+    bvh.upper          = np.array([node[1] for node in nodes])
+    bvh.left           = np.array([node[2] for node in nodes])
+    bvh.right          = np.array([node[3] for node in nodes])
+    bvh.start          = np.array([node[4] for node in nodes])
+    bvh.count          = np.array([node[5] for node in nodes])
+    bvh.index          = index
+    bvh.building_lower = lower
+    bvh.building_upper = upper
+    return bvh
+
+# ----------------------------------------------------------------------
+#   First Blockers
+# ----------------------------------------------------------------------
+def first_blockers(bvh,origins,ends,tolerance = 1E-3):
+    """Batched line of sight test: for every segment from an origin to an end
+    point, the building hit first, traversing the hierarchy with all segments at
+    once and dropping segments at every node whose bounds they miss.
+
+    Assumptions:
+    Points on a building surface do not block themselves: hits within
+    tolerance of either end are ignored
+
+    Source:
+    None
+
+    Inputs:
+    bvh        - see build_bvh
+    origins    - (N, 3) segment start, e.g. microphones               [m]
+    ends       - (N, 3) segment end, e.g. aircraft positions          [m]
+    tolerance  - distance ignored at both ends                        [m]
+
+    Outputs:
+    blocker    - (N) index of the first building hit, -1 when visible
+    t_near     - (N) entry along the segment of the blocker, 0 to 1
+    t_far      - (N) exit along the segment of the blocker, 0 to 1
+
+    Properties Used:
+    N/A
+    """
+    direction = ends - origins
+    length    = np.maximum(np.linalg.norm(direction,axis = 1),tolerance)
+    direction = np.where(np.abs(direction) < 1E-12,1E-12,direction)
+    inverse   = 1./direction
+    t_min     = tolerance/length
+    t_max     = 1. - t_min
+
+    N         = len(origins)
+    blocker   = -np.ones(N,dtype = int)
+    t_near    = np.ones(N)*np.inf
+    t_far     = np.ones(N)*np.inf
+    stack     = [(0,np.arange(N))]
+    while len(stack) > 0:
+        node,rays = stack.pop()
+        near,far  = slab_intersection(bvh.lower[node],bvh.upper[node],origins[rays],inverse[rays])
+        rays      = rays[(far >= np.maximum(near,t_min[rays])) & (near <= t_max[rays]) & (near < t_near[rays])]
+        if len(rays) == 0:
+            continue
+        if bvh.left[node] >= 0:
+            stack.append((bvh.right[node],rays))
+            stack.append((bvh.left[node],rays))
+            continue
+        for building in bvh.index[bvh.start[node]:bvh.start[node] + bvh.count[node]]:
+            near,far = slab_intersection(bvh.building_lower[building],bvh.building_upper[building],origins[rays],inverse[rays])
+            near     = np.maximum(near,0.)
+            hit      = (far > np.maximum(near,t_min[rays])) & (near < t_max[rays]) & (near < t_near[rays])
+            blocker[rays[hit]] = building
+            t_near[rays[hit]]  = near[hit]
+            t_far[rays[hit]]   = np.minimum(far[hit],1.)
+    return blocker, t_near, t_far
+
+# ----------------------------------------------------------------------
+#   Slab Intersection
+# ----------------------------------------------------------------------
+def slab_intersection(lower,upper,origins,inverse):
+    t_1  = (lower[None,:] - origins)*inverse
+    t_2  = (upper[None,:] - origins)*inverse
+    near = np.max(np.minimum(t_1,t_2),axis = 1)
+    far  = np.min(np.maximum(t_1,t_2),axis = 1)
+    return near, far
+
+# ----------------------------------------------------------------------
+#   Building Visibility
+# ----------------------------------------------------------------------
+def building_visibility(bvh,microphones,positions,rays_per_batch = 200000):
+    """Line of sight from every microphone to the aircraft at every control
+    point, in batches of control points.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    bvh             - see build_bvh
+    microphones     - (N_mic, 3) microphone locations, z up              [m]
+    positions       - (N_ctrl, 3) aircraft locations, z up               [m]
+    rays_per_batch  - microphone-aircraft pairs tested at once
+
+    Outputs:
+    blocker         - (N_ctrl, N_mic) first building hit, -1 when visible
+    t_near, t_far   - (N_ctrl, N_mic) entry and exit along the line of sight
+
+    Properties Used:
+    N/A
+    """
+    N_ctrl,N_mic = len(positions),len(microphones)
+    blocker      = -np.ones((N_ctrl,N_mic),dtype = int)
+    t_near       = np.ones((N_ctrl,N_mic))*np.inf
+    t_far        = np.ones((N_ctrl,N_mic))*np.inf
+    batch        = max(1,rays_per_batch//max(N_mic,1))
+    for start in range(0,N_ctrl,batch):
+        end     = min(start + batch,N_ctrl)
+        origins = np.tile(microphones,(end - start,1))
+        ends    = np.repeat(positions[start:end],N_mic,axis = 0)
+        hits    = first_blockers(bvh,origins,ends)
+        blocker[start:end] = hits[0].reshape(end - start,N_mic)
+        t_near[start:end]  = hits[1].reshape(end - start,N_mic)
+        t_far[start:end]   = hits[2].reshape(end - start,N_mic)
+    return blocker, t_near, t_far
+
+# ----------------------------------------------------------------------
+#   Diffraction Insertion Loss
+# ----------------------------------------------------------------------
+def diffraction_insertion_loss(bvh,microphones,positions,blocker,t_near,t_far,frequency = 1000.,speed_of_sound = 343.,
+                               maximum_loss = 20.):
+    """Cheap estimate of the level reduction of shadowed microphones from
+    single diffraction over the roof of the blocking building.
+
+    Assumptions:
+    The diffracted path runs over the roof edge above the middle of the blocked
+    part of the line of sight. One representative frequency
+
+    Source:
+    ISO 9613-2, "Acoustics - Attenuation of sound during propagation outdoors -
+    Part 2", 1996, barrier attenuation D_z = 10 log10(3 + 20 z/lambda) with the
+    path difference z
+
+    Inputs:
+    bvh, microphones, positions      - see building_visibility
+    blocker, t_near, t_far           - outputs of building_visibility
+    frequency                        - representative frequency          [Hz]
+    speed_of_sound                                                       [m/s]
+    maximum_loss                     - upper limit of the reduction      [dB]
+
+    Outputs:
+    loss                             - (N_ctrl, N_mic), 0 when visible   [dB]
+
+    Properties Used:
+    N/A
+    """
+    loss      = np.zeros(blocker.shape)
+    ctrl,mic  = np.where(blocker >= 0)
+    if len(ctrl) == 0:
+        return loss
+    receiver  = microphones[mic]
+    source    = positions[ctrl]
+    t_mid     = 0.5*(t_near[ctrl,mic] + t_far[ctrl,mic])
+    edge      = receiver + t_mid[:,None]*(source - receiver)
+    edge[:,2] = np.maximum(edge[:,2],bvh.building_upper[blocker[ctrl,mic],2])
+
+    delta     = (np.linalg.norm(source - edge,axis = 1) + np.linalg.norm(edge - receiver,axis = 1) -
+                 np.linalg.norm(source - receiver,axis = 1))
+    loss[ctrl,mic] = np.minimum(10*np.log10(3 + 20*delta*frequency/speed_of_sound),maximum_loss)
+    return loss
+
+# ----------------------------------------------------------------------
+#   Shadowed Propeller Noise
+# ----------------------------------------------------------------------
+def shadowed_propeller_noise(propellers,acoustic_outputs,segment,settings,frequency = 1000.,maximum_loss = 20.):
+    """Drop-in replacement of propeller_mid_fidelity for urban canyon microphone
+    setups. The line of sight from every building microphone to the aircraft is
+    tested against the buildings at every control point. The mid-fidelity model is
+    only evaluated at the ground microphones and at the building microphones that
+    see the aircraft at one control point at least. Microphones shadowed at every
+    control point take the level of the evaluated microphone of the nearest
+    direction, corrected for spherical spreading, so their sources are never
+    evaluated. Shadowed microphone-control point pairs are reduced by the
+    diffraction estimate. The hierarchy is built once per building set.
+
+    Assumptions:
+    Building microphones are the last microphones of the noise conditions, in the
+    order of settings.urban_canyon_microphone_locations. The aircraft altitude is
+    minus the inertial z position. Outputs whose first two dimensions are
+    (control points, microphones) are levels in dB, all others are taken from the
+    evaluated microphones
+
+    Source:
+    None
+
+    Inputs:
+    propellers, acoustic_outputs, segment, settings   - see propeller_mid_fidelity
+    settings.urban_canyon_building_locations          - see building_boxes
+    settings.urban_canyon_building_dimensions         - see building_boxes
+    settings.urban_canyon_microphone_locations        - building microphones     [m]
+    frequency                                         - see diffraction_insertion_loss [Hz]
+    maximum_loss                                      - see diffraction_insertion_loss [dB]
+
+    Outputs:
+    propeller_noise                                   - see propeller_mid_fidelity
+    segment.state.conditions.noise:
+      building_microphone_visibility                  - (ctrl, N_bm) line of sight
+      building_microphone_insertion_loss              - (ctrl, N_bm)               [dB]
+
+    Properties Used:
+    N/A
+    """
+    noise      = segment.state.conditions.noise
+    N_bm       = noise.get('number_of_building_microphones',0)
+    if N_bm == 0 or 'urban_canyon_building_locations' not in settings:
+        return propeller_mid_fidelity(propellers,acoustic_outputs,segment,settings)
+    locations  = noise.total_microphone_locations
+    N_ctrl_pts = locations.shape[0]
+    N_mic      = locations.shape[1]
+
+    key = id(settings.urban_canyon_building_locations)
+    if key not in _hierarchies:
+        microphones       = np.atleast_2d(settings.urban_canyon_microphone_locations)[:,:3]
+        lower,upper       = building_boxes(settings.urban_canyon_building_locations,settings.urban_canyon_building_dimensions,microphones)
+        _hierarchies[key] = (build_bvh(lower,upper),microphones[-N_bm:])
+    bvh,microphones = _hierarchies[key]
+
+    positions            = np.array(segment.state.conditions.frames.inertial.position_vector,dtype = float)
+    positions[:,2]       = -positions[:,2]
+    blocker,t_near,t_far = building_visibility(bvh,microphones,positions)
+    loss                 = diffraction_insertion_loss(bvh,microphones,positions,blocker,t_near,t_far,frequency,
+                                                      maximum_loss = maximum_loss)
+    noise.building_microphone_visibility     = blocker < 0
+    noise.building_microphone_insertion_loss = loss
+
+    # evaluate the ground microphones and the building microphones seen at least once
+    hidden    = N_mic - N_bm + np.where(np.all(blocker >= 0,axis = 0))[0]
+    evaluated = np.setdiff1d(np.arange(N_mic),hidden)
+    if len(hidden) == 0 or len(evaluated) == 0:
+        outputs = propeller_mid_fidelity(propellers,acoustic_outputs,segment,settings)
+        return shadow_outputs(outputs,np.tile(np.arange(N_mic),(N_ctrl_pts,1)),np.zeros((N_ctrl_pts,N_mic)),loss,N_ctrl_pts,N_mic)
+
+    noise.total_microphone_locations = locations[:,evaluated]
+    if 'number_of_microphones' in noise:
+        noise.number_of_microphones = len(evaluated)
+    try:
+        outputs = propeller_mid_fidelity(propellers,acoustic_outputs,segment,settings)
+    finally:
+        noise.total_microphone_locations = locations
+        if 'number_of_microphones' in noise:
+            noise.number_of_microphones = N_mic
+
+    # hidden microphones take the level of the evaluated microphone of the nearest direction
+    distance  = np.maximum(np.linalg.norm(locations,axis = 2),1E-6)
+    direction = locations/distance[:,:,None]
+    columns   = np.zeros((N_ctrl_pts,N_mic),dtype = int)
+    spreading = np.zeros((N_ctrl_pts,N_mic))
+    columns[:,evaluated] = np.arange(len(evaluated))
+    for i in range(N_ctrl_pts):
+        nearest             = cKDTree(direction[i,evaluated]).query(direction[i,hidden])[1]
+        columns[i,hidden]   = nearest
+        spreading[i,hidden] = 20*np.log10(distance[i,hidden]/distance[i,evaluated[nearest]])
+    return shadow_outputs(outputs,columns,spreading,loss,N_ctrl_pts,len(evaluated))
+
+# ----------------------------------------------------------------------
+#   Shadow Outputs
+# ----------------------------------------------------------------------
+def shadow_outputs(outputs,columns,spreading,loss,N_ctrl_pts,N_evaluated):
+    """Expands the outputs of the evaluated microphones to every microphone and
+    subtracts the spreading of the copied levels and the insertion loss of the
+    building microphones.
+
+    Assumptions:
+    See shadowed_propeller_noise
+
+    Source:
+    None
+
+    Inputs:
+    outputs       - outputs of propeller_mid_fidelity at the evaluated microphones
+    columns       - (ctrl, N_mic) evaluated microphone each microphone takes its levels from
+    spreading     - (ctrl, N_mic) spherical spreading from that microphone         [dB]
+    loss          - (ctrl, N_bm) insertion loss of the building microphones       [dB]
+    N_ctrl_pts    - number of control points
+    N_evaluated   - number of evaluated microphones
+
+    Outputs:
+    outputs       - outputs at every microphone
+
+    Properties Used:
+    N/A
+    """
+    attenuation = np.array(spreading)
+    attenuation[:,-loss.shape[1]:] += loss
+    rows        = np.arange(N_ctrl_pts)[:,None]
+    shadowed    = Data()
+    for name,value in outputs.items():
+        if isinstance(value,dict):
+            shadowed[name] = shadow_outputs(value,columns,spreading,loss,N_ctrl_pts,N_evaluated)
+        elif isinstance(value,np.ndarray) and value.ndim > 1 and value.shape[:2] == (N_ctrl_pts,N_evaluated) and np.isrealobj(value):
+            shadowed[name] = value[rows,columns] - attenuation.reshape(attenuation.shape + (1,)*(value.ndim - 2))
+        else:
+            shadowed[name] = value
+    return shadowed
+
+# ----------------------------------------------------------------------
+#   Enable Building Shadowing
+# ----------------------------------------------------------------------
+def enable_building_shadowing():
+    """Routes the propeller noise of the SUAVE noise analyses through
+    shadowed_propeller_noise.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    patched   - names of the modules using the shadowed propeller noise
+
+    Properties Used:
+    N/A
+    """
+    import SUAVE.Analyses.Noise
+
+    patched = []
+    for name,module in list(sys.modules.items()):
+        if not name.startswith(NOISE_MODULES) or module == None:
+            continue
+        if getattr(module,'propeller_mid_fidelity',None) is propeller_mid_fidelity:
+            setattr(module,'propeller_mid_fidelity',shadowed_propeller_noise)
+            patched.append(name)
+    return patched
+
+# ----------------------------------------------------------------------
+#   Disable Building Shadowing
+# ----------------------------------------------------------------------
+def disable_building_shadowing():
+    for name,module in list(sys.modules.items()):
+        if name.startswith(NOISE_MODULES) and getattr(module,'propeller_mid_fidelity',None) is shadowed_propeller_noise:
+            setattr(module,'propeller_mid_fidelity',propeller_mid_fidelity)
+    _hierarchies.clear()
+    return
@@ -0,0 +1,175 @@
+# Certification_Runner.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import multiprocessing
+import importlib
+import json
+import time
+import sys
+import numpy as np
+
+# certification procedures: mission evaluated and SUAVE.Methods.Noise.Certification function
+CERTIFICATION_PROCEDURES = {'sideline' : ('sideline_takeoff','sideline_noise'),
+                            'flyover'  : ('takeoff'         ,'flyover_noise'),
+                            'approach' : ('landing'         ,'approach_noise')}
+
+# worker state, populated once per process by initialize_worker
+_worker = Data()
+
+# ----------------------------------------------------------------------
+#   Run Certification Noise
+# ----------------------------------------------------------------------
+def run_certification_noise(model_directory,model_name,procedures = ['sideline','flyover','approach'],number_of_workers = None,
+                            filename = None,configs = None,analyses = None):
+    """Evaluates the certification noise procedures of a model concurrently, one
+    procedure per worker process, and collects their maximum levels in a single
+    report.
+    The vehicle, its sizing and the finalized analyses are built once in the
+    calling process and inherited by the workers, so only the procedure
+    missions themselves are solved per worker.
+
+    Assumptions:
+    The model module defines full_setup(), returning (configs, analyses) whose
+    missions include the procedure missions of CERTIFICATION_PROCEDURES, and
+    optionally simple_sizing(configs). Procedures whose mission is missing are
+    skipped. Workers are forked; with another start method each worker builds
+    the model again. The level reported is the maximum of the SPL returned by the
+    SUAVE certification function, not an effective perceived noise level, so no
+    cumulative certification level is formed
+
+    Source:
+    None
+
+    Inputs:
+    model_directory    - directory of the model module
+    model_name         - module name, e.g. 'B737'
+    procedures         - procedures evaluated, keys of CERTIFICATION_PROCEDURES
+    number_of_workers  - size of the process pool, defaults to one per procedure.
+                         A single worker runs in the calling process
+    filename           - report written as filename_certification.json when given
+    configs, analyses  - finalized model of the calling process, built when not given
+
+    Outputs:
+    report.<procedure>.max_SPL     - maximum SPL of the procedure      [dB]
+    report.<procedure>.mission     - mission tag
+    report.<procedure>.time        - wall time of the procedure        [s]
+    report.time                    - wall time of the runner           [s]
+
+    Properties Used:
+    N/A
+    """
+    ti = time.time()
+    if configs != None and analyses != None:
+        _worker.model_name = model_name
+        _worker.configs    = configs
+        _worker.analyses   = analyses
+    initialize_worker(model_directory,model_name)
+
+    tasks = []
+    for procedure in procedures:
+        mission_tag = CERTIFICATION_PROCEDURES[procedure][0]
+        if mission_tag not in _worker.analyses.missions:
+            print('Skipping ' + procedure + ' noise: ' + model_name + ' has no ' + mission_tag + ' mission')
+            continue
+        tasks.append(procedure)
+
+    if number_of_workers == None:
+        number_of_workers = len(tasks)
+    number_of_workers = max(1,min(number_of_workers,len(tasks)))
+
+    outputs = []
+    if number_of_workers == 1:
+        outputs = [evaluate_procedure(task) for task in tasks]
+    else:
+        pool = multiprocessing.Pool(processes = number_of_workers, initializer = initialize_worker,
+                                    initargs = (model_directory,model_name))
+        try:
+            for output in pool.imap_unordered(evaluate_procedure,tasks):
+                outputs.append(output)
+                print('Completed ' + output[0] + ' noise: maximum SPL ' + str(round(output[1],2)) + ' dB, ' +
+                      str(round(output[2]/60,3)) + ' mins')
+        finally:
+            pool.close()
+            pool.join()
+
+    outputs = sorted(outputs,key = lambda output: tasks.index(output[0]))
+    report  = Data()
+    for procedure,max_SPL,procedure_time in outputs:
+        report[procedure]         = Data()
+        report[procedure].max_SPL = max_SPL
+        report[procedure].mission = CERTIFICATION_PROCEDURES[procedure][0]
+        report[procedure].time    = procedure_time
+    report.time = time.time() - ti
+
+    print_certification_report(report,[output[0] for output in outputs])
+    if filename != None:
+        with open(filename + '_certification.json','w') as file:
+            json.dump({name:(dict(value) if isinstance(value,dict) else value) for name,value in report.items()},file,indent = 1)
+    return report
+
+# ----------------------------------------------------------------------
+#   Initialize Worker
+# ----------------------------------------------------------------------
+def initialize_worker(model_directory,model_name):
+    """Builds, sizes and finalizes the model for the calling process, unless it
+    was inherited from the parent process.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    model_directory    - directory of the model module
+    model_name         - module name
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    if _worker.get('model_name',None) == model_name:
+        return
+    if model_directory not in sys.path:
+        sys.path.append(model_directory)
+    model             = importlib.import_module(model_name)
+    configs, analyses = model.full_setup()
+    if hasattr(model,'simple_sizing'):
+        model.simple_sizing(configs)
+    configs.finalize()
+    analyses.finalize()
+
+    _worker.model_name = model_name
+    _worker.configs    = configs
+    _worker.analyses   = analyses
+    return
+
+# ----------------------------------------------------------------------
+#   Evaluate Procedure
+# ----------------------------------------------------------------------
+def evaluate_procedure(procedure):
+    # the certification functions return SPL, reported as its maximum
+    ti             = time.time()
+    module         = importlib.import_module('SUAVE.Methods.Noise.Certification')
+    noise_function = getattr(module,CERTIFICATION_PROCEDURES[procedure][1])
+    SPL            = noise_function(_worker.analyses,_worker.configs)
+    return procedure, float(np.max(np.atleast_1d(SPL))), time.time() - ti
+
+# ----------------------------------------------------------------------
+#   Print Certification Report
+# ----------------------------------------------------------------------
+def print_certification_report(report,procedures):
+    print('Certification noise, maximum SPL')
+    for procedure in procedures:
+        print('  ' + procedure.ljust(10) + str(round(report[procedure].max_SPL,2)).rjust(8) + ' dB  (' +
+              report[procedure].mission + ', ' + str(round(report[procedure].time/60,3)) + ' mins)')
+    print('Certification time taken: ' + str(round(report.time/60,3)) + ' mins, ' +
+          str(round(sum([report[procedure].time for procedure in procedures])/60,3)) + ' mins of procedures')
+    return
@@ -0,0 +1,325 @@
+# Contour_Refinement.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import functools
+import copy
+import time
+import numpy as np
+
+import Noise_Replay
+import Noise_Settings
+
+# ----------------------------------------------------------------------
+#   Refine Noise Contour
+# ----------------------------------------------------------------------
+def refine_noise_contour(evaluate,min_x,max_x,min_y,max_y,N_gm_x,N_gm_y,levels = [55.],max_depth = 4):
+    """Locates noise contours with a quadtree of ground microphones. A coarse
+    N_gm_x x N_gm_y grid is evaluated first; every cell whose corner levels
+    straddle one of the contour levels is split into four and the new corner and
+    midpoint microphones are evaluated, down to max_depth splits. Each depth is
+    evaluated as one batch. Cells away from the contours are never refined, so
+    the footprint is resolved at the finest spacing with a fraction of the
+    microphones of the equivalent uniform grid.
+
+    Assumptions:
+    A contour crossing a cell crosses its boundary between corners of different
+    sides of the level, i.e. the coarse grid resolves every closed contour
+
+    Source:
+    None
+
+    Inputs:
+    evaluate         - function(points) returning the level at (N, 2) x, y points  [dBA]
+    min_x, max_x     - streamwise extent of the grid                                 [m]
+    min_y, max_y     - spanwise extent of the grid                                   [m]
+    N_gm_x, N_gm_y   - coarse grid resolution
+    levels           - contour levels refined                                        [dBA]
+    max_depth        - number of quadtree splits of a coarse cell
+
+    Outputs:
+    footprint.microphone_locations  - (N, 2) evaluated microphones                   [m]
+    footprint.SPL_dBA               - (N) level at the microphones                   [dBA]
+    footprint.depth                 - (N) depth at which each microphone was added
+    footprint.cells                 - (n, 3) leaf cells: lattice x, y index and size
+    footprint.raster_x, raster_y    - axes of the raster at the finest spacing       [m]
+    footprint.raster_SPL_dBA        - (N_x, N_y) bilinear interpolation of the leaves [dBA]
+    footprint.levels                - contour levels                                 [dBA]
+    footprint.number_of_microphones
+    footprint.number_of_uniform_microphones - microphones of the uniform grid at the finest spacing
+
+    Properties Used:
+    N/A
+    """
+    ti     = time.time()
+    levels = np.atleast_1d(levels)
+    scale  = 2**max_depth
+    N_x    = (N_gm_x - 1)*scale + 1
+    N_y    = (N_gm_y - 1)*scale + 1
+    dx     = (max_x - min_x)/(N_x - 1)
+    dy     = (max_y - min_y)/(N_y - 1)
+
+    # lattice index -> level and depth of every evaluated microphone
+    SPL    = {}
+    depths = {}
+
+    def evaluate_nodes(nodes,depth):
+        nodes  = [node for node in dict.fromkeys(nodes) if node not in SPL]
+        if len(nodes) == 0:
+            return
+        index  = np.array(nodes)
+        points = np.column_stack([min_x + index[:,0]*dx,min_y + index[:,1]*dy])
+        values = np.asarray(evaluate(points),dtype = float)
+        for node,value in zip(nodes,values):
+            SPL[node]    = value
+            depths[node] = depth
+        print('Contour refinement depth ' + str(depth) + ': ' + str(len(nodes)) + ' microphones evaluated')
+        return
+
+    size   = scale
+    cells  = [(i*scale,j*scale) for i in range(N_gm_x - 1) for j in range(N_gm_y - 1)]
+    evaluate_nodes([(i*scale,j*scale) for i in range(N_gm_x) for j in range(N_gm_y)],0)
+
+    leaves = []
+    for depth in range(max_depth + 1):
+        split = []
+        for (I,J) in cells:
+            corners = [SPL[(I,J)],SPL[(I + size,J)],SPL[(I,J + size)],SPL[(I + size,J + size)]]
+            if depth < max_depth and np.any((min(corners) < levels) & (levels <= max(corners))):
+                split.append((I,J))
+            else:
+                leaves.append((I,J,size))
+        if len(split) == 0:
+            break
+
+        half  = size//2
+        cells = [(I + a*half,J + b*half) for (I,J) in split for a in range(2) for b in range(2)]
+        evaluate_nodes([(I + a*half,J + b*half) for (I,J) in split for a in range(3) for b in range(3)],depth + 1)
+        size  = half
+
+    nodes  = list(SPL.keys())
+    index  = np.array(nodes)
+
+    footprint                               = Data()
+    footprint.microphone_locations          = np.column_stack([min_x + index[:,0]*dx,min_y + index[:,1]*dy])
+    footprint.SPL_dBA                       = np.array([SPL[node] for node in nodes])
+    footprint.depth                         = np.array([depths[node] for node in nodes])
+    footprint.cells                         = np.array(leaves)
+    footprint.raster_x                      = np.linspace(min_x,max_x,N_x)
+    footprint.raster_y                      = np.linspace(min_y,max_y,N_y)
+    footprint.raster_SPL_dBA                = interpolate_leaf_cells(SPL,leaves,N_x,N_y)
+    footprint.levels                        = levels
+    footprint.number_of_microphones         = len(nodes)
+    footprint.number_of_uniform_microphones = N_x*N_y
+
+    tf = time.time()
+    print('Contour refinement: ' + str(len(nodes)) + ' microphones, ' +
+          str(round(100.*len(nodes)/(N_x*N_y),1)) + ' % of the uniform ' + str(N_x) + ' x ' + str(N_y) + ' grid, ' +
+          'time taken: ' + str(round(((tf-ti)/60),3)) + ' mins')
+    return footprint
+
+# ----------------------------------------------------------------------
+#   Interpolate Leaf Cells
+# ----------------------------------------------------------------------
+def interpolate_leaf_cells(SPL,leaves,N_x,N_y):
+    """Rasterizes the quadtree at the finest spacing by bilinear interpolation of
+    the corner levels of every leaf cell.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    SPL      - dict of lattice index: level                     [dBA]
+    leaves   - list of (lattice x, y index, size) leaf cells
+    N_x, N_y - raster resolution
+
+    Outputs:
+    raster   - (N_x, N_y) levels                                [dBA]
+
+    Properties Used:
+    N/A
+    """
+    raster = np.zeros((N_x,N_y))
+    for (I,J,size) in leaves:
+        u  = np.linspace(0,1,size + 1)[:,None]
+        v  = np.linspace(0,1,size + 1)[None,:]
+        raster[I:I + size + 1,J:J + size + 1] = (SPL[(I,J)]*(1 - u)*(1 - v) + SPL[(I + size,J)]*u*(1 - v) +
+                                                 SPL[(I,J + size)]*(1 - u)*v + SPL[(I + size,J + size)]*u*v)
+    return raster
+
+# ----------------------------------------------------------------------
+#   Replay Microphone Evaluator
+# ----------------------------------------------------------------------
+def replay_microphone_evaluator(results,noise_setup,background_noise = 35.,number_of_workers = None,cache_sources = True):
+    """Builds the evaluate function of refine_noise_contour from a converged
+    trajectory: each batch of microphones is replayed over the whole trajectory
+    with Noise_Replay and reduced to the maximum level over time, the metric of
+    Touch_and_Go_Angle_Plots.plot_noise_contour.
+
+    Assumptions:
+    Level ground at zero elevation. Segments flagged with battery_discharge False
+    are skipped, as in post_process_noise_data
+
+    Source:
+    None
+
+    Inputs:
+    results            - results of mission.evaluate()
+    noise_setup        - function(vehicle) returning the noise analysis of a configuration
+    background_noise   - level of microphones the aircraft does not reach   [dBA]
+    number_of_workers  - see Noise_Replay.replay_noise
+    cache_sources      - see Noise_Replay.replay_noise
+
+    Outputs:
+    evaluate           - function(points) returning the maximum level       [dBA]
+
+    Properties Used:
+    N/A
+    """
+    return functools.partial(evaluate_microphones,results = results,noise_setup = noise_setup,background_noise = background_noise,
+                             number_of_workers = number_of_workers,cache_sources = cache_sources)
+
+# ----------------------------------------------------------------------
+#   Evaluate Microphones
+# ----------------------------------------------------------------------
+def evaluate_microphones(points,results,noise_setup,background_noise = 35.,number_of_workers = None,cache_sources = True):
+    N_mic    = len(points)
+    setup    = functools.partial(microphone_noise_setup,noise_setup = noise_setup,points = points)
+    replayed = Noise_Replay.evaluate_replay(results,[setup],number_of_workers,None,cache_sources)[0]
+    segments = list(results.segments.values())
+
+    SPL = np.ones(N_mic)*background_noise
+    for idx,start,outputs,settings in replayed:
+        if segments[idx].get('battery_discharge',True) == False:
+            continue
+        check_microphone_grid(outputs,settings,points)
+        levels = np.nan_to_num(outputs.total_SPL_dBA[:,:N_mic])
+        SPL    = np.maximum(SPL,np.max(levels,axis = 0))
+    return SPL
+
+# ----------------------------------------------------------------------
+#   Check Microphone Grid
+# ----------------------------------------------------------------------
+def check_microphone_grid(outputs,settings,points):
+    """Checks that a replayed block was evaluated at the microphones of
+    microphone_noise_setup, i.e. that the noise analysis kept the N x 1 grid and
+    its locations instead of generating a grid of its own, e.g. from the
+    level_ground_microphone_* settings of a level ground analysis, and that the
+    stencil covered every microphone.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    outputs   - replayed noise outputs of the block
+    settings  - noise settings after evaluation
+    points    - (N, 2) x, y microphone locations          [m]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    N_mic = len(points)
+    for name in Noise_Settings.LOCATION_SETTINGS:
+        locations = settings.get(name,None)
+        if isinstance(locations,np.ndarray) and not (locations.shape == (N_mic,3) and np.allclose(locations[:,:2],points)):
+            raise ValueError('Noise analysis replaced the ' + str(N_mic) + ' requested microphones by ' + name +
+                             ' of shape ' + str(locations.shape) + ', set its location settings before evaluation')
+    if 'ground_microphone_stencil_locations' in outputs:
+        windows = np.asarray(outputs.ground_microphone_stencil_locations,dtype = int)
+        if not np.all(windows == [0,N_mic,0,1]):
+            raise ValueError('Microphone stencil ' + str(windows[0]) + ' does not cover the ' + str(N_mic) + ' x 1 microphone grid')
+    if np.shape(outputs.total_SPL_dBA)[1] < N_mic:
+        raise ValueError('Noise analysis evaluated ' + str(np.shape(outputs.total_SPL_dBA)[1]) + ' of ' + str(N_mic) + ' microphones')
+    return
+
+# ----------------------------------------------------------------------
+#   Results Noise Setup
+# ----------------------------------------------------------------------
+def results_noise_setup(results):
+    """Builds a noise_setup for replay_microphone_evaluator from the noise analyses
+    stored in the results of a mission that was flown with a noise model, so the
+    original noise settings are replayed at new microphones.
+
+    Assumptions:
+    Every configuration flown has a noise analysis
+
+    Source:
+    None
+
+    Inputs:
+    results      - results of mission.evaluate()
+
+    Outputs:
+    noise_setup  - function(vehicle) returning a copy of the noise analysis of the configuration
+
+    Properties Used:
+    N/A
+    """
+    noise_analyses = {}
+    for segment in results.segments.values():
+        if 'noise' in segment.analyses:
+            noise_analyses.setdefault(segment.analyses.aerodynamics.geometry.tag,segment.analyses.noise)
+    return functools.partial(stored_noise_setup,noise_analyses = noise_analyses)
+
+def stored_noise_setup(vehicle,noise_analyses):
+    return copy.deepcopy(noise_analyses[vehicle.tag])
+
+# ----------------------------------------------------------------------
+#   Microphone Noise Setup
+# ----------------------------------------------------------------------
+def microphone_noise_setup(vehicle,noise_setup,points):
+    """Noise analysis of noise_setup evaluated at an unstructured set of ground
+    microphones. The microphones are passed as an N x 1 grid whose stencil spans
+    the whole grid, so every microphone is evaluated at every control point.
+
+    Assumptions:
+    Every grid resolution setting present is set to N x 1, including the
+    level_ground_microphone_* settings level ground analyses generate their grid
+    from, and the locations are given, so no grid is generated.
+    check_microphone_grid verifies this on the replayed outputs
+
+    Source:
+    None
+
+    Inputs:
+    vehicle      - configuration
+    noise_setup  - function(vehicle) returning the noise analysis
+    points       - (N, 2) x, y microphone locations          [m]
+
+    Outputs:
+    noise        - noise analysis
+
+    Properties Used:
+    N/A
+    """
+    noise     = noise_setup(vehicle)
+    settings  = noise.settings
+    N_mic     = len(points)
+    locations = np.column_stack([points,np.zeros(N_mic)])
+
+    Noise_Settings.settings_names(settings,Noise_Settings.RESOLUTION_SETTINGS)
+    for x_resolution,y_resolution in Noise_Settings.RESOLUTION_SETTINGS:
+        if x_resolution in settings:
+            settings[x_resolution] = N_mic
+            settings[y_resolution] = 1
+    for x_stencil,y_stencil in Noise_Settings.STENCIL_SETTINGS:
+        if x_stencil in settings:
+            settings[x_stencil] = N_mic
+            settings[y_stencil] = 0
+    names = [name for name in Noise_Settings.LOCATION_SETTINGS if name in settings]
+    for name in (names if len(names) > 0 else Noise_Settings.LOCATION_SETTINGS[:1]):
+        settings[name] = locations
+    return noise
@@ -0,0 +1,188 @@
+# Mission_Profiler.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+import json
+import time
+
+# calls and wall time of every wrapped process step, keyed by (segment tag, step path)
+_timings = {}
+
+# ----------------------------------------------------------------------
+#   Timed Step
+# ----------------------------------------------------------------------
+class Timed_Step():
+    """Process step that forwards to the original step and accumulates its call
+    count and wall time.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+    """
+    def __init__(self,step,key):
+        self.step = step
+        self.key  = key
+
+    def __call__(self,*args,**kwargs):
+        ti     = time.perf_counter()
+        output = self.step(*args,**kwargs)
+        record = _timings.setdefault(self.key,[0,0.])
+        record[0] += 1
+        record[1] += time.perf_counter() - ti
+        return output
+
+# ----------------------------------------------------------------------
+#   Profile Mission
+# ----------------------------------------------------------------------
+def profile_mission(mission):
+    """Wraps every step of mission.process and of the process of every segment with
+    a timer and call counter, and clears previous timings. Call after the mission
+    and any other process modifications are set up, before evaluation.
+
+    Assumptions:
+    Steps that are Process containers are descended into, all other steps are
+    wrapped. Time of a step includes the steps it calls, e.g. converge includes
+    iterate
+
+    Source:
+    None
+
+    Inputs:
+    mission  - mission, before evaluation
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    _timings.clear()
+    wrap_process(mission.process,mission.tag,'')
+    for segment in all_segments(mission):
+        wrap_process(segment.process,segment.tag,'')
+    return
+
+# ----------------------------------------------------------------------
+#   Wrap Process
+# ----------------------------------------------------------------------
+def wrap_process(process,tag,path):
+    for name,step in process.items():
+        step_path = path + name
+        if isinstance(step,Process):
+            wrap_process(step,tag,step_path + '.')
+        elif isinstance(step,Timed_Step):
+            continue
+        elif callable(step):
+            process[name] = Timed_Step(step,(tag,step_path))
+    return
+
+# ----------------------------------------------------------------------
+#   All Segments
+# ----------------------------------------------------------------------
+def all_segments(mission):
+    segments = []
+    for segment in mission.segments.values():
+        segments.append(segment)
+        if 'segments' in segment:
+            segments.extend(all_segments(segment))
+    return segments
+
+# ----------------------------------------------------------------------
+#   Profile Report
+# ----------------------------------------------------------------------
+def profile_report(results):
+    """Collects the timings of the last profiled evaluation into a report.
+
+    Assumptions:
+    Residual evaluations of a segment are the calls of its most called iterate step.
+    They include the evaluations of the finite difference Jacobian of the root
+    finder, so they are not a count of Newton iterations, which SUAVE does not store
+
+    Source:
+    None
+
+    Inputs:
+    results  - results of the profiled mission.evaluate()
+
+    Outputs:
+    report.steps     - list of Data(segment,step,calls,total_time,mean_time)      [s]
+    report.segments  - list of Data(segment,time,residual_evaluations,converged)  [s]
+
+    Properties Used:
+    N/A
+    """
+    report       = Data()
+    report.steps = []
+    for (tag,path),(calls,total) in _timings.items():
+        step            = Data()
+        step.segment    = tag
+        step.step       = path
+        step.calls      = calls
+        step.total_time = total
+        step.mean_time  = total/calls
+        report.steps.append(step)
+
+    report.segments = []
+    for segment in all_segments(results):
+        steps   = [step for step in report.steps if step.segment == segment.tag]
+        summary = Data()
+        summary.segment              = segment.tag
+        summary.time                 = sum([step.total_time for step in steps if not step.step.startswith('iterate.')])
+        summary.residual_evaluations = max([step.calls for step in steps if step.step.startswith('iterate.')] + [0])
+        summary.converged            = bool(segment.state.numerics.get('converged',True))
+        report.segments.append(summary)
+    return report
+
+# ----------------------------------------------------------------------
+#   Write Profile Report
+# ----------------------------------------------------------------------
+def write_profile_report(results,filename):
+    """Writes the profile of the last evaluation as filename_profile.json and
+    filename_profile.csv (one row per process step), next to the results pickle.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    results   - results of the profiled mission.evaluate()
+    filename  - results filename (no extension)
+
+    Outputs:
+    report    - see profile_report
+
+    Properties Used:
+    N/A
+    """
+    report = profile_report(results)
+    with open(filename + '_profile.json','w') as file:
+        json.dump({'segments':[dict(summary) for summary in report.segments],
+                   'steps'   :[dict(step) for step in report.steps]},file,indent = 1)
+
+    with open(filename + '_profile.csv','w') as file:
+        file.write('segment,step,calls,total_time,mean_time\n')
+        for step in sorted(report.steps, key = lambda step: -step.total_time):
+            file.write(step.segment + ',' + step.step + ',' + str(step.calls) + ',' +
+                       str(step.total_time) + ',' + str(step.mean_time) + '\n')
+    return report
+
+# ----------------------------------------------------------------------
+#   Print Profile Summary
+# ----------------------------------------------------------------------
+def print_profile_summary(report,number_of_steps = 10):
+    print('{:<40} {:>10} {:>21}'.format('Segment','Time (s)','Residual evaluations'))
+    for summary in report.segments:
+        print('{:<40} {:>10.2f} {:>21}'.format(summary.segment,summary.time,summary.residual_evaluations))
+    print('Slowest process steps:')
+    for step in sorted(report.steps, key = lambda step: -step.total_time)[:number_of_steps]:
+        print('{:<40} {:<40} {:>10.2f} {:>8}'.format(step.segment,step.step,step.total_time,step.calls))
+    return
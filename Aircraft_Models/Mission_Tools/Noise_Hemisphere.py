@@ -0,0 +1,407 @@
+# Noise_Hemisphere.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity import propeller_mid_fidelity
+import sys
+import time
+import numpy as np
+from scipy.sparse import csr_matrix
+
+import Spectrum_Tables
+
+# prefix of the modules whose propeller noise function is replaced by the hemisphere one
+NOISE_MODULES = 'SUAVE'
+
+# ----------------------------------------------------------------------
+#   Hemisphere Propeller Noise
+# ----------------------------------------------------------------------
+def hemisphere_propeller_noise(propellers,acoustic_outputs,segment,settings,polar_resolution = 19,azimuth_resolution = 24,
+                               reference_radius = None,relative_humidity = 70.):
+    """Drop-in replacement of propeller_mid_fidelity for large microphone grids.
+    At every control point the mid-fidelity model is evaluated on a fixed
+    spherical grid of directions at a reference radius around the rotors. The
+    levels at the microphones are interpolated from that sphere in the energy
+    domain and propagated from the sphere to the microphone distance with
+    spherical spreading and ISO 9613-1 atmospheric absorption. The cost is that of the sphere,
+    polar_resolution x azimuth_resolution microphones, plus an interpolation,
+    whatever the number of microphones.
+
+    Assumptions:
+    The rotors of the call form a compact source at the origin of the microphone
+    coordinates: the reference radius is at least ten times the distance of the
+    furthest blade tip from it, and the microphones are in its far field. The
+    sources of separate calls, e.g. propellers and lift rotors, are energy summed
+    by the noise analysis. Grids no larger than the sphere, and microphones that
+    come inside the reference radius at any control point, are evaluated directly
+
+    Source:
+    ISO 9613-1:1993, Acoustics - Attenuation of sound during propagation outdoors,
+    Part 1: Calculation of the absorption of sound by the atmosphere
+
+    Inputs:
+    propellers, acoustic_outputs, segment, settings   - see propeller_mid_fidelity
+    settings.center_frequencies                       - third octave bands      [Hz]
+    polar_resolution                                  - polar angles of the sphere, 0 to 180 deg
+    azimuth_resolution                                - azimuth angles of the sphere
+    reference_radius                                  - radius of the sphere    [m]
+    relative_humidity                                 - of the atmosphere       [%]
+
+    Outputs:
+    propeller_noise                                   - see propeller_mid_fidelity
+
+    Properties Used:
+    N/A
+    """
+    noise      = segment.state.conditions.noise
+    locations  = noise.total_microphone_locations
+    N_ctrl_pts = locations.shape[0]
+    N_mic      = locations.shape[1]
+    if N_mic <= polar_resolution*azimuth_resolution:
+        return propeller_mid_fidelity(propellers,acoustic_outputs,segment,settings)
+
+    if reference_radius == None:
+        reference_radius = 10*max([np.linalg.norm(np.atleast_2d(propeller.origin)[0]) + propeller.tip_radius
+                                   for propeller in propellers.values()])
+    polar      = np.linspace(0,np.pi,polar_resolution)
+    azimuth    = np.linspace(0,2*np.pi,azimuth_resolution,endpoint = False)
+    THETA,PHI  = np.meshgrid(polar,azimuth,indexing = 'ij')
+    directions = np.vstack([(np.sin(THETA)*np.cos(PHI)).flatten(),(np.sin(THETA)*np.sin(PHI)).flatten(),np.cos(THETA).flatten()]).T
+
+    # evaluate the mid-fidelity model on the sphere
+    noise.total_microphone_locations = np.tile(reference_radius*directions[None,:,:],(N_ctrl_pts,1,1))
+    if 'number_of_microphones' in noise:
+        noise.number_of_microphones = len(directions)
+    try:
+        hemisphere = propeller_mid_fidelity(propellers,acoustic_outputs,segment,settings)
+    finally:
+        noise.total_microphone_locations = locations
+        if 'number_of_microphones' in noise:
+            noise.number_of_microphones = N_mic
+
+    # interpolation weights and propagation of every microphone
+    indices,weights = hemisphere_weights(locations,polar,azimuth)
+    distance        = np.maximum(np.linalg.norm(locations,axis = 2),1E-6)
+    spreading       = 20*np.log10(distance/reference_radius)
+    frequencies     = np.asarray(settings.center_frequencies,dtype = float)
+    freestream      = segment.state.conditions.freestream
+    temperature     = freestream.get('temperature',np.ones((N_ctrl_pts,1))*288.15)[:,0]
+    pressure        = freestream.get('pressure',np.ones((N_ctrl_pts,1))*101325.)[:,0]
+    absorption      = np.array([atmospheric_absorption(frequencies,temperature[i],pressure[i],relative_humidity) for i in range(N_ctrl_pts)])
+    attenuation     = spreading[:,:,None] + absorption[:,None,:]*(distance - reference_radius)[:,:,None]
+    outputs         = interpolate_outputs(hemisphere,indices,weights,spreading,attenuation,len(directions),frequencies)
+
+    # spreading and absorption only hold outside the sphere, closer microphones are evaluated directly
+    near = np.where(np.any(distance < reference_radius,axis = 0))[0]
+    if len(near) == 0:
+        return outputs
+    noise.total_microphone_locations = locations[:,near]
+    if 'number_of_microphones' in noise:
+        noise.number_of_microphones = len(near)
+    try:
+        direct = propeller_mid_fidelity(propellers,acoustic_outputs,segment,settings)
+    finally:
+        noise.total_microphone_locations = locations
+        if 'number_of_microphones' in noise:
+            noise.number_of_microphones = N_mic
+    return replace_microphones(outputs,direct,near,N_ctrl_pts)
+
+# ----------------------------------------------------------------------
+#   Hemisphere Weights
+# ----------------------------------------------------------------------
+def hemisphere_weights(locations,polar,azimuth):
+    """Bilinear interpolation weights of microphone directions on the polar and
+    azimuth grid of the sphere, periodic in azimuth.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    locations   - (control points, microphones, 3) microphone locations     [m]
+    polar       - polar angles of the sphere, from the z axis               [rad]
+    azimuth     - azimuth angles of the sphere, from the x axis             [rad]
+
+    Outputs:
+    indices     - (control points, microphones, 4) sphere points, flattened polar major
+    weights     - (control points, microphones, 4) weights of the points
+
+    Properties Used:
+    N/A
+    """
+    N_azimuth = len(azimuth)
+    distance  = np.maximum(np.linalg.norm(locations,axis = 2),1E-6)
+    theta     = np.arccos(np.clip(locations[:,:,2]/distance,-1,1))
+    phi       = np.arctan2(locations[:,:,1],locations[:,:,0]) % (2*np.pi)
+
+    d_theta   = polar[1] - polar[0]
+    d_phi     = 2*np.pi/N_azimuth
+    i_theta   = np.clip(np.floor(theta/d_theta).astype(int),0,len(polar) - 2)
+    t_theta   = np.clip(theta/d_theta - i_theta,0,1)
+    i_phi     = np.floor(phi/d_phi).astype(int) % N_azimuth
+    t_phi     = phi/d_phi - np.floor(phi/d_phi)
+    j_phi     = (i_phi + 1) % N_azimuth
+
+    indices   = np.stack([i_theta*N_azimuth + i_phi,i_theta*N_azimuth + j_phi,
+                          (i_theta + 1)*N_azimuth + i_phi,(i_theta + 1)*N_azimuth + j_phi],axis = 2)
+    weights   = np.stack([(1 - t_theta)*(1 - t_phi),(1 - t_theta)*t_phi,t_theta*(1 - t_phi),t_theta*t_phi],axis = 2)
+    return indices, weights
+
+# ----------------------------------------------------------------------
+#   Interpolate Outputs
+# ----------------------------------------------------------------------
+def interpolate_outputs(hemisphere,indices,weights,spreading,attenuation,N_sphere,frequencies):
+    """Interpolates the noise outputs of the sphere to the microphones. Levels are
+    interpolated in the energy domain. Third octave spectra are attenuated band by
+    band, other levels by the change of the overall (or A-weighted, for dBA
+    outputs) level of the third octave spectrum, or by spreading alone when the
+    outputs hold no spectrum.
+
+    Assumptions:
+    Outputs whose first two dimensions are (control points, sphere points) are
+    levels in dB, all others are taken as they are
+
+    Source:
+    None
+
+    Inputs:
+    hemisphere    - outputs of propeller_mid_fidelity on the sphere
+    indices, weights - see hemisphere_weights
+    spreading     - (control points, microphones) spherical spreading loss   [dB]
+    attenuation   - (control points, microphones, bands) total loss          [dB]
+    N_sphere      - points of the sphere
+    frequencies   - third octave center frequencies                          [Hz]
+
+    Outputs:
+    outputs       - outputs at the microphones
+
+    Properties Used:
+    N/A
+    """
+    N_ctrl_pts = indices.shape[0]
+    N_mic      = indices.shape[1]
+    N_bands    = len(frequencies)
+
+    # one sparse interpolation matrix per control point, four sphere points per microphone
+    rows     = np.repeat(np.arange(N_mic),4)
+    matrices = [csr_matrix((weights[i].flatten(),(rows,indices[i].flatten())),shape = (N_mic,N_sphere)) for i in range(N_ctrl_pts)]
+
+    def interpolate(value):
+        energy = 10**(np.nan_to_num(value,nan = -np.inf)/10)
+        return np.array([(matrices[i] @ energy[i].reshape(N_sphere,-1)).reshape((N_mic,) + value.shape[2:]) for i in range(N_ctrl_pts)])
+
+    def level(energy):
+        with np.errstate(divide = 'ignore'):
+            return 10*np.log10(energy)
+
+    # change of the overall levels between the sphere and the microphones
+    loss   = Data()
+    loss.A = loss.Z = spreading
+    spectrum = find_spectrum(hemisphere,N_ctrl_pts,N_sphere,N_bands)
+    if spectrum is not None:
+        A_f         = 10**(Spectrum_Tables.A_weighting_vector(frequencies)/10)
+        energy      = interpolate(spectrum)
+        attenuated  = energy*10**(-attenuation/10)
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            loss.Z = level(np.sum(energy,axis = 2)) - level(np.sum(attenuated,axis = 2))
+            loss.A = level(np.sum(energy*A_f,axis = 2)) - level(np.sum(attenuated*A_f,axis = 2))
+        loss.Z = np.where(np.isfinite(loss.Z),loss.Z,spreading)
+        loss.A = np.where(np.isfinite(loss.A),loss.A,spreading)
+
+    def propagate(data):
+        outputs = Data()
+        for name,value in data.items():
+            if isinstance(value,dict):
+                outputs[name] = propagate(value)
+            elif isinstance(value,np.ndarray) and value.ndim > 1 and value.shape[:2] == (N_ctrl_pts,N_sphere) and np.isrealobj(value):
+                levels = level(interpolate(value))
+                if value.ndim == 3 and value.shape[2] == N_bands:
+                    outputs[name] = levels - attenuation
+                elif 'dBA' in name:
+                    outputs[name] = levels - loss.A.reshape(loss.A.shape + (1,)*(value.ndim - 2))
+                else:
+                    outputs[name] = levels - loss.Z.reshape(loss.Z.shape + (1,)*(value.ndim - 2))
+            else:
+                outputs[name] = value
+        return outputs
+
+    return propagate(hemisphere)
+
+# ----------------------------------------------------------------------
+#   Replace Microphones
+# ----------------------------------------------------------------------
+def replace_microphones(outputs,direct,near,N_ctrl_pts):
+    """Overwrites the interpolated outputs of the near microphones with those of
+    their direct evaluation.
+
+    Assumptions:
+    Outputs of the direct evaluation whose first two dimensions are (control
+    points, near microphones) are per microphone, all others are taken from the
+    interpolated outputs
+
+    Source:
+    None
+
+    Inputs:
+    outputs      - interpolated outputs at every microphone
+    direct       - outputs of propeller_mid_fidelity at the near microphones
+    near         - indices of the near microphones
+    N_ctrl_pts   - number of control points
+
+    Outputs:
+    outputs      - with the near microphones replaced
+
+    Properties Used:
+    N/A
+    """
+    for name,value in direct.items():
+        if name not in outputs:
+            continue
+        if isinstance(value,dict):
+            replace_microphones(outputs[name],value,near,N_ctrl_pts)
+        elif isinstance(value,np.ndarray) and value.ndim > 1 and value.shape[:2] == (N_ctrl_pts,len(near)) and \
+             isinstance(outputs[name],np.ndarray) and outputs[name].shape[2:] == value.shape[2:]:
+            outputs[name]         = np.array(outputs[name],dtype = np.result_type(outputs[name],value))
+            outputs[name][:,near] = value
+    return outputs
+
+# ----------------------------------------------------------------------
+#   Find Spectrum
+# ----------------------------------------------------------------------
+def find_spectrum(data,N_ctrl_pts,N_sphere,N_bands):
+    for name,value in data.items():
+        if isinstance(value,np.ndarray) and value.shape == (N_ctrl_pts,N_sphere,N_bands) and 'dBA' not in name:
+            return value
+    return None
+
+# ----------------------------------------------------------------------
+#   Atmospheric Absorption
+# ----------------------------------------------------------------------
+def atmospheric_absorption(frequencies,temperature = 288.15,pressure = 101325.,relative_humidity = 70.):
+    """Pure-tone atmospheric absorption coefficient.
+
+    Assumptions:
+    None
+
+    Source:
+    ISO 9613-1:1993, Acoustics - Attenuation of sound during propagation outdoors,
+    Part 1: Calculation of the absorption of sound by the atmosphere
+
+    Inputs:
+    frequencies        - frequencies                  [Hz]
+    temperature        - air temperature              [K]
+    pressure           - air pressure                 [Pa]
+    relative_humidity  - relative humidity            [%]
+
+    Outputs:
+    alpha              - absorption coefficient       [dB/m]
+
+    Properties Used:
+    N/A
+    """
+    p_r   = 101325.
+    T_0   = 293.15
+    T_01  = 273.16
+    p     = pressure/p_r
+    T     = temperature/T_0
+    C     = -6.8346*((T_01/temperature)**1.261) + 4.6151
+    h     = relative_humidity*(10**C)/p
+    f_rO  = p*(24 + 4.04E4*h*(0.02 + h)/(0.391 + h))
+    f_rN  = p*(T**-0.5)*(9 + 280*h*np.exp(-4.170*((T**(-1/3)) - 1)))
+    f     = np.asarray(frequencies,dtype = float)
+    alpha = 8.686*(f**2)*(1.84E-11*(1/p)*(T**0.5) + (T**-2.5)*(0.01275*np.exp(-2239.1/temperature)/(f_rO + (f**2)/f_rO) +
+                                                            0.1068*np.exp(-3352.0/temperature)/(f_rN + (f**2)/f_rN)))
+    return alpha
+
+# ----------------------------------------------------------------------
+#   Enable Hemisphere Noise
+# ----------------------------------------------------------------------
+def enable_hemisphere_noise():
+    """Routes the propeller noise of the SUAVE noise analyses through
+    hemisphere_propeller_noise.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    patched   - names of the modules using the hemisphere propeller noise
+
+    Properties Used:
+    N/A
+    """
+    import SUAVE.Analyses.Noise
+
+    patched = []
+    for name,module in list(sys.modules.items()):
+        if not name.startswith(NOISE_MODULES) or module == None:
+            continue
+        if getattr(module,'propeller_mid_fidelity',None) is propeller_mid_fidelity:
+            setattr(module,'propeller_mid_fidelity',hemisphere_propeller_noise)
+            patched.append(name)
+    return patched
+
+# ----------------------------------------------------------------------
+#   Disable Hemisphere Noise
+# ----------------------------------------------------------------------
+def disable_hemisphere_noise():
+    for name,module in list(sys.modules.items()):
+        if name.startswith(NOISE_MODULES) and getattr(module,'propeller_mid_fidelity',None) is hemisphere_propeller_noise:
+            setattr(module,'propeller_mid_fidelity',propeller_mid_fidelity)
+    return
+
+# ----------------------------------------------------------------------
+#   Compare Hemisphere Noise
+# ----------------------------------------------------------------------
+def compare_hemisphere_noise(propellers,acoustic_outputs,segment,settings,polar_resolution = 19,azimuth_resolution = 24):
+    """Times the hemisphere mode against the full mid-fidelity model on the
+    microphones of a segment and reports the level differences.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    propellers, acoustic_outputs, segment, settings   - see propeller_mid_fidelity
+    polar_resolution, azimuth_resolution              - see hemisphere_propeller_noise
+
+    Outputs:
+    comparison.full_time                              - time of the full model         [s]
+    comparison.hemisphere_time                        - time of the hemisphere mode    [s]
+    comparison.speedup                                - full_time/hemisphere_time
+    comparison.mean_error, maximum_error              - SPL_dBA differences            [dB]
+
+    Properties Used:
+    N/A
+    """
+    ti         = time.time()
+    full       = propeller_mid_fidelity(propellers,acoustic_outputs,segment,settings)
+    full_time  = time.time() - ti
+    ti         = time.time()
+    hemisphere = hemisphere_propeller_noise(propellers,acoustic_outputs,segment,settings,polar_resolution,azimuth_resolution)
+
+    comparison                 = Data()
+    comparison.full_time       = full_time
+    comparison.hemisphere_time = time.time() - ti
+    comparison.speedup         = comparison.full_time/comparison.hemisphere_time
+    error                      = np.abs(np.nan_to_num(hemisphere.SPL_dBA) - np.nan_to_num(full.SPL_dBA))
+    comparison.mean_error      = np.mean(error)
+    comparison.maximum_error   = np.max(error)
+
+    print('Hemisphere noise: ' + str(round(comparison.full_time,3)) + ' sec full model, ' + str(round(comparison.hemisphere_time,3)) +
+          ' sec hemisphere, mean SPL_dBA difference ' + str(round(comparison.mean_error,2)) + ' dB, maximum ' +
+          str(round(comparison.maximum_error,2)) + ' dB')
+    return comparison
@@ -0,0 +1,295 @@
+# Noise_Metrics.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import pickle
+import numpy as np
+
+import Noise_Settings
+
+# hours of the day with the night time penalty of L_dn, 22:00 to 07:00
+NIGHT_START   = 22.
+NIGHT_END     = 7.
+NIGHT_PENALTY = 10.
+
+# ----------------------------------------------------------------------
+#   Noise Metrics
+# ----------------------------------------------------------------------
+def noise_metrics(results,thresholds = [55.],background_noise = 35.,start_time = 0.):
+    """Computes the community noise metrics of every microphone of a mission by
+    streaming the noise outputs segment by segment. Only one control point of
+    the ground microphone grid is expanded at a time, so memory scales with the
+    number of microphones instead of microphones x control points, unlike
+    post_process_noise_data. add_noise_metrics accumulates the same metrics
+    while the mission is evaluated.
+
+    Assumptions:
+    See accumulate_segment_noise
+
+    Source:
+    None
+
+    Inputs:
+    results           - results of mission.evaluate() or of a noise replay, or the
+                        filename of a results pickle (with extension)
+    thresholds        - levels of the time above threshold metrics       [dBA]
+    background_noise  - level of microphones outside the stencil        [dBA]
+    start_time        - time of day at the start of the mission         [s]
+
+    Outputs:
+    metrics           - see finalize_noise_metrics
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(results,str):
+        with open(results, 'rb') as file:
+            results = pickle.load(file)
+
+    running = Running_Noise_Metrics(thresholds,background_noise,start_time)
+    for segment in results.segments.values():
+        running(segment)
+    return running.finalize()
+
+# ----------------------------------------------------------------------
+#   Add Noise Metrics
+# ----------------------------------------------------------------------
+def add_noise_metrics(mission,thresholds = [55.],background_noise = 35.,start_time = 0.):
+    """Accumulates the noise metrics of a mission while it is evaluated, as the last
+    post-processing step of every segment, so no dense history of the ground
+    microphone grid is assembled afterwards.
+
+    Assumptions:
+    The mission is evaluated once; the noise outputs are computed in an earlier
+    post-processing step of the segment. See accumulate_segment_noise
+
+    Source:
+    None
+
+    Inputs:
+    mission           - mission of segments, before evaluation
+    others            - see noise_metrics
+
+    Outputs:
+    running           - Running_Noise_Metrics, running.finalize() returns the
+                        metrics once the mission is evaluated
+
+    Properties Used:
+    N/A
+    """
+    running = Running_Noise_Metrics(thresholds,background_noise,start_time)
+    for segment in mission.segments.values():
+        segment.process.finalize.post_process.noise_metrics = running
+    return running
+
+# ----------------------------------------------------------------------
+#   Running Noise Metrics
+# ----------------------------------------------------------------------
+class Running_Noise_Metrics():
+    """Segment step that adds the noise of each segment it is called with to the
+    running sums, e.g. as a post-processing step of the mission or from
+    Noise_Replay.write_replayed_noise.
+
+    Assumptions:
+    Segments are passed in time order. Segments without noise outputs are skipped
+
+    Source:
+    None
+    """
+    def __init__(self,thresholds = [55.],background_noise = 35.,start_time = 0.):
+        self.thresholds       = thresholds
+        self.background_noise = background_noise
+        self.start_time       = start_time
+        self.metrics          = None
+
+    def __call__(self,segment):
+        if 'noise' not in segment.conditions or 'total_SPL_dBA' not in segment.conditions.noise:
+            return
+        if self.metrics == None:
+            self.metrics = initialize_noise_metrics(segment,self.thresholds,self.background_noise,self.start_time)
+        accumulate_segment_noise(self.metrics,segment)
+        return
+
+    def finalize(self):
+        if self.metrics == None:
+            raise ValueError('No segment accumulated holds noise outputs')
+        return finalize_noise_metrics(self.metrics)
+
+# ----------------------------------------------------------------------
+#   Initialize Noise Metrics
+# ----------------------------------------------------------------------
+def initialize_noise_metrics(segment,thresholds = [55.],background_noise = 35.,start_time = 0.):
+    """Allocates the running sums of the noise metrics for the microphones of a
+    segment's noise analysis.
+
+    Assumptions:
+    Every segment accumulated later uses the same microphones
+
+    Source:
+    None
+
+    Inputs:
+    segment           - segment of the results with a noise analysis
+    others            - see noise_metrics
+
+    Outputs:
+    metrics           - running sums, one entry per ground and building microphone
+
+    Properties Used:
+    N/A
+    """
+    settings                  = segment.analyses.noise.settings
+    x_resolution,y_resolution = Noise_Settings.settings_names(settings,Noise_Settings.RESOLUTION_SETTINGS)
+    N_gm_x                    = settings[x_resolution]
+    N_gm_y                    = settings[y_resolution]
+    N_bm                      = segment.conditions.noise.get('number_of_building_microphones',0)
+    N_mic                     = N_gm_x*N_gm_y + N_bm
+
+    metrics                   = Data()
+    metrics.N_gm_x            = N_gm_x
+    metrics.N_gm_y            = N_gm_y
+    metrics.N_bm              = N_bm
+    metrics.thresholds        = np.atleast_1d(thresholds)
+    metrics.background_noise  = background_noise
+    metrics.start_time        = start_time
+    metrics.maximum           = np.ones(N_mic)*background_noise
+    metrics.energy            = np.zeros(N_mic)
+    metrics.weighted_energy   = np.zeros(N_mic)
+    metrics.time_above        = np.zeros((len(metrics.thresholds),N_mic))
+    metrics.duration          = 0.
+    metrics.previous_time     = None
+    metrics.previous_SPL      = None
+    if 'total_ground_microphone_locations' in segment.conditions.noise:
+        metrics.ground_microphone_locations = segment.conditions.noise.total_ground_microphone_locations[0].reshape(N_gm_x,N_gm_y,3)
+    return metrics
+
+# ----------------------------------------------------------------------
+#   Accumulate Segment Noise
+# ----------------------------------------------------------------------
+def accumulate_segment_noise(metrics,segment):
+    """Adds the noise of one segment to the running sums. Energies are integrated
+    with the trapezoidal rule between consecutive control points, carrying the
+    last control point over to the next segment, so segments may be accumulated
+    as soon as they are evaluated or replayed.
+
+    Assumptions:
+    Segments are accumulated in time order. Microphones outside the stencil of a
+    control point, microphones without a level (NaN), and all microphones of
+    segments with battery_discharge False, are at the background level; computed
+    levels are kept as they are. The stencil window of a control point is read
+    from ground_microphone_stencil_locations, so stencils of different sizes, e.g.
+    the full-grid window of Adaptive_Stencil, are placed correctly. A level
+    crossing a threshold between two control points is above it for half of the
+    interval
+
+    Source:
+    None
+
+    Inputs:
+    metrics                                        - see initialize_noise_metrics
+    segment.conditions.frames.inertial.time        [s]
+    segment.conditions.noise.total_SPL_dBA         [dBA]
+    segment.conditions.noise.ground_microphone_stencil_locations
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    conditions = segment.conditions
+    time       = conditions.frames.inertial.time[:,0]
+    N_gm       = metrics.N_gm_x*metrics.N_gm_y
+    N_bm       = metrics.N_bm
+    quiet      = segment.get('battery_discharge',True) == False or 'total_SPL_dBA' not in conditions.noise
+    stencil    = not quiet and 'ground_microphone_stencil_locations' in conditions.noise
+
+    for j in range(len(time)):
+        SPL = np.ones(N_gm + N_bm)*metrics.background_noise
+        if stencil:
+            x0,x1,y0,y1 = [int(index) for index in conditions.noise.ground_microphone_stencil_locations[j]]
+            levels      = np.nan_to_num(conditions.noise.total_SPL_dBA[j],nan = metrics.background_noise)
+            ground      = SPL[:N_gm].reshape(metrics.N_gm_x,metrics.N_gm_y)
+            ground[x0:x1,y0:y1] = levels[:(x1 - x0)*(y1 - y0)].reshape(x1 - x0,y1 - y0)
+            if N_bm > 0:
+                SPL[N_gm:] = levels[-N_bm:]
+        elif not quiet:
+            SPL[:] = np.nan_to_num(conditions.noise.total_SPL_dBA[j,:N_gm + N_bm],nan = metrics.background_noise)
+        accumulate_control_point(metrics,time[j],SPL)
+    return
+
+# ----------------------------------------------------------------------
+#   Accumulate Control Point
+# ----------------------------------------------------------------------
+def accumulate_control_point(metrics,time,SPL):
+    metrics.maximum = np.maximum(metrics.maximum,SPL)
+    if metrics.previous_time != None and time > metrics.previous_time:
+        dt        = time - metrics.previous_time
+        intensity = 0.5*(10**(metrics.previous_SPL/10) + 10**(SPL/10))
+        hour      = ((metrics.start_time + 0.5*(time + metrics.previous_time))/3600.) % 24.
+        penalty   = NIGHT_PENALTY if (hour >= NIGHT_START or hour < NIGHT_END) else 0.
+
+        metrics.energy          += intensity*dt
+        metrics.weighted_energy += intensity*(10**(penalty/10))*dt
+        for i,threshold in enumerate(metrics.thresholds):
+            metrics.time_above[i] += 0.5*dt*((metrics.previous_SPL > threshold)*1. + (SPL > threshold)*1.)
+        metrics.duration        += dt
+    metrics.previous_time = time
+    metrics.previous_SPL  = SPL
+    return
+
+# ----------------------------------------------------------------------
+#   Finalize Noise Metrics
+# ----------------------------------------------------------------------
+def finalize_noise_metrics(metrics):
+    """Converts the running sums into noise metrics, reshaping the ground
+    microphones to the grid.
+
+    Assumptions:
+    L_dn is averaged over the whole days spanned by the accumulated time
+
+    Source:
+    Federal Aviation Administration, "Aviation Environmental Design Tool (AEDT)
+    Technical Manual", for the definitions of SEL, Leq and L_dn
+
+    Inputs:
+    metrics  - see initialize_noise_metrics
+
+    Outputs:
+    noise_metrics.<metric>_ground    - (N_gm_x, N_gm_y) ground microphones
+    noise_metrics.<metric>_building  - (N_bm) building microphones
+    with <metric>:
+    Lmax         - maximum level                           [dBA]
+    SEL          - sound exposure level, 1 s reference     [dBA]
+    Leq          - equivalent level over the duration      [dBA]
+    L_dn         - day-night average level                 [dBA]
+    time_above   - (thresholds, ...) time above threshold  [s]
+    noise_metrics.thresholds, duration, ground_microphone_locations
+
+    Properties Used:
+    N/A
+    """
+    duration = max(metrics.duration,1E-12)
+    days     = max(np.ceil(metrics.duration/86400.),1.)
+    energy   = np.maximum(metrics.energy,1E-12)
+    values   = Data()
+    values.Lmax       = metrics.maximum
+    values.SEL        = 10*np.log10(energy)
+    values.Leq        = 10*np.log10(energy/duration)
+    values.L_dn       = 10*np.log10(np.maximum(metrics.weighted_energy,1E-12)/(86400.*days))
+    values.time_above = metrics.time_above
+
+    N_gm          = metrics.N_gm_x*metrics.N_gm_y
+    noise_metrics = Data()
+    for name,value in values.items():
+        noise_metrics[name + '_ground']   = value[...,:N_gm].reshape(value.shape[:-1] + (metrics.N_gm_x,metrics.N_gm_y))
+        noise_metrics[name + '_building'] = value[...,N_gm:]
+    noise_metrics.thresholds = metrics.thresholds
+    noise_metrics.duration   = metrics.duration
+    if 'ground_microphone_locations' in metrics:
+        noise_metrics.ground_microphone_locations = metrics.ground_microphone_locations
+    return noise_metrics
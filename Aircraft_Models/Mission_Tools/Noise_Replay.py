@@ -0,0 +1,444 @@
+# Noise_Replay.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import multiprocessing
+import functools
+import pickle
+import copy
+import time
+import numpy as np
+
+import Rotor_Source_Cache
+
+# worker state, populated once per process by initialize_worker
+_worker = Data()
+
+# segment conditions read by the noise evaluation, sliced to the control points of a task
+CONTROL_POINT_CONDITIONS = ['freestream','aerodynamics','frames','propulsion','noise.sources']
+
+# ----------------------------------------------------------------------
+#   Replay Noise
+# ----------------------------------------------------------------------
+def replay_noise(results,noise_setup,number_of_workers = None,control_points_per_task = None,cache_sources = True,
+                 noise_metrics = None):
+    """Evaluates the noise of a converged trajectory as a post-pass. Noise does not
+    feed back into the flight dynamics, so the mission can be solved once with the
+    noise model disabled and replayed for any number of microphone grids, building
+    microphone sets or noise settings. Segments, or blocks of control points of a
+    segment, are distributed over a process pool and the noise outputs are written
+    back into the results, in the same place mission.evaluate() would have put them.
+
+    Assumptions:
+    The rotor source data of every segment is stored in conditions.noise.sources
+    during the mission solve, which the networks do with or without a noise
+    analysis. The noise evaluation reads no conditions outside
+    CONTROL_POINT_CONDITIONS
+
+    Source:
+    None
+
+    Inputs:
+    results                  - results of mission.evaluate(), or the filename of a
+                               results pickle (with extension)
+    noise_setup              - function(vehicle) returning the noise analysis of a
+                               configuration, e.g. a functools.partial of
+                               <Model>_Analyses.noise_analysis_setup
+    number_of_workers        - size of the process pool, defaults to the cpu count.
+                               A single worker runs in the calling process
+    control_points_per_task  - control points evaluated per task, defaults to a
+                               whole segment per task
+    cache_sources            - reuse observer independent rotor source terms, see
+                               Rotor_Source_Cache
+    noise_metrics            - Noise_Metrics.Running_Noise_Metrics the replayed segments
+                               are accumulated into as they are written, or None
+
+    Outputs:
+    results                  - results with conditions.noise outputs and analyses.noise
+                               of every segment replaced by the replayed ones
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(results,str):
+        with open(results, 'rb') as file:
+            results = pickle.load(file)
+
+    replayed = evaluate_replay(results,[noise_setup],number_of_workers,control_points_per_task,cache_sources)
+    write_replayed_noise(results,noise_setup,replayed[0],noise_metrics)
+    return results
+
+# ----------------------------------------------------------------------
+#   Replay Quadrants
+# ----------------------------------------------------------------------
+def replay_quadrants(results_file,quadrants,noise_setup,settings,filename_prefix,filename_suffix = '',number_of_workers = None,
+                     cache_sources = True):
+    """Replays the noise of one trajectory over every acoustic quadrant and pickles
+    the results per quadrant under the names Quadrant_Runner.run_quadrants uses,
+    so that stitch_quadrant_results applies unchanged. All quadrants share one
+    process pool, so rotor source terms computed for one quadrant are reused by
+    the others.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    results_file       - results pickle of the trajectory (with extension)
+    quadrants          - list of quadrants from Quadrant_Runner.setup_quadrants
+    noise_setup        - function(vehicle,quadrant,settings) returning the noise analysis
+    settings           - simulation parameters passed through to noise_setup
+    filename_prefix    - results filename before the quadrant tag
+    filename_suffix    - results filename after the quadrant tag
+    number_of_workers  - see replay_noise
+    cache_sources      - see replay_noise
+
+    Outputs:
+    filenames          - results filenames ordered by quadrant index (no extension)
+
+    Properties Used:
+    N/A
+    """
+    with open(results_file, 'rb') as file:
+        results = pickle.load(file)
+
+    setups   = [functools.partial(noise_setup,quadrant = quadrant,settings = settings) for quadrant in quadrants]
+    replayed = evaluate_replay(results,setups,number_of_workers,None,cache_sources)
+
+    filenames = []
+    for quadrant,setup,outputs in zip(quadrants,setups,replayed):
+        write_replayed_noise(results,setup,outputs)
+        filename = filename_prefix + '_Q' + str(quadrant.index) + filename_suffix
+        with open(filename + '.pkl', 'wb') as file:
+            pickle.dump(results, file)
+        filenames.append(filename)
+    return filenames
+
+# ----------------------------------------------------------------------
+#   Evaluate Replay
+# ----------------------------------------------------------------------
+def evaluate_replay(results,noise_setups,number_of_workers = None,control_points_per_task = None,cache_sources = True):
+    """Evaluates every noise setup over every block of control points of the
+    trajectory on one process pool.
+
+    Assumptions:
+    One task evaluates every noise setup over one block of control points, so the
+    rotor source terms of the block are computed once and reused by every other
+    noise setup in the rotor source cache of the worker
+
+    Source:
+    None
+
+    Inputs:
+    results       - results of mission.evaluate()
+    noise_setups  - list of functions(vehicle) returning a noise analysis
+    others        - see replay_noise
+
+    Outputs:
+    replayed      - per noise setup, list of (segment index, first control point,
+                    outputs, settings) of every block
+
+    Properties Used:
+    N/A
+    """
+    ti    = time.time()
+    tasks = []
+    for idx,segment in enumerate(results.segments.values()):
+        N_ctrl_pts = number_of_control_points(segment)
+        block      = N_ctrl_pts if control_points_per_task == None else control_points_per_task
+        for start in range(0,N_ctrl_pts,block):
+            tasks.append((idx,start,min(start + block,N_ctrl_pts)))
+
+    if number_of_workers == None:
+        number_of_workers = multiprocessing.cpu_count()
+    number_of_workers = max(1,min(number_of_workers,len(tasks)))
+
+    outputs = []
+    if number_of_workers == 1:
+        initialize_worker(results,noise_setups,cache_sources)
+        outputs = [evaluate_task(task) for task in tasks]
+        if cache_sources:
+            Rotor_Source_Cache.disable_source_cache()
+    else:
+        pool = multiprocessing.Pool(processes = number_of_workers, initializer = initialize_worker,
+                                    initargs = (results,noise_setups,cache_sources))
+        try:
+            for output in pool.imap_unordered(evaluate_task,tasks):
+                outputs.append(output)
+                print('Replayed ' + str(len(outputs)) + ' of ' + str(len(tasks)) + ' noise tasks')
+        finally:
+            pool.close()
+            pool.join()
+
+    if cache_sources:
+        # aggregated over all workers
+        statistics        = Data()
+        statistics.hits   = sum([output[3].hits for output in outputs])
+        statistics.misses = sum([output[3].misses for output in outputs])
+        Rotor_Source_Cache.print_source_cache_statistics(statistics)
+
+    replayed = [[] for grid in range(len(noise_setups))]
+    for idx,start,grids,statistics in outputs:
+        for grid,(block_outputs,settings) in enumerate(grids):
+            replayed[grid].append((idx,start,block_outputs,settings))
+
+    tf = time.time()
+    print('Noise replay time taken: ' + str(round(((tf-ti)/60),3)) + ' mins')
+    return replayed
+
+# ----------------------------------------------------------------------
+#   Write Replayed Noise
+# ----------------------------------------------------------------------
+def write_replayed_noise(results,noise_setup,replayed,noise_metrics = None):
+    """Writes the replayed blocks of one noise setup back into the results in
+    control point order, accumulating each written segment into noise_metrics.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    results        - results of mission.evaluate()
+    noise_setup    - function(vehicle) returning the noise analysis
+    replayed       - list of (segment index, first control point, outputs, settings)
+    noise_metrics  - Noise_Metrics.Running_Noise_Metrics, or None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    noise_analyses = {}
+    for idx,segment in enumerate(results.segments.values()):
+        blocks = sorted([block for block in replayed if block[0] == idx], key = lambda block: block[1])
+        if len(blocks) == 0:
+            continue
+        outputs  = stack_outputs([block[2] for block in blocks])
+        geometry = segment.analyses.aerodynamics.geometry
+        if geometry.tag not in noise_analyses:
+            noise_analyses[geometry.tag]          = noise_setup(geometry)
+            noise_analyses[geometry.tag].settings = blocks[0][3]
+        segment.analyses.noise = noise_analyses[geometry.tag]
+        for name,value in outputs.items():
+            segment.conditions.noise[name] = value
+        if noise_metrics != None:
+            noise_metrics(segment)
+    return
+
+# ----------------------------------------------------------------------
+#   Initialize Worker
+# ----------------------------------------------------------------------
+def initialize_worker(results,noise_setups,cache_sources = True):
+    """Stores the trajectory and noise setups for the calling process and enables
+    the rotor source cache. Noise analyses are built lazily, once per noise setup
+    and configuration.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    results        - see replay_noise, already loaded
+    noise_setups   - see evaluate_replay
+    cache_sources  - see replay_noise
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    _worker.results      = results
+    _worker.noise_setups = noise_setups
+    _worker.noise        = {}
+    if cache_sources:
+        Rotor_Source_Cache.enable_source_cache()
+    return
+
+# ----------------------------------------------------------------------
+#   Evaluate Task
+# ----------------------------------------------------------------------
+def evaluate_task(task):
+    """Evaluates every noise setup over a block of control points of one segment.
+
+    Assumptions:
+    initialize_worker has been called in this process
+
+    Source:
+    None
+
+    Inputs:
+    task        - (segment index, first control point, end control point)
+
+    Outputs:
+    task[0], task[1]
+    grids       - per noise setup, (outputs, settings) of the block:
+                  outputs  - Data of the noise outputs of the block (sources excluded)
+                  settings - noise settings after evaluation, holding the microphone locations
+    statistics  - rotor source cache hits and misses of the task
+
+    Properties Used:
+    N/A
+    """
+    idx,start,end = task
+    segment       = list(_worker.results.segments.values())[idx]
+    geometry      = segment.analyses.aerodynamics.geometry
+    hits          = Rotor_Source_Cache.source_cache_statistics.hits
+    misses        = Rotor_Source_Cache.source_cache_statistics.misses
+
+    grids = []
+    for grid in range(len(_worker.noise_setups)):
+        key = (grid,geometry.tag)
+        if key not in _worker.noise:
+            noise = _worker.noise_setups[grid](geometry)
+            noise.finalize()
+            _worker.noise[key] = noise
+        noise  = _worker.noise[key]
+        replay = replay_segment(segment,start,end,noise)
+        noise.evaluate_noise(replay)
+        grids.append((noise_outputs(replay.state.conditions.noise,end - start),noise.settings))
+
+    statistics        = Data()
+    statistics.hits   = Rotor_Source_Cache.source_cache_statistics.hits - hits
+    statistics.misses = Rotor_Source_Cache.source_cache_statistics.misses - misses
+    return idx, start, grids, statistics
+
+# ----------------------------------------------------------------------
+#   Number of Control Points
+# ----------------------------------------------------------------------
+def number_of_control_points(segment):
+    return len(segment.conditions.frames.inertial.time[:,0])
+
+# ----------------------------------------------------------------------
+#   Replay Segment
+# ----------------------------------------------------------------------
+def replay_segment(segment,start,end,noise):
+    """Builds a shallow copy of a solved segment restricted to a block of control
+    points and carrying the replay noise analysis. The solved segment is not
+    modified.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    segment  - solved segment of the results
+    start    - first control point of the block
+    end      - end control point of the block (exclusive)
+    noise    - noise analysis
+
+    Outputs:
+    replay   - segment evaluable by noise.evaluate_noise
+
+    Properties Used:
+    N/A
+    """
+    conditions = slice_control_points(segment.state.conditions,start,end,number_of_control_points(segment))
+
+    replay                = copy.copy(segment)
+    replay.state          = copy.copy(segment.state)
+    replay.state.numerics = copy.copy(segment.state.numerics)
+    replay.state.numerics.number_control_points = end - start
+    replay.state.conditions = conditions
+    if 'conditions' in segment:
+        replay.conditions = conditions
+    replay.analyses       = copy.copy(segment.analyses)
+    replay.analyses.noise = noise
+    return replay
+
+# ----------------------------------------------------------------------
+#   Slice Control Points
+# ----------------------------------------------------------------------
+def slice_control_points(conditions,start,end,N_ctrl_pts,paths = None):
+    """Shallow copy of segment conditions with the subtrees read by the noise
+    evaluation restricted to a block of control points.
+
+    Assumptions:
+    Every array under the paths whose first dimension is the number of control
+    points is indexed by control point, as SUAVE conditions are. Conditions
+    outside the paths are shared with the solved segment, not sliced
+
+    Source:
+    None
+
+    Inputs:
+    conditions  - segment.state.conditions of a solved segment
+    start       - first control point of the block
+    end         - end control point of the block (exclusive)
+    N_ctrl_pts  - number of control points of the segment
+    paths       - dotted condition paths, defaults to CONTROL_POINT_CONDITIONS
+
+    Outputs:
+    sliced      - conditions of the block
+
+    Properties Used:
+    N/A
+    """
+    if paths == None:
+        paths = CONTROL_POINT_CONDITIONS
+    sliced = copy.copy(conditions)
+    for path in paths:
+        names  = path.split('.')
+        target = sliced
+        source = conditions
+        for name in names[:-1]:
+            if name not in source:
+                break
+            # copy each parent once, so paths below the same parent are all kept
+            if target[name] is source[name]:
+                target[name] = copy.copy(source[name])
+            target = target[name]
+            source = source[name]
+        else:
+            if names[-1] in source:
+                target[names[-1]] = slice_tree(source[names[-1]],start,end,N_ctrl_pts)
+    return sliced
+
+def slice_tree(value,start,end,N_ctrl_pts):
+    if isinstance(value,dict):
+        sliced = copy.copy(value)
+        for name,item in value.items():
+            sliced[name] = slice_tree(item,start,end,N_ctrl_pts)
+        return sliced
+    if isinstance(value,np.ndarray) and value.ndim > 0 and value.shape[0] == N_ctrl_pts:
+        return value[start:end]
+    return value
+
+# ----------------------------------------------------------------------
+#   Noise Outputs
+# ----------------------------------------------------------------------
+def noise_outputs(data,N_ctrl_pts):
+    outputs = Data()
+    for name,value in data.items():
+        if name == 'sources':
+            continue
+        if isinstance(value,dict):
+            outputs[name] = noise_outputs(value,N_ctrl_pts)
+        elif isinstance(value,np.ndarray) and value.ndim > 0 and value.shape[0] == N_ctrl_pts:
+            outputs[name] = value
+    return outputs
+
+# ----------------------------------------------------------------------
+#   Stack Outputs
+# ----------------------------------------------------------------------
+def stack_outputs(blocks):
+    stacked = Data()
+    for name,value in blocks[0].items():
+        if isinstance(value,dict):
+            stacked[name] = stack_outputs([block[name] for block in blocks])
+        else:
+            stacked[name] = np.concatenate([block[name] for block in blocks],axis = 0)
+    return stacked
@@ -0,0 +1,43 @@
+# Noise_Settings.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+
+# names of the ground microphone grid settings, in the order they are looked up. Names differ
+# between noise analyses, level ground analyses generate their grid from level_ground_microphone_*
+RESOLUTION_SETTINGS = [('ground_microphone_x_resolution','ground_microphone_y_resolution'),
+                       ('microphone_x_resolution','microphone_y_resolution'),
+                       ('level_ground_microphone_x_resolution','level_ground_microphone_y_resolution')]
+STENCIL_SETTINGS    = [('ground_microphone_x_stencil','ground_microphone_y_stencil'),
+                       ('microphone_x_stencil','microphone_y_stencil')]
+LOCATION_SETTINGS   = ['ground_microphone_locations','microphone_locations']
+
+# ----------------------------------------------------------------------
+#   Settings Names
+# ----------------------------------------------------------------------
+def settings_names(settings,candidates):
+    """Returns the first pair of names of candidates that are both noise settings.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    settings    - noise analysis settings
+    candidates  - list of (x, y) names, e.g. RESOLUTION_SETTINGS
+
+    Outputs:
+    names       - (x, y) names
+
+    Properties Used:
+    N/A
+    """
+    for names in candidates:
+        if names[0] in settings and names[1] in settings:
+            return names
+    raise AttributeError('Noise settings have none of ' + str(candidates))
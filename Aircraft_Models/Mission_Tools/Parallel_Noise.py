@@ -0,0 +1,577 @@
+# Parallel_Noise.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity import propeller_mid_fidelity
+from multiprocessing import shared_memory
+import multiprocessing
+import itertools
+import atexit
+import pickle
+import copy
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+# prefix of the modules whose propeller noise function is replaced by the parallel one
+NOISE_MODULES = 'SUAVE'
+
+# worker state, the inputs of the call being evaluated, loaded once per call by load_call
+_worker = Data()
+
+# process pool shared by every call until close_noise_pool, e.g. all segments of a mission
+_pool       = Data()
+_pool.pool  = None
+_pool.size  = 0
+# set by serial_noise, e.g. while memory is traced, which tracemalloc does in this process only
+_pool.serial = False
+_call_index = itertools.count()
+
+# ----------------------------------------------------------------------
+#   Parallel Propeller Noise
+# ----------------------------------------------------------------------
+def parallel_propeller_noise(propellers,acoustic_outputs,segment,settings,minimum_microphones_per_worker = 64,chunks_per_worker = 2):
+    """Drop-in replacement of propeller_mid_fidelity that splits the microphones
+    over a process pool. The pool is started on the first call and reused by every
+    later call, e.g. every segment of a mission, until close_noise_pool. The
+    microphone locations and the pickled rotor source data of a call are placed in
+    shared memory once, and every worker loads them once per call. Each task
+    evaluates a contiguous block of microphones and leaves its microphone
+    dependent outputs in a shared memory block, so only their names and shapes
+    travel back through the pipe before they are gathered.
+
+    Assumptions:
+    Microphones are independent. Outputs whose first two dimensions are
+    (control points, microphones) are split by microphone, all others are taken
+    from the first block. Pools are not nested: inside a daemonic worker, e.g. of
+    Noise_Replay, and while serial_noise is set, the microphones are evaluated
+    serially
+
+    Source:
+    None
+
+    Inputs:
+    propellers, acoustic_outputs, segment   - see propeller_mid_fidelity
+    settings.parallel_computing             - evaluate in parallel
+    settings.number_of_multiprocessing_workers - size of the process pool
+    settings.microphone_chunk_size          - microphones evaluated at once, by the
+                                              serial evaluation or by a worker, all
+                                              when not set, see microphone_chunk_size
+    minimum_microphones_per_worker          - smaller grids use fewer workers
+    chunks_per_worker                       - blocks of microphones per worker
+
+    Outputs:
+    propeller_noise                         - see propeller_mid_fidelity
+
+    Properties Used:
+    N/A
+    """
+    noise          = segment.state.conditions.noise
+    locations      = noise.total_microphone_locations
+    N_mic          = locations.shape[1]
+
+    number_of_workers = 1
+    if settings.get('parallel_computing',False):
+        number_of_workers = settings.get('number_of_multiprocessing_workers',multiprocessing.cpu_count())
+    number_of_workers = max(1,min(number_of_workers,N_mic//minimum_microphones_per_worker))
+    if number_of_workers == 1 or _pool.serial or multiprocessing.current_process().daemon:
+        return serial_propeller_noise(propellers,acoustic_outputs,segment,settings)
+
+    bounds = np.linspace(0,N_mic,min(number_of_workers*chunks_per_worker,N_mic) + 1).astype(int)
+    tasks  = [(bounds[i],bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+    shared = shared_memory.SharedMemory(create = True, size = max(locations.nbytes,1))
+    np.ndarray(locations.shape,dtype = locations.dtype,buffer = shared.buf)[:] = locations
+    noise.total_microphone_locations = None
+    payload = None
+    try:
+        inputs  = pickle.dumps((propellers,acoustic_outputs,segment,settings),protocol = pickle.HIGHEST_PROTOCOL)
+        payload = shared_memory.SharedMemory(create = True, size = max(len(inputs),1))
+        payload.buf[:len(inputs)] = inputs
+        call    = (next(_call_index),payload.name,len(inputs),shared.name,locations.shape,locations.dtype.str)
+        blocks  = list(noise_pool(number_of_workers).imap_unordered(evaluate_microphones,[(call,task) for task in tasks]))
+    finally:
+        noise.total_microphone_locations = locations
+        shared.close()
+        shared.unlink()
+        if payload != None:
+            payload.close()
+            payload.unlink()
+
+    blocks = sorted(blocks,key = lambda block: block[0])
+    return gather_outputs([block[1] for block in blocks])
+
+# ----------------------------------------------------------------------
+#   Noise Pool
+# ----------------------------------------------------------------------
+def noise_pool(number_of_workers):
+    """Returns the process pool of the parallel propeller noise, starting it on
+    first use and restarting it only if a different size is requested.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    number_of_workers  - size of the process pool
+
+    Outputs:
+    pool               - multiprocessing pool
+
+    Properties Used:
+    N/A
+    """
+    if _pool.pool != None and _pool.size != number_of_workers:
+        close_noise_pool()
+    if _pool.pool == None:
+        _pool.pool = multiprocessing.Pool(processes = number_of_workers)
+        _pool.size = number_of_workers
+    return _pool.pool
+
+# ----------------------------------------------------------------------
+#   Close Noise Pool
+# ----------------------------------------------------------------------
+def close_noise_pool():
+    if _pool.pool != None:
+        _pool.pool.close()
+        _pool.pool.join()
+        _pool.pool = None
+        _pool.size = 0
+    return
+
+atexit.register(close_noise_pool)
+
+# ----------------------------------------------------------------------
+#   Serial Noise
+# ----------------------------------------------------------------------
+def serial_noise(serial = True):
+    """Makes parallel_propeller_noise evaluate in this process, whatever the
+    noise settings, e.g. while its memory is traced.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    serial     - evaluate serially
+
+    Outputs:
+    previous   - previous value, to restore it with
+
+    Properties Used:
+    N/A
+    """
+    previous     = _pool.serial
+    _pool.serial = serial
+    return previous
+
+# ----------------------------------------------------------------------
+#   Load Call
+# ----------------------------------------------------------------------
+def load_call(call):
+    """Loads the rotor source data and attaches the microphone locations of a call
+    in a pool worker, once per call, releasing those of the previous call.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    call    - (call index, payload name, payload size, locations name, shape, dtype)
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    index,payload_name,payload_size,name,shape,dtype = call
+    if _worker.get('index',None) == index:
+        return
+    if _worker.get('shared',None) != None:
+        _worker.locations = None
+        _worker.shared.close()
+    payload = shared_memory.SharedMemory(name = payload_name)
+    propellers,acoustic_outputs,segment,settings = pickle.loads(bytes(payload.buf[:payload_size]))
+    payload.close()
+    _worker.index            = index
+    _worker.propellers       = propellers
+    _worker.acoustic_outputs = acoustic_outputs
+    _worker.segment          = segment
+    _worker.settings         = settings
+    _worker.shared           = shared_memory.SharedMemory(name = name)
+    _worker.locations        = np.ndarray(shape,dtype = np.dtype(dtype),buffer = _worker.shared.buf)
+    return
+
+# ----------------------------------------------------------------------
+#   Evaluate Microphones
+# ----------------------------------------------------------------------
+def evaluate_microphones(task):
+    """Evaluates the propeller noise at a block of microphones and stores the
+    microphone dependent outputs in shared memory.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    task      - (call, (first microphone, end microphone)), see load_call
+
+    Outputs:
+    task[0]
+    outputs   - Data of the outputs, shared memory handles for the split ones
+
+    Properties Used:
+    N/A
+    """
+    call,(start,end) = task
+    load_call(call)
+    segment         = microphone_segment(_worker.segment,_worker.locations[:,start:end])
+    propeller_noise = serial_propeller_noise(_worker.propellers,_worker.acoustic_outputs,segment,_worker.settings)
+    return start, share_outputs(propeller_noise,_worker.locations.shape[0],end - start)
+
+# ----------------------------------------------------------------------
+#   Microphone Segment
+# ----------------------------------------------------------------------
+def microphone_segment(segment,locations):
+    """Shallow copy of a segment whose noise conditions hold a block of the
+    microphones, sharing every other condition with the segment.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    segment     - segment of the noise evaluation
+    locations   - (control points, block microphones, 3) microphone locations  [m]
+
+    Outputs:
+    segment     - copy of the segment
+
+    Properties Used:
+    N/A
+    """
+    segment               = copy.copy(segment)
+    segment.state         = copy.copy(segment.state)
+    conditions            = copy.copy(segment.state.conditions)
+    conditions.noise      = copy.copy(conditions.noise)
+    conditions.noise.total_microphone_locations = locations
+    if 'number_of_microphones' in conditions.noise:
+        conditions.noise.number_of_microphones = locations.shape[1]
+    segment.state.conditions = conditions
+    return segment
+
+# ----------------------------------------------------------------------
+#   Serial Propeller Noise
+# ----------------------------------------------------------------------
+def serial_propeller_noise(propellers,acoustic_outputs,segment,settings):
+    chunk_size = settings.get('microphone_chunk_size',None)
+    N_mic      = segment.state.conditions.noise.total_microphone_locations.shape[1]
+    if chunk_size == None or N_mic <= chunk_size:
+        return propeller_mid_fidelity(propellers,acoustic_outputs,segment,settings)
+    return chunked_propeller_noise(propellers,acoustic_outputs,segment,settings,chunk_size)
+
+# ----------------------------------------------------------------------
+#   Chunked Propeller Noise
+# ----------------------------------------------------------------------
+def chunked_propeller_noise(propellers,acoustic_outputs,segment,settings,chunk_size):
+    """Evaluates the propeller noise serially over blocks of microphones, so the
+    temporaries of the noise model, which grow with the number of microphones,
+    only ever hold one block.
+
+    Assumptions:
+    See parallel_propeller_noise
+
+    Source:
+    None
+
+    Inputs:
+    propellers, acoustic_outputs, segment, settings   - see propeller_mid_fidelity
+    chunk_size                                        - microphones per block
+
+    Outputs:
+    propeller_noise                                   - see propeller_mid_fidelity
+
+    Properties Used:
+    N/A
+    """
+    locations = segment.state.conditions.noise.total_microphone_locations
+    N_mic     = locations.shape[1]
+    starts    = range(0,N_mic,chunk_size)
+    blocks    = []
+    for start in starts:
+        block_segment = microphone_segment(segment,locations[:,start:start + chunk_size])
+        blocks.append(propeller_mid_fidelity(propellers,acoustic_outputs,block_segment,settings))
+    return concatenate_outputs(blocks,locations.shape[0],[min(chunk_size,N_mic - start) for start in starts])
+
+# ----------------------------------------------------------------------
+#   Concatenate Outputs
+# ----------------------------------------------------------------------
+def concatenate_outputs(blocks,N_ctrl_pts,block_sizes):
+    outputs = Data()
+    for name,value in blocks[0].items():
+        if isinstance(value,dict):
+            outputs[name] = concatenate_outputs([block[name] for block in blocks],N_ctrl_pts,block_sizes)
+        elif isinstance(value,np.ndarray) and value.ndim > 1 and value.shape[:2] == (N_ctrl_pts,block_sizes[0]):
+            outputs[name] = np.concatenate([block[name] for block in blocks],axis = 1)
+        else:
+            outputs[name] = value
+    return outputs
+
+# ----------------------------------------------------------------------
+#   Microphone Chunk Size
+# ----------------------------------------------------------------------
+def microphone_chunk_size(propellers,acoustic_outputs,segment,settings,memory_budget,probe_microphones = 16):
+    """Number of microphones whose propeller noise can be evaluated at once within
+    a memory budget, from the peak memory of a probe evaluation. The result is
+    meant for settings.microphone_chunk_size.
+
+    Assumptions:
+    The peak memory of the noise model is proportional to the number of
+    microphones evaluated at once
+
+    Source:
+    None
+
+    Inputs:
+    propellers, acoustic_outputs, segment, settings   - see propeller_mid_fidelity
+    memory_budget                                     - peak memory allowed       [bytes]
+    probe_microphones                                 - microphones of the probe
+
+    Outputs:
+    chunk_size                                        - microphones per block
+
+    Properties Used:
+    N/A
+    """
+    locations     = segment.state.conditions.noise.total_microphone_locations
+    probe         = microphone_segment(segment,locations[:,:probe_microphones])
+    tracemalloc.start()
+    propeller_mid_fidelity(propellers,acoustic_outputs,probe,settings)
+    peak          = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    bytes_per_mic = peak/probe.state.conditions.noise.total_microphone_locations.shape[1]
+    return max(1,int(memory_budget/bytes_per_mic))
+
+# ----------------------------------------------------------------------
+#   Share Outputs
+# ----------------------------------------------------------------------
+def share_outputs(data,N_ctrl_pts,N_mic):
+    outputs = Data()
+    for name,value in data.items():
+        if isinstance(value,dict):
+            outputs[name] = share_outputs(value,N_ctrl_pts,N_mic)
+        elif isinstance(value,np.ndarray) and value.ndim > 1 and value.shape[:2] == (N_ctrl_pts,N_mic):
+            block = shared_memory.SharedMemory(create = True, size = max(value.nbytes,1))
+            np.ndarray(value.shape,dtype = value.dtype,buffer = block.buf)[:] = value
+            outputs[name] = ('shared',block.name,value.shape,value.dtype.str)
+            block.close()
+        else:
+            outputs[name] = value
+    return outputs
+
+# ----------------------------------------------------------------------
+#   Gather Outputs
+# ----------------------------------------------------------------------
+def gather_outputs(blocks):
+    gathered = Data()
+    for name,value in blocks[0].items():
+        if isinstance(value,dict):
+            gathered[name] = gather_outputs([block[name] for block in blocks])
+        elif isinstance(value,tuple) and len(value) == 4 and value[0] == 'shared':
+            handles  = [block[name] for block in blocks]
+            shape    = list(value[2])
+            shape[1] = sum([handle[2][1] for handle in handles])
+            array    = np.zeros(shape,dtype = np.dtype(value[3]))
+            start    = 0
+            for handle in handles:
+                block = shared_memory.SharedMemory(name = handle[1])
+                array[:,start:start + handle[2][1]] = np.ndarray(handle[2],dtype = np.dtype(handle[3]),buffer = block.buf)
+                start += handle[2][1]
+                block.close()
+                block.unlink()
+            gathered[name] = array
+        else:
+            gathered[name] = value
+    return gathered
+
+# ----------------------------------------------------------------------
+#   Enable Parallel Noise
+# ----------------------------------------------------------------------
+def enable_parallel_noise(analyses = None,number_of_workers = None,microphone_chunk_size = None):
+    """Routes the propeller noise of the SUAVE noise analyses through
+    parallel_propeller_noise, so that parallel_computing,
+    number_of_multiprocessing_workers and microphone_chunk_size of the noise
+    settings take effect in mission evaluations. One process pool serves the whole
+    mission; it is closed by disable_parallel_noise.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    analyses               - configuration analyses whose noise settings are set to
+                             evaluate in parallel, settings are left as they are if None
+    number_of_workers      - size of the process pool, defaults to the cpu count, 1
+                             evaluates serially
+    microphone_chunk_size  - microphones evaluated at once, all if None
+
+    Outputs:
+    patched                - names of the modules using the parallel propeller noise
+
+    Properties Used:
+    N/A
+    """
+    import SUAVE.Analyses.Noise
+
+    if analyses != None:
+        if number_of_workers == None:
+            number_of_workers = multiprocessing.cpu_count()
+        for analysis in analyses.values():
+            if 'noise' in analysis:
+                analysis.noise.settings.parallel_computing                = True
+                analysis.noise.settings.number_of_multiprocessing_workers = number_of_workers
+                analysis.noise.settings.microphone_chunk_size             = microphone_chunk_size
+
+    patched = []
+    for name,module in list(sys.modules.items()):
+        if not name.startswith(NOISE_MODULES) or module == None:
+            continue
+        if getattr(module,'propeller_mid_fidelity',None) is propeller_mid_fidelity:
+            setattr(module,'propeller_mid_fidelity',parallel_propeller_noise)
+            patched.append(name)
+    return patched
+
+# ----------------------------------------------------------------------
+#   Disable Parallel Noise
+# ----------------------------------------------------------------------
+def disable_parallel_noise():
+    for name,module in list(sys.modules.items()):
+        if name.startswith(NOISE_MODULES) and getattr(module,'propeller_mid_fidelity',None) is parallel_propeller_noise:
+            setattr(module,'propeller_mid_fidelity',propeller_mid_fidelity)
+    close_noise_pool()
+    return
+
+# ----------------------------------------------------------------------
+#   Benchmark Parallel Noise
+# ----------------------------------------------------------------------
+def benchmark_parallel_noise(propellers,acoustic_outputs,segment,settings,worker_counts = [1,2,4,8,12]):
+    """Times the propeller noise for increasing pool sizes and checks the parallel
+    outputs against the serial ones.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    propellers, acoustic_outputs, segment, settings   - see parallel_propeller_noise
+    worker_counts                                     - pool sizes timed
+
+    Outputs:
+    benchmark.workers                                 - pool sizes
+    benchmark.times                                   - wall times           [s]
+    benchmark.speedup                                 - serial time / time
+    benchmark.maximum_error                           - largest SPL_dBA difference to serial [dB]
+
+    Properties Used:
+    N/A
+    """
+    parallel_computing = settings.get('parallel_computing',False)
+    number_of_workers  = settings.get('number_of_multiprocessing_workers',1)
+
+    benchmark         = Data()
+    benchmark.workers = np.array(worker_counts)
+    benchmark.times   = np.zeros(len(worker_counts))
+    benchmark.maximum_error = np.zeros(len(worker_counts))
+    reference = None
+    for i,workers in enumerate(worker_counts):
+        settings.parallel_computing                = workers > 1
+        settings.number_of_multiprocessing_workers = workers
+        ti      = time.time()
+        outputs = parallel_propeller_noise(propellers,acoustic_outputs,segment,settings)
+        benchmark.times[i] = time.time() - ti
+        if reference == None:
+            reference = outputs
+        benchmark.maximum_error[i] = np.max(np.abs(np.nan_to_num(outputs.SPL_dBA) - np.nan_to_num(reference.SPL_dBA)))
+        print('Parallel noise: ' + str(workers) + ' workers, ' + str(round(benchmark.times[i],3)) + ' sec')
+
+    benchmark.speedup = benchmark.times[0]/benchmark.times
+
+    settings.parallel_computing                = parallel_computing
+    settings.number_of_multiprocessing_workers = number_of_workers
+    return benchmark
+
+# ----------------------------------------------------------------------
+#   Benchmark Microphone Chunks
+# ----------------------------------------------------------------------
+def benchmark_microphone_chunks(propellers,acoustic_outputs,segment,settings,chunk_sizes = [None,4096,1024,256]):
+    """Records the peak memory and wall time of the serial propeller noise for
+    decreasing microphone chunk sizes and checks the outputs against the
+    unchunked ones.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    propellers, acoustic_outputs, segment, settings   - see parallel_propeller_noise
+    chunk_sizes                                       - chunk sizes, None for all microphones
+
+    Outputs:
+    benchmark.chunk_sizes                             - microphones per block
+    benchmark.peak_memory                             - peak traced memory   [bytes]
+    benchmark.times                                   - wall times           [s]
+    benchmark.maximum_error                           - largest SPL_dBA difference to unchunked [dB]
+
+    Properties Used:
+    N/A
+    """
+    parallel_computing = settings.get('parallel_computing',False)
+    chunk_size         = settings.get('microphone_chunk_size',None)
+    N_mic              = segment.state.conditions.noise.total_microphone_locations.shape[1]
+
+    benchmark               = Data()
+    benchmark.chunk_sizes   = np.array([N_mic if size == None else min(size,N_mic) for size in chunk_sizes])
+    benchmark.peak_memory   = np.zeros(len(chunk_sizes))
+    benchmark.times         = np.zeros(len(chunk_sizes))
+    benchmark.maximum_error = np.zeros(len(chunk_sizes))
+    settings.parallel_computing = False
+    reference = None
+    for i,size in enumerate(chunk_sizes):
+        settings.microphone_chunk_size = size
+        tracemalloc.start()
+        ti      = time.time()
+        outputs = parallel_propeller_noise(propellers,acoustic_outputs,segment,settings)
+        benchmark.times[i]       = time.time() - ti
+        benchmark.peak_memory[i] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if reference == None:
+            reference = outputs
+        benchmark.maximum_error[i] = np.max(np.abs(np.nan_to_num(outputs.SPL_dBA) - np.nan_to_num(reference.SPL_dBA)))
+        print('Microphone chunks: ' + str(benchmark.chunk_sizes[i]) + ' microphones, peak memory ' +
+              str(round(benchmark.peak_memory[i]/2**20,1)) + ' MB, ' + str(round(benchmark.times[i],3)) + ' sec')
+
+    settings.parallel_computing    = parallel_computing
+    settings.microphone_chunk_size = chunk_size
+    return benchmark
@@ -0,0 +1,212 @@
+# Periodic_Mission.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+import SUAVE
+from SUAVE.Core import Data
+import numpy as np
+
+# battery states carried from flight to flight, as stored in segment.conditions.propulsion
+BATTERY_STATES = ['battery_cycle_day','battery_cell_charge_throughput','battery_capacity_fade_factor',
+                  'battery_resistance_growth_factor']
+
+# ----------------------------------------------------------------------
+#   Evaluate Periodic Mission
+# ----------------------------------------------------------------------
+def evaluate_periodic_mission(mission,vehicle,simulated_days,flights_per_day,recharge_battery = True,tolerance = 0.005):
+    """Evaluates simulated_days x flights_per_day identical flights by solving one
+    representative flight and carrying the battery state from flight to flight.
+    The flight is solved again only when capacity fade or resistance growth has
+    drifted by more than tolerance since the last solve. In between, battery
+    ageing is advanced with the update_battery_state_of_health model applied to
+    the last segment of the most recent solve.
+
+    Assumptions:
+    Every flight flies the same trajectory, so energy use and charge throughput per
+    flight only change when the flight is solved again. A recharged battery
+    starts the next flight at its faded capacity
+
+    Source:
+    None
+
+    Inputs:
+    mission            - finalized mission of one flight, e.g. built with
+                         simulated_days = 1 and flights_per_day = 1
+    vehicle            - vehicle, for the battery capacity
+    simulated_days     - number of days
+    flights_per_day    - number of flights per day
+    recharge_battery   - recharge to full between flights
+    tolerance          - allowed drift of fade/growth factors between solves  [-]
+
+    Outputs:
+    periodic.results                 - results of the most recent solve
+    periodic.number_of_solves        - number of flights actually solved
+    periodic.flights                 - per flight arrays: day, flight, solved, initial_energy,
+                                       final_energy, final_state_of_charge, charge_throughput,
+                                       capacity_fade_factor, resistance_growth_factor
+
+    Properties Used:
+    N/A
+    """
+    battery     = vehicle_battery(vehicle)
+    max_energy  = battery.max_energy
+    N_flights   = simulated_days*flights_per_day
+
+    flights = Data()
+    for name in ['day','flight','solved','initial_energy','final_energy','final_state_of_charge',
+                 'charge_throughput','capacity_fade_factor','resistance_growth_factor']:
+        flights[name] = np.zeros(N_flights)
+
+    state                                  = Data()
+    state.battery_energy                   = max_energy
+    state.battery_cycle_day                = 0
+    state.battery_cell_charge_throughput   = 0.
+    state.battery_capacity_fade_factor     = 1.
+    state.battery_resistance_growth_factor = 1.
+
+    results          = None
+    solved_state     = None
+    number_of_solves = 0
+    idx              = 0
+    for day in range(simulated_days):
+        print(' ***********  Day ' + str(day) + ' ***********  ')
+        for f_idx in range(flights_per_day):
+            state.battery_cycle_day = day
+            if recharge_battery:
+                state.battery_energy = max_energy*state.battery_capacity_fade_factor
+
+            resolve = results == None or \
+                abs(state.battery_capacity_fade_factor - solved_state.battery_capacity_fade_factor) > tolerance or \
+                abs(state.battery_resistance_growth_factor - solved_state.battery_resistance_growth_factor) > tolerance
+
+            initial_energy = state.battery_energy
+            if resolve:
+                print('Solving flight ' + str(f_idx + 1) + ' of day ' + str(day))
+                set_initial_battery_state(mission.segments[0],state)
+                results           = mission.evaluate()
+                solved_state      = state.deepcopy()
+                number_of_solves += 1
+
+                first             = results.segments[0].conditions.propulsion
+                last              = results.segments[-1].conditions.propulsion
+                energy_used       = first.battery_energy[0,0] - last.battery_energy[-1,0]
+                throughput_added  = last.battery_cell_charge_throughput[-1,0] - first.battery_cell_charge_throughput[0,0]
+
+                state.battery_energy                   = initial_energy - energy_used
+                state.battery_cell_charge_throughput   = last.battery_cell_charge_throughput[-1,0]
+                state.battery_capacity_fade_factor     = np.min(last.battery_capacity_fade_factor)
+                state.battery_resistance_growth_factor = np.max(last.battery_resistance_growth_factor)
+                final_SOC                              = last.battery_state_of_charge[-1,0]
+            else:
+                state.battery_energy                   = initial_energy - energy_used
+                state.battery_cell_charge_throughput  += throughput_added
+                fade, growth                           = age_battery(results.segments[-1],state)
+                state.battery_capacity_fade_factor     = fade
+                state.battery_resistance_growth_factor = growth
+                final_SOC                              = state.battery_energy/(max_energy*state.battery_capacity_fade_factor)
+
+            flights.day[idx]                      = day
+            flights.flight[idx]                   = f_idx + 1
+            flights.solved[idx]                   = resolve
+            flights.initial_energy[idx]           = initial_energy
+            flights.final_energy[idx]             = state.battery_energy
+            flights.final_state_of_charge[idx]    = final_SOC
+            flights.charge_throughput[idx]        = state.battery_cell_charge_throughput
+            flights.capacity_fade_factor[idx]     = state.battery_capacity_fade_factor
+            flights.resistance_growth_factor[idx] = state.battery_resistance_growth_factor
+            idx += 1
+
+    print('Solved ' + str(number_of_solves) + ' of ' + str(N_flights) + ' flights')
+
+    periodic                  = Data()
+    periodic.results          = results
+    periodic.number_of_solves = number_of_solves
+    periodic.flights          = flights
+    return periodic
+
+# ----------------------------------------------------------------------
+#   Set Initial Battery State
+# ----------------------------------------------------------------------
+def set_initial_battery_state(segment,state):
+    """Sets the battery state the first segment of a flight starts from, as read by
+    initialize_battery.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    segment  - first segment of the flight
+    state    - battery_energy and BATTERY_STATES
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    segment.battery_energy = state.battery_energy
+    for name in BATTERY_STATES:
+        segment[name] = state[name]
+    return
+
+# ----------------------------------------------------------------------
+#   Age Battery
+# ----------------------------------------------------------------------
+def age_battery(segment,state):
+    """Advances capacity fade and resistance growth to the given cycle day and charge
+    throughput without solving the flight, by re-running the state of health model
+    on the conditions of a converged segment.
+
+    Assumptions:
+    Cell temperature, state of charge and voltage histories are those of the most
+    recent solve
+
+    Source:
+    None
+
+    Inputs:
+    segment  - last segment of the most recent solve
+    state    - cycle day, charge throughput, fade and growth at the start of the flight
+
+    Outputs:
+    fade     - capacity fade factor at the end of the flight       [-]
+    growth   - resistance growth factor at the end of the flight   [-]
+
+    Properties Used:
+    N/A
+    """
+    propulsion = segment.conditions.propulsion
+    saved      = Data()
+    for name in BATTERY_STATES:
+        saved[name] = np.copy(propulsion[name])
+
+    ones = np.ones_like(propulsion.battery_cycle_day)
+    propulsion.battery_cycle_day                = ones*state.battery_cycle_day
+    propulsion.battery_cell_charge_throughput   = ones*state.battery_cell_charge_throughput
+    propulsion.battery_capacity_fade_factor     = state.battery_capacity_fade_factor
+    propulsion.battery_resistance_growth_factor = state.battery_resistance_growth_factor
+
+    SUAVE.Methods.Missions.Segments.Common.Energy.update_battery_state_of_health(segment)
+
+    fade   = np.min(propulsion.battery_capacity_fade_factor)
+    growth = np.max(propulsion.battery_resistance_growth_factor)
+
+    # leave the stored results as they were solved
+    for name in BATTERY_STATES:
+        propulsion[name] = saved[name]
+    return fade, growth
+
+# ----------------------------------------------------------------------
+#   Vehicle Battery
+# ----------------------------------------------------------------------
+def vehicle_battery(vehicle):
+    for network in vehicle.networks.values():
+        if 'battery' in network:
+            return network.battery
+    raise ValueError('Vehicle has no network with a battery')
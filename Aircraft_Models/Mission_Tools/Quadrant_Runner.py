@@ -0,0 +1,375 @@
+# Quadrant_Runner.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import multiprocessing
+import pickle
+import time
+import numpy as np
+from copy import deepcopy
+
+import Mission_Profiler
+import Noise_Replay
+
+# worker state, populated once per process by initialize_worker
+_worker = Data()
+
+# ----------------------------------------------------------------------
+#   Setup Quadrants
+# ----------------------------------------------------------------------
+def setup_quadrants(X_LIM,Y_LIM):
+    """Splits the acoustic computational domain into quadrants bounded by
+    consecutive entries of X_LIM and Y_LIM. Quadrants are numbered in the same
+    order as the serial loop in the full mission drivers (x outer, y inner)
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    X_LIM      - longitudinal quadrant boundaries  [m]
+    Y_LIM      - lateral quadrant boundaries       [m]
+
+    Outputs:
+    quadrants  - list of Data with index, x_index, y_index, min_x, max_x, min_y, max_y
+
+    Properties Used:
+    N/A
+    """
+    quadrants = []
+    Q_idx     = 1
+    for i in range(len(X_LIM)-1):
+        for j in range(len(Y_LIM)-1):
+            quadrant         = Data()
+            quadrant.index   = Q_idx
+            quadrant.x_index = i
+            quadrant.y_index = j
+            quadrant.min_x   = X_LIM[i]
+            quadrant.max_x   = X_LIM[i+1]
+            quadrant.min_y   = Y_LIM[j]
+            quadrant.max_y   = Y_LIM[j+1]
+            quadrants.append(quadrant)
+            Q_idx += 1
+    return quadrants
+
+# ----------------------------------------------------------------------
+#   Full Mission Settings
+# ----------------------------------------------------------------------
+def full_mission_settings(simulated_days,flights_per_day,aircraft_range,reserve_segment,recharge_battery,control_points,
+                          run_noise_model,N_gm_x,N_gm_y,warm_start = False,warm_start_file = None,profile_mission = False):
+    """Collects the simulation parameters of a full mission driver into the
+    settings handed to its quadrant_setup and quadrant_noise_setup.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    simulated_days, flights_per_day, aircraft_range, reserve_segment, recharge_battery,
+    control_points, run_noise_model, N_gm_x, N_gm_y  - see the full mission drivers
+    warm_start                                       - seed segment unknowns, see Warm_Start
+    warm_start_file                                  - results pickle of a previous run to warm start from
+    profile_mission                                  - write a timing report per quadrant
+
+    Outputs:
+    settings                                         - Data of the above
+
+    Properties Used:
+    N/A
+    """
+    settings                  = Data()
+    settings.simulated_days   = simulated_days
+    settings.flights_per_day  = flights_per_day
+    settings.aircraft_range   = aircraft_range
+    settings.reserve_segment  = reserve_segment
+    settings.recharge_battery = recharge_battery
+    settings.control_points   = control_points
+    settings.run_noise_model  = run_noise_model
+    settings.N_gm_x           = N_gm_x
+    settings.N_gm_y           = N_gm_y
+    settings.warm_start       = warm_start
+    settings.warm_start_file  = warm_start_file
+    settings.profile_mission  = profile_mission
+    return settings
+
+# ----------------------------------------------------------------------
+#   Run Full Mission
+# ----------------------------------------------------------------------
+def run_full_mission(vehicle_setup,configs_setup,quadrant_setup,quadrant_noise_setup,settings,quadrants,filename_prefix,
+                     number_of_workers = None,noise_replay = False):
+    """Runs a full mission driver over its acoustic quadrants. With the noise model
+    and noise_replay on, the trajectory is solved once without noise in the calling
+    process and its noise is replayed over every quadrant, otherwise every quadrant
+    is evaluated on the process pool. With the noise model on, the quadrant SPL is
+    stitched into one grid and pickled under filename_prefix + '_Noise'.
+
+    Assumptions:
+    See run_quadrants and Noise_Replay.replay_quadrants
+
+    Source:
+    None
+
+    Inputs:
+    vehicle_setup            - function returning the vehicle
+    configs_setup            - function(vehicle) returning the configurations
+    quadrant_setup           - see run_quadrants
+    quadrant_noise_setup     - function(vehicle,quadrant,settings) returning the noise analysis,
+                               only used with noise_replay
+    settings                 - simulation parameters, e.g. from full_mission_settings
+    quadrants                - list of quadrants from setup_quadrants
+    filename_prefix          - e.g. 'Stopped_Rotor_Full_Mission'
+    number_of_workers        - see run_quadrants
+    noise_replay             - solve the trajectory once, then replay the noise of every quadrant
+
+    Outputs:
+    results                  - results of the last quadrant
+    noise_data               - stitched ground microphone SPL, see stitch_quadrant_results,
+                               None without the noise model
+
+    Properties Used:
+    N/A
+    """
+    model                = Data()
+    model.vehicle_setup  = vehicle_setup
+    model.configs_setup  = configs_setup
+    model.quadrant_setup = quadrant_setup
+    model.settings       = settings
+    filename_suffix      = '_Nx' + str(settings.N_gm_x) + '_Ny' + str(settings.N_gm_y)
+
+    if settings.run_noise_model and noise_replay:
+        # SOLVE THE TRAJECTORY ONCE WITHOUT NOISE, THEN REPLAY THE NOISE OVER EVERY QUADRANT
+        model.settings                 = deepcopy(settings)
+        model.settings.run_noise_model = False
+        trajectory = run_quadrants(model,quadrants[:1],filename_prefix + '_Trajectory',filename_suffix,1)[0]
+        filenames  = Noise_Replay.replay_quadrants(trajectory + '.pkl',quadrants,quadrant_noise_setup,settings,
+                                                   filename_prefix + '_Noise',filename_suffix,number_of_workers)
+    else:
+        filenames  = run_quadrants(model,quadrants,filename_prefix + '_Noise',filename_suffix,number_of_workers)
+
+    with open(filenames[-1] + '.pkl', 'rb') as file:
+        results = pickle.load(file)
+
+    noise_data = None
+    if settings.run_noise_model:
+        noise_data = stitch_quadrant_results(filenames,quadrants,settings.N_gm_x,settings.N_gm_y)
+        with open(filename_prefix + '_Noise' + filename_suffix + '.pkl', 'wb') as file:
+            pickle.dump(noise_data, file)
+
+    return results, noise_data
+
+# ----------------------------------------------------------------------
+#   Run Quadrants
+# ----------------------------------------------------------------------
+def run_quadrants(model,quadrants,filename_prefix,filename_suffix = '',number_of_workers = None):
+    """Evaluates the mission once per acoustic quadrant on a process pool. Each
+    worker builds the vehicle and configurations once and reuses them for every
+    quadrant it is handed. Results are pickled per quadrant so that large
+    results structures are never sent back through the pool.
+
+    Assumptions:
+    Quadrants are independent, i.e. the trajectory does not depend on the
+    microphone domain
+
+    Source:
+    None
+
+    Inputs:
+    model.vehicle_setup      - function returning the vehicle
+    model.configs_setup      - function(vehicle) returning the configurations
+    model.quadrant_setup     - function(configs,vehicle,quadrant,settings) returning an
+                               analyses container with .configs and .missions.base
+    model.settings           - simulation parameters passed through to quadrant_setup.
+                               settings.profile_mission writes a timing report per quadrant
+    quadrants                - list of quadrants from setup_quadrants
+    filename_prefix          - results filename before the quadrant tag
+    filename_suffix          - results filename after the quadrant tag
+    number_of_workers        - size of the process pool, defaults to the cpu count.
+                               A single worker runs in the calling process
+
+    Outputs:
+    filenames                - results filenames ordered by quadrant index (no extension)
+
+    Properties Used:
+    N/A
+    """
+    if number_of_workers == None:
+        number_of_workers = multiprocessing.cpu_count()
+    number_of_workers = max(1,min(number_of_workers,len(quadrants)))
+
+    tasks = [(quadrant,filename_prefix + '_Q' + str(quadrant.index) + filename_suffix) for quadrant in quadrants]
+
+    if number_of_workers == 1:
+        initialize_worker(model)
+        filenames = [evaluate_quadrant(task) for task in tasks]
+    else:
+        pool      = multiprocessing.Pool(processes = number_of_workers, initializer = initialize_worker, initargs = (model,))
+        filenames = []
+        try:
+            for filename in pool.imap_unordered(evaluate_quadrant,tasks):
+                filenames.append(filename)
+                print('Completed ' + str(len(filenames)) + ' of ' + str(len(tasks)) + ' quadrants')
+        finally:
+            pool.close()
+            pool.join()
+
+    # return in quadrant order, independent of completion order
+    order = [task[1] for task in tasks]
+    return sorted(filenames, key = order.index)
+
+# ----------------------------------------------------------------------
+#   Initialize Worker
+# ----------------------------------------------------------------------
+def initialize_worker(model):
+    """Builds the vehicle and configurations once for the calling process.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    model  - see run_quadrants
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    _worker.model   = model
+    _worker.vehicle = model.vehicle_setup()
+    _worker.configs = model.configs_setup(_worker.vehicle)
+    return
+
+# ----------------------------------------------------------------------
+#   Evaluate Quadrant
+# ----------------------------------------------------------------------
+def evaluate_quadrant(task):
+    """Builds the analyses and mission for one quadrant, evaluates it and pickles
+    the results.
+
+    Assumptions:
+    initialize_worker has been called in this process
+
+    Source:
+    None
+
+    Inputs:
+    task  - (quadrant, filename)
+
+    Outputs:
+    filename  - results filename (no extension)
+
+    Properties Used:
+    N/A
+    """
+    quadrant, filename = task
+    ti                 = time.time()
+    print('Running Quardant:' + str(quadrant.index))
+
+    configs  = _worker.configs
+    analyses = _worker.model.quadrant_setup(configs,_worker.vehicle,quadrant,_worker.model.settings)
+
+    # FINALIZE SIMULATION
+    configs.finalize()
+    analyses.finalize()
+
+    profile  = _worker.model.settings.get('profile_mission',False)
+    if profile:
+        Mission_Profiler.profile_mission(analyses.missions.base)
+
+    # RUN SIMULATION !!
+    results  = analyses.missions.base.evaluate()
+
+    # SAVE RESULTS
+    with open(filename + '.pkl', 'wb') as file:
+        pickle.dump(results, file)
+    if profile:
+        Mission_Profiler.write_profile_report(results,filename)
+
+    tf = time.time()
+    print('Quadrant ' + str(quadrant.index) + ' time taken: '+ str(round(((tf-ti)/60),3)) + ' mins')
+    return filename
+
+# ----------------------------------------------------------------------
+#   Stitch Quadrant Results
+# ----------------------------------------------------------------------
+def stitch_quadrant_results(filenames,quadrants,N_gm_x,N_gm_y,drop_shared_edges = True):
+    """Loads the per-quadrant results pickles and assembles the ground microphone
+    SPL histories into one global microphone grid.
+
+    Assumptions:
+    Every quadrant uses the same N_gm_x x N_gm_y grid and the same trajectory.
+    Neighbouring quadrants share their boundary row/column of microphones, which
+    is kept only once when drop_shared_edges is True
+
+    Source:
+    None
+
+    Inputs:
+    filenames          - results filenames from run_quadrants (no extension)
+    quadrants          - list of quadrants from setup_quadrants
+    N_gm_x             - microphones per quadrant in the longitudinal direction
+    N_gm_y             - microphones per quadrant in the lateral direction
+
+    Outputs:
+    noise_data.SPL_dBA_ground_mic       - (time, N_x, N_y) SPL history          [dBA]
+    noise_data.SPL_dBA_ground_mic_loc   - (N_x, N_y, 3) microphone locations    [m]
+    noise_data.aircraft_position        - (time, 3) aircraft position           [m]
+    noise_data.time                     - (time) mission time                   [s]
+    noise_data.N_gm_x, noise_data.N_gm_y
+
+    Properties Used:
+    N/A
+    """
+    N_quad_x = max([quadrant.x_index for quadrant in quadrants]) + 1
+    N_quad_y = max([quadrant.y_index for quadrant in quadrants]) + 1
+    skip     = 1 if drop_shared_edges else 0
+    N_x      = N_quad_x*N_gm_x - (N_quad_x-1)*skip
+    N_y      = N_quad_y*N_gm_y - (N_quad_y-1)*skip
+
+    noise_data = Data()
+    for quadrant,filename in zip(quadrants,filenames):
+        with open(filename + '.pkl', 'rb') as file:
+            results = pickle.load(file)
+
+        segments   = results.segments
+        N_segs     = len(segments)
+        N_ctrl_pts = len(segments[0].conditions.frames.inertial.time[:,0])
+
+        if 'SPL_dBA_ground_mic' not in noise_data:
+            noise_data.SPL_dBA_ground_mic     = np.zeros((N_segs*N_ctrl_pts,N_x,N_y))
+            noise_data.SPL_dBA_ground_mic_loc = np.zeros((N_x,N_y,3))
+            noise_data.aircraft_position      = np.zeros((N_segs*N_ctrl_pts,3))
+            noise_data.time                   = np.zeros(N_segs*N_ctrl_pts)
+            for i in range(N_segs):
+                noise_data.aircraft_position[i*N_ctrl_pts:(i+1)*N_ctrl_pts] = segments[i].conditions.frames.inertial.position_vector
+                noise_data.time[i*N_ctrl_pts:(i+1)*N_ctrl_pts]              = segments[i].conditions.frames.inertial.time[:,0]
+
+        # drop the row/column already supplied by the neighbouring quadrant
+        sx    = skip if quadrant.x_index > 0 else 0
+        sy    = skip if quadrant.y_index > 0 else 0
+        x0    = quadrant.x_index*(N_gm_x - skip) + sx
+        y0    = quadrant.y_index*(N_gm_y - skip) + sy
+        x1    = x0 + N_gm_x - sx
+        y1    = y0 + N_gm_y - sy
+
+        mic_loc = segments[0].analyses.noise.settings.ground_microphone_locations.reshape(N_gm_x,N_gm_y,3)
+        noise_data.SPL_dBA_ground_mic_loc[x0:x1,y0:y1] = mic_loc[sx:,sy:]
+        for i in range(N_segs):
+            SPL = np.nan_to_num(segments[i].conditions.noise.total_SPL_dBA[:,:N_gm_x*N_gm_y]).reshape(N_ctrl_pts,N_gm_x,N_gm_y)
+            noise_data.SPL_dBA_ground_mic[i*N_ctrl_pts:(i+1)*N_ctrl_pts,x0:x1,y0:y1] = SPL[:,sx:,sy:]
+
+    noise_data.N_gm_x = N_x
+    noise_data.N_gm_y = N_y
+    noise_data.N_gm   = N_x*N_y
+    return noise_data
@@ -0,0 +1,388 @@
+# Range_Payload_Sweep.py
+#
+# Created: Oct 2026
+#
+# Range/payload sweep of a vehicle model, from the Aircraft_Models directory:
+#
+#     python Mission_Tools/Range_Payload_Sweep.py Tiltwing --workers 8
+#
+# vehicle is Stopped_Rotor, Tiltwing, Multirotor or Stopped_Rotor_V2. The table
+# is written to <vehicle>_Range_Payload_Sweep.csv unless --output is given.
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data, Units
+import multiprocessing
+import itertools
+import importlib
+import argparse
+import time
+import sys
+import os
+import numpy as np
+import pylab as plt
+
+models_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)),'..')
+
+# default swept ranges of each vehicle, first and last range [nmi]
+SWEEP_RANGES = {'Stopped_Rotor'    : [20.,70.],
+                'Tiltwing'         : [20.,70.],
+                'Multirotor'       : [20.,70.],
+                'Stopped_Rotor_V2' : [35.,70.]}
+
+# worker state, populated once per process by initialize_worker
+_worker = Data()
+
+# columns of the sweep table
+SWEEP_COLUMNS = ['aircraft_range','payload','reserve_segment','converged','elapsed_range','flight_time',
+                 'energy_used','final_state_of_charge','minimum_state_of_charge']
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description = 'Range/payload sweep of a vehicle model')
+    parser.add_argument('vehicle', choices = sorted(SWEEP_RANGES.keys()), help = 'vehicle model')
+    parser.add_argument('--ranges', type = float, nargs = '+', default = None,
+                        help = 'total ground distances in nmi, defaults to 6 ranges over SWEEP_RANGES of the vehicle')
+    parser.add_argument('--payloads', type = float, nargs = '+', default = [-100.,0.,100.],
+                        help = 'payload increments on the design takeoff mass in kg')
+    parser.add_argument('--reserve', action = 'store_true', help = 'also sweep missions with a reserve segment')
+    parser.add_argument('--control-points', type = int, default = 10, help = 'number of control points per segment')
+    parser.add_argument('--workers', type = int, default = None, help = 'number of worker processes, defaults to all cores')
+    parser.add_argument('--output', default = None, help = 'csv file name, defaults to <vehicle>_Range_Payload_Sweep.csv')
+    args = parser.parse_args()
+
+    # start simulation clock
+    ti = time.time()
+
+    if args.ranges == None:
+        ranges = np.linspace(SWEEP_RANGES[args.vehicle][0],SWEEP_RANGES[args.vehicle][1],6)*Units.nmi
+    else:
+        ranges = np.array(args.ranges)*Units.nmi
+    reserve_segments = [False,True] if args.reserve else [False]
+    output           = args.output if args.output != None else args.vehicle + '_Range_Payload_Sweep.csv'
+
+    model = vehicle_model(args.vehicle,args.control_points)
+    table = sweep_range_payload(model,ranges,np.array(args.payloads),reserve_segments,args.workers)
+    write_sweep_table(table,output)
+
+    plot_sweep(table)
+
+    tf = time.time()
+    print ('time taken: '+ str(round(((tf-ti)/60),3)) + ' mins')
+    plt.show()
+    return
+
+# ----------------------------------------------------------------------
+#   Vehicle Model
+# ----------------------------------------------------------------------
+def vehicle_model(name,control_points = 10):
+    """Sets up the sweep model of a vehicle of Aircraft_Models by name, as
+    Batch_Runner does. Noise is not run.
+
+    Assumptions:
+    Stopped_Rotor, Tiltwing and Multirotor share the analyses_setup and
+    full_mission_setup interface. Stopped_Rotor_V2 has no aircraft_range mission
+    argument, so it flies full_mission_setup_baseline over a straight route over
+    level ground whose flight_range is the swept range. That mission has no
+    reserve segment, so the reserve flag has no effect there
+
+    Source:
+    None
+
+    Inputs:
+    name             - Stopped_Rotor, Tiltwing, Multirotor or Stopped_Rotor_V2
+    control_points   - number of control points per segment
+
+    Outputs:
+    model            - see sweep_range_payload
+
+    Properties Used:
+    N/A
+    """
+    Vehicle                       = model_module(name,'Vehicle')
+    model                         = Data()
+    model.vehicle_setup           = Vehicle.vehicle_setup
+    model.configs_setup           = Vehicle.configs_setup
+    if name == 'Stopped_Rotor_V2':
+        model.analyses_setup      = level_ground_analyses_setup
+        model.mission_setup       = level_ground_mission_setup
+    else:
+        model.analyses_setup      = standard_analyses_setup
+        model.mission_setup       = standard_mission_setup
+    model.settings                = Data()
+    model.settings.vehicle        = name
+    model.settings.control_points = control_points
+    return model
+
+# ----------------------------------------------------------------------
+#   Model Module
+# ----------------------------------------------------------------------
+def model_module(name,kind):
+    # imports <name>_<kind> of the vehicle directory, also in spawned worker processes
+    directory = os.path.join(models_directory,name)
+    if directory not in sys.path:
+        sys.path.append(directory)
+    return importlib.import_module(name + '_' + kind)
+
+# ----------------------------------------------------------------------
+#   Analyses Setup
+# ----------------------------------------------------------------------
+def standard_analyses_setup(configs,settings):
+    # noise is not run, the microphone domain is a placeholder
+    return model_module(settings.vehicle,'Analyses').analyses_setup(configs,2,2,1E-3,1.,0.,1.,1.,False)
+
+def level_ground_analyses_setup(configs,settings):
+    # noise is not run, no ground data is needed
+    return model_module(settings.vehicle,'Analyses').level_ground_analyses_setup(configs,None,False)
+
+# ----------------------------------------------------------------------
+#   Mission Setup
+# ----------------------------------------------------------------------
+def standard_mission_setup(analyses,vehicle,case,settings):
+    return model_module(settings.vehicle,'Missions').full_mission_setup(analyses,vehicle,1,1,case.aircraft_range,case.reserve_segment,
+                                                                        settings.control_points,False)
+
+def level_ground_mission_setup(analyses,vehicle,case,settings):
+    # straight route over level ground, the baseline mission has no reserve segment
+    route              = Data()
+    route.flight_range = case.aircraft_range
+    route.true_course  = 0.
+    return model_module(settings.vehicle,'Missions').full_mission_setup_baseline(analyses,vehicle,1,1,settings.control_points,False,route)
+
+# ----------------------------------------------------------------------
+#   Sweep Range Payload
+# ----------------------------------------------------------------------
+def sweep_range_payload(model,ranges,payloads = [0.],reserve_segments = [False],number_of_workers = None):
+    """Evaluates the mission for every combination of range, payload and reserve
+    setting. The vehicle, configurations and analyses are built and finalized once
+    per worker process; only the mission is rebuilt for each case.
+
+    Assumptions:
+    Payload is mass added to (or removed from) the design takeoff mass of every
+    configuration. The analyses do not depend on range, i.e. no noise model
+
+    Source:
+    None
+
+    Inputs:
+    model.vehicle_setup      - function returning the vehicle
+    model.configs_setup      - function(vehicle) returning the configurations
+    model.analyses_setup     - function(configs,settings) returning the configuration analyses
+    model.mission_setup      - function(analyses,vehicle,case,settings) returning the base mission,
+                               case has aircraft_range, payload and reserve_segment
+    model.settings           - simulation parameters passed through to the setup functions
+    ranges                   - aircraft ranges                                 [m]
+    payloads                 - payload increments on the design takeoff mass   [kg]
+    reserve_segments         - reserve segment flags
+    number_of_workers        - size of the process pool, defaults to the cpu count.
+                               A single worker runs in the calling process
+
+    Outputs:
+    table                    - Data of SWEEP_COLUMNS arrays, one row per case
+
+    Properties Used:
+    N/A
+    """
+    cases = []
+    for idx,(aircraft_range,payload,reserve_segment) in enumerate(itertools.product(ranges,payloads,reserve_segments)):
+        case                 = Data()
+        case.index           = idx
+        case.aircraft_range  = aircraft_range
+        case.payload         = payload
+        case.reserve_segment = reserve_segment
+        cases.append(case)
+
+    if number_of_workers == None:
+        number_of_workers = multiprocessing.cpu_count()
+    number_of_workers = max(1,min(number_of_workers,len(cases)))
+
+    if number_of_workers == 1:
+        initialize_worker(model)
+        rows = [evaluate_case(case) for case in cases]
+    else:
+        pool = multiprocessing.Pool(processes = number_of_workers, initializer = initialize_worker, initargs = (model,))
+        rows = []
+        try:
+            for row in pool.imap_unordered(evaluate_case,cases):
+                rows.append(row)
+                print('Completed ' + str(len(rows)) + ' of ' + str(len(cases)) + ' cases')
+        finally:
+            pool.close()
+            pool.join()
+
+    rows  = sorted(rows, key = lambda row: row.index)
+    table = Data()
+    for name in SWEEP_COLUMNS:
+        table[name] = np.array([row[name] for row in rows])
+    return table
+
+# ----------------------------------------------------------------------
+#   Initialize Worker
+# ----------------------------------------------------------------------
+def initialize_worker(model):
+    """Builds and finalizes the vehicle, configurations and analyses once for the
+    calling process and records the design takeoff mass of each configuration.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    model  - see sweep_range_payload
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    _worker.model    = model
+    _worker.vehicle  = model.vehicle_setup()
+    _worker.configs  = model.configs_setup(_worker.vehicle)
+    _worker.analyses = model.analyses_setup(_worker.configs,model.settings)
+    _worker.configs.finalize()
+    _worker.analyses.finalize()
+
+    _worker.design_takeoff = Data()
+    _worker.design_takeoff[_worker.vehicle.tag] = _worker.vehicle.mass_properties.takeoff
+    for tag,config in _worker.configs.items():
+        _worker.design_takeoff[tag] = config.mass_properties.takeoff
+    return
+
+# ----------------------------------------------------------------------
+#   Evaluate Case
+# ----------------------------------------------------------------------
+def evaluate_case(case):
+    """Sets the payload, builds and evaluates the mission of one case and reduces
+    the results to a table row.
+
+    Assumptions:
+    initialize_worker has been called in this process
+
+    Source:
+    None
+
+    Inputs:
+    case  - index, aircraft_range, payload, reserve_segment
+
+    Outputs:
+    row   - Data of SWEEP_COLUMNS and index
+
+    Properties Used:
+    N/A
+    """
+    vehicle = _worker.vehicle
+    vehicle.mass_properties.takeoff = _worker.design_takeoff[vehicle.tag] + case.payload
+    for tag,config in _worker.configs.items():
+        config.mass_properties.takeoff = _worker.design_takeoff[tag] + case.payload
+
+    mission = _worker.model.mission_setup(_worker.analyses,vehicle,case,_worker.model.settings)
+    mission.finalize()
+    results = mission.evaluate()
+
+    row                 = summarize_mission(results)
+    row.index           = case.index
+    row.aircraft_range  = case.aircraft_range
+    row.payload         = case.payload
+    row.reserve_segment = case.reserve_segment
+    return row
+
+# ----------------------------------------------------------------------
+#   Summarize Mission
+# ----------------------------------------------------------------------
+def summarize_mission(results):
+    """Reduces mission results to range, time, energy and state of charge.
+
+    Assumptions:
+    The battery is not recharged during the mission
+
+    Source:
+    None
+
+    Inputs:
+    results  - results of mission.evaluate()
+
+    Outputs:
+    row.converged                 - all segments converged
+    row.elapsed_range             - ground distance flown        [m]
+    row.flight_time               - mission time                 [s]
+    row.energy_used               - battery energy used          [J]
+    row.final_state_of_charge     - state of charge at the end   [-]
+    row.minimum_state_of_charge   - lowest state of charge       [-]
+
+    Properties Used:
+    N/A
+    """
+    segments = list(results.segments.values())
+    first    = segments[0].conditions
+    last     = segments[-1].conditions
+
+    row                         = Data()
+    row.converged               = all([segment.state.numerics.get('converged',True) for segment in segments])
+    row.elapsed_range           = last.frames.inertial.position_vector[-1,0] - first.frames.inertial.position_vector[0,0]
+    row.flight_time             = last.frames.inertial.time[-1,0] - first.frames.inertial.time[0,0]
+    row.energy_used             = first.propulsion.battery_energy[0,0] - last.propulsion.battery_energy[-1,0]
+    row.final_state_of_charge   = last.propulsion.battery_state_of_charge[-1,0]
+    row.minimum_state_of_charge = np.min([np.min(segment.conditions.propulsion.battery_state_of_charge) for segment in segments])
+    return row
+
+# ----------------------------------------------------------------------
+#   Write Sweep Table
+# ----------------------------------------------------------------------
+def write_sweep_table(table,filename):
+    """Writes the sweep table as comma separated values, range in nmi, energy in kWh.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    table     - output of sweep_range_payload
+    filename  - csv file name (with extension)
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    header = ['range_nmi','payload_kg','reserve_segment','converged','elapsed_range_nmi','flight_time_min',
+              'energy_used_kWh','final_state_of_charge','minimum_state_of_charge']
+    with open(filename,'w') as file:
+        file.write(','.join(header) + '\n')
+        for i in range(len(table.aircraft_range)):
+            values = [table.aircraft_range[i]/Units.nmi,
+                      table.payload[i],
+                      int(table.reserve_segment[i]),
+                      int(table.converged[i]),
+                      table.elapsed_range[i]/Units.nmi,
+                      table.flight_time[i]/Units.min,
+                      table.energy_used[i]/Units['kW*h'],
+                      table.final_state_of_charge[i],
+                      table.minimum_state_of_charge[i]]
+            file.write(','.join([str(value) for value in values]) + '\n')
+    return
+
+# ----------------------------------------------------------------------
+#   Plot Sweep
+# ----------------------------------------------------------------------
+def plot_sweep(table):
+    fig = plt.figure('Range_Payload_Sweep')
+    ax  = fig.add_subplot(1,1,1)
+    for payload in np.unique(table.payload):
+        locs = np.where((table.payload == payload) & table.converged)[0]
+        ax.plot(table.elapsed_range[locs]/Units.nmi,table.final_state_of_charge[locs],'o-',label = 'Payload ' + str(payload) + ' kg')
+    ax.set_xlabel('Range (nmi)')
+    ax.set_ylabel('Final State of Charge')
+    ax.legend(loc='upper right')
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+# Rotor_Design_Cache.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+import SUAVE
+from SUAVE.Core import Data
+import hashlib
+import pickle
+import os
+import numpy as np
+from copy import deepcopy
+
+# bump to invalidate every stored design, e.g. after a change in how designs are stored
+CACHE_VERSION = 3
+
+# design inputs that, together with the airfoil files, define a designed rotor
+DESIGN_INPUTS = ['tip_radius','hub_radius','number_of_blades','design_tip_mach','design_thrust','design_power',
+                 'design_Cl','design_altitude','freestream_velocity','angular_velocity','variable_pitch',
+                 'airfoil_polar_stations','optimization_parameters']
+
+# attributes written by the design functions, the only ones stored and copied onto the caller's rotor
+DESIGN_OUTPUTS = ['twist_distribution','chord_distribution','radius_distribution','max_thickness_distribution',
+                  'thickness_to_chord','mid_chord_alignment','blade_solidity','number_of_blades','angular_velocity',
+                  'design_torque','design_power','design_thrust','design_power_coefficient',
+                  'design_thrust_coefficient','design_SPL_dBA','design_performance','design_acoustics','airfoil_flag']
+
+# attributes computed from the airfoil files for each appended airfoil
+AIRFOIL_OUTPUTS = ['geometry','polars']
+
+default_cache_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)),'Cached_Rotor_Designs')
+
+# hit/miss counters for the current process
+design_cache_statistics        = Data()
+design_cache_statistics.hits   = 0
+design_cache_statistics.misses = 0
+
+# ----------------------------------------------------------------------
+#   Cached Rotor Design
+# ----------------------------------------------------------------------
+def cached_rotor_design(rotor,design_function,cache_directory = None,**design_arguments):
+    """Copies the stored design outputs onto rotor if the same design inputs have
+    been designed before, otherwise runs design_function and stores its outputs.
+
+    Assumptions:
+    The design is a deterministic function of DESIGN_INPUTS, including every entry
+    of optimization_parameters, the contents of the airfoil geometry and polar
+    files, the design function, its keyword arguments and the SUAVE version.
+    A stored design is invalidated by a change in any of these or in CACHE_VERSION.
+    Only DESIGN_OUTPUTS and the computed airfoil data are stored, every other
+    attribute of rotor is left as the caller set it.
+
+    Source:
+    None
+
+    Inputs:
+    rotor            - undesigned Propeller/Lift_Rotor/Prop_Rotor
+    design_function  - e.g. propeller_design, lift_rotor_design
+    cache_directory  - defaults to Mission_Tools/Cached_Rotor_Designs
+    design_arguments - keyword arguments of design_function, e.g. number_of_stations
+
+    Outputs:
+    rotor            - rotor with the design outputs (twist, chord, thickness, design point)
+
+    Properties Used:
+    N/A
+    """
+    if cache_directory == None:
+        cache_directory = default_cache_directory
+
+    key        = rotor_design_key(rotor,design_function,design_arguments)
+    cache_file = os.path.join(cache_directory,key + '.pkl')
+
+    if os.path.isfile(cache_file):
+        try:
+            with open(cache_file, 'rb') as file:
+                design_outputs = pickle.load(file)
+            design_cache_statistics.hits += 1
+            return apply_design_outputs(rotor,design_outputs)
+        except (pickle.UnpicklingError,EOFError,AttributeError,ImportError):
+            # corrupt or stale entry, fall through and redesign
+            os.remove(cache_file)
+
+    design_cache_statistics.misses += 1
+    designed_rotor = design_function(rotor,**design_arguments)
+
+    # write to a temporary file first so that concurrent workers never read a partial entry
+    if not os.path.isdir(cache_directory):
+        os.makedirs(cache_directory,exist_ok = True)
+    temporary_file = cache_file + '.' + str(os.getpid()) + '.tmp'
+    with open(temporary_file, 'wb') as file:
+        pickle.dump(extract_design_outputs(designed_rotor), file)
+    os.replace(temporary_file,cache_file)
+
+    return designed_rotor
+
+# ----------------------------------------------------------------------
+#   Extract Design Outputs
+# ----------------------------------------------------------------------
+def extract_design_outputs(rotor):
+    """Collects the attributes written by the design function.
+
+    Assumptions:
+    Attributes the design function did not set are skipped
+
+    Source:
+    None
+
+    Inputs:
+    rotor            - designed rotor
+
+    Outputs:
+    design_outputs   - Data with the DESIGN_OUTPUTS and, per airfoil, the AIRFOIL_OUTPUTS
+
+    Properties Used:
+    N/A
+    """
+    design_outputs          = Data()
+    design_outputs.rotor    = Data()
+    design_outputs.airfoils = Data()
+    for name in DESIGN_OUTPUTS:
+        if name in rotor:
+            design_outputs.rotor[name] = rotor[name]
+    for tag,airfoil in rotor.get('Airfoils',Data()).items():
+        design_outputs.airfoils[tag] = Data()
+        for name in AIRFOIL_OUTPUTS:
+            if name in airfoil:
+                design_outputs.airfoils[tag][name] = airfoil[name]
+    return design_outputs
+
+# ----------------------------------------------------------------------
+#   Apply Design Outputs
+# ----------------------------------------------------------------------
+def apply_design_outputs(rotor,design_outputs):
+    """Copies stored design outputs onto an undesigned rotor.
+
+    Assumptions:
+    The airfoils of rotor have the same tags as the stored design, which holds
+    since the airfoil files are part of the cache key
+
+    Source:
+    None
+
+    Inputs:
+    rotor            - undesigned rotor
+    design_outputs   - output of extract_design_outputs
+
+    Outputs:
+    rotor            - the same rotor with the design outputs set
+
+    Properties Used:
+    N/A
+    """
+    for name,value in design_outputs.rotor.items():
+        rotor[name] = deepcopy(value)
+    airfoils = rotor.get('Airfoils',Data())
+    for tag,outputs in design_outputs.airfoils.items():
+        if tag in airfoils:
+            for name,value in outputs.items():
+                airfoils[tag][name] = deepcopy(value)
+    return rotor
+
+# ----------------------------------------------------------------------
+#   Rotor Design Key
+# ----------------------------------------------------------------------
+def rotor_design_key(rotor,design_function,design_arguments = {}):
+    """Computes the content hash used to index the design cache.
+
+    Assumptions:
+    Airfoil files are identified by name and contents, not by absolute path, so
+    the key is the same on every machine
+
+    Source:
+    None
+
+    Inputs:
+    rotor            - undesigned rotor
+    design_function  - design function
+    design_arguments - keyword arguments of the design function
+
+    Outputs:
+    key              - hexadecimal sha1 digest
+
+    Properties Used:
+    N/A
+    """
+    sha = hashlib.sha1()
+    sha.update(('version:' + str(CACHE_VERSION)).encode())
+    sha.update(('suave:' + str(getattr(SUAVE,'__version__','unknown'))).encode())
+    sha.update(('function:' + design_function.__module__ + '.' + design_function.__name__).encode())
+    sha.update(('component:' + type(rotor).__name__).encode())
+
+    for name in DESIGN_INPUTS:
+        sha.update(('input:' + name + ':' + key_value(rotor.get(name,None))).encode())
+    for name in sorted(design_arguments.keys()):
+        sha.update(('argument:' + name + ':' + key_value(design_arguments[name])).encode())
+
+    for filename in airfoil_files(rotor):
+        sha.update(('file:' + os.path.basename(filename)).encode())
+        with open(filename, 'rb') as file:
+            sha.update(hashlib.sha1(file.read()).digest())
+
+    return sha.hexdigest()
+
+# ----------------------------------------------------------------------
+#   Key Value
+# ----------------------------------------------------------------------
+def key_value(value):
+    """Text form of a design input for the cache key, with nested Data and dicts
+    expanded entry by entry in sorted order and numbers as float lists."""
+    if isinstance(value,dict):
+        return '{' + ','.join([str(name) + ':' + key_value(value[name]) for name in sorted(value.keys(),key = str)]) + '}'
+    if value is None or isinstance(value,(bool,str)):
+        return repr(value)
+    if callable(value):
+        return getattr(value,'__module__','') + '.' + getattr(value,'__name__',type(value).__name__)
+    try:
+        return repr(np.atleast_1d(np.asarray(value,dtype=float)).tolist())
+    except (TypeError,ValueError):
+        return repr(value)
+
+# ----------------------------------------------------------------------
+#   Airfoil Files
+# ----------------------------------------------------------------------
+def airfoil_files(rotor):
+    """Collects the airfoil geometry and polar files attached to a rotor, in order.
+
+    Assumptions:
+    Airfoils are appended with append_airfoil or listed in airfoil_data
+
+    Source:
+    None
+
+    Inputs:
+    rotor.Airfoils      - airfoils with coordinate_file and polar_files
+    rotor.airfoil_data  - geometry_files and polars_files
+
+    Outputs:
+    files               - list of file paths
+
+    Properties Used:
+    N/A
+    """
+    files = []
+    for airfoil in rotor.get('Airfoils',Data()).values():
+        if airfoil.get('coordinate_file',None) is not None:
+            files.append(airfoil.coordinate_file)
+        files.extend(airfoil.get('polar_files',None) or [])
+
+    airfoil_data = rotor.get('airfoil_data',Data())
+    files.extend(airfoil_data.get('geometry_files',None) or [])
+    for polars in airfoil_data.get('polars_files',None) or []:
+        files.extend(polars)
+    return files
+
+# ----------------------------------------------------------------------
+#   Clear Design Cache
+# ----------------------------------------------------------------------
+def clear_design_cache(cache_directory = None):
+    """Removes every stored design and resets the hit/miss counters.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    cache_directory  - defaults to Mission_Tools/Cached_Rotor_Designs
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    if cache_directory == None:
+        cache_directory = default_cache_directory
+    if os.path.isdir(cache_directory):
+        for filename in os.listdir(cache_directory):
+            if filename.endswith('.pkl') or filename.endswith('.tmp'):
+                os.remove(os.path.join(cache_directory,filename))
+    design_cache_statistics.hits   = 0
+    design_cache_statistics.misses = 0
+    return
+
+# ----------------------------------------------------------------------
+#   Print Design Cache Statistics
+# ----------------------------------------------------------------------
+def print_design_cache_statistics():
+    print('Rotor design cache hits: ' + str(design_cache_statistics.hits) +
+          ', misses: ' + str(design_cache_statistics.misses))
+    return
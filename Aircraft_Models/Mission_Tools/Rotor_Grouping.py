@@ -0,0 +1,202 @@
+# Rotor_Grouping.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+from SUAVE.Components.Energy.Converters import Propeller, Lift_Rotor, Prop_Rotor
+from copy import deepcopy
+import hashlib
+import os
+import numpy as np
+
+# geometry that, together with the airfoil files, defines the blade element model of a rotor
+GEOMETRY_INPUTS = ['tip_radius','hub_radius','number_of_blades','radius_distribution','chord_distribution',
+                   'twist_distribution','thickness_to_chord','max_thickness_distribution','mid_chord_alignment',
+                   'airfoil_polar_stations','rotation','variable_pitch']
+
+# per-rotor settings that change a spin besides its inputs, e.g. tilt of the thrust axis
+SPIN_SETTINGS = ['thrust_angle','orientation_euler_angles','inflow_ratio','nonuniform_freestream','use_2d_analysis',
+                 'sol_tolerance','number_azimuthal_stations','rotation']
+
+# most recent spin of each group, keyed by group: (inflow signature, spin outputs)
+_group_spins = {}
+
+# hit/miss counters for the current process
+rotor_group_statistics        = Data()
+rotor_group_statistics.hits   = 0
+rotor_group_statistics.misses = 0
+
+# ----------------------------------------------------------------------
+#   Grouped Spin
+# ----------------------------------------------------------------------
+class Grouped_Spin():
+    """Spins a rotor once per group and operating condition. The first member of a
+    group to be evaluated at a condition runs the blade element analysis, every
+    other member reuses its loads.
+
+    Assumptions:
+    Members of a group share geometry and rotation direction. A spin is only
+    reused when every input and spin setting of the member, e.g. its orientation
+    and tilt, matches the spin that is stored, so it sees the same inflow. Origins
+    and phase offsets only enter the acoustic propagation, which reads them from
+    each member. Each member receives its own copy of the outputs, which is also
+    stored as its self.outputs, as the spin it skips would have done
+
+    Source:
+    None
+    """
+    def spin(self,conditions):
+        key       = self.spin_group
+        signature = inflow_signature(self,conditions)
+        if key in _group_spins and _group_spins[key][0] == signature:
+            rotor_group_statistics.hits += 1
+            thrust, torque, power, Cp, outputs, etap = _group_spins[key][1]
+            self.outputs = deepcopy(outputs)
+            return np.copy(thrust), np.copy(torque), np.copy(power), np.copy(Cp), self.outputs, np.copy(etap)
+
+        rotor_group_statistics.misses += 1
+        results            = super().spin(conditions)
+        _group_spins[key]  = (signature,results)
+        thrust, torque, power, Cp, outputs, etap = results
+        self.outputs       = deepcopy(outputs)
+        return np.copy(thrust), np.copy(torque), np.copy(power), np.copy(Cp), self.outputs, np.copy(etap)
+
+class Grouped_Propeller(Grouped_Spin,Propeller):
+    pass
+
+class Grouped_Lift_Rotor(Grouped_Spin,Lift_Rotor):
+    pass
+
+class Grouped_Prop_Rotor(Grouped_Spin,Prop_Rotor):
+    pass
+
+GROUPED_CLASSES = {Propeller:Grouped_Propeller, Lift_Rotor:Grouped_Lift_Rotor, Prop_Rotor:Grouped_Prop_Rotor}
+
+# ----------------------------------------------------------------------
+#   Group Identical Rotors
+# ----------------------------------------------------------------------
+def group_identical_rotors(rotors):
+    """Sorts rotors into groups of identical geometry and switches them to grouped
+    evaluation, so that each group is spun once per operating condition.
+
+    Assumptions:
+    Rotors are deep copies of a designed rotor differing only in tag, origin and
+    phase offset, or are distinct designs which then form groups of their own
+
+    Source:
+    None
+
+    Inputs:
+    rotors            - container of rotors, e.g. net.lift_rotors
+
+    Outputs:
+    rotor.spin_group  - group key of each rotor
+    groups            - Data of group key: list of member tags
+
+    Properties Used:
+    N/A
+    """
+    groups = Data()
+    for rotor in rotors.values():
+        if type(rotor) in GROUPED_CLASSES:
+            # Data routes attribute assignment to items, so switch the class directly
+            object.__setattr__(rotor,'__class__',GROUPED_CLASSES[type(rotor)])
+        elif not isinstance(rotor,Grouped_Spin):
+            continue
+        key              = rotor_group_key(rotor)
+        rotor.spin_group = key
+        if key not in groups:
+            groups[key] = []
+        groups[key].append(rotor.tag)
+    return groups
+
+# ----------------------------------------------------------------------
+#   Rotor Group Key
+# ----------------------------------------------------------------------
+def rotor_group_key(rotor):
+    """Computes the hash of the geometry that defines a rotor group.
+
+    Assumptions:
+    Airfoils are identified by file name
+
+    Source:
+    None
+
+    Inputs:
+    rotor  - rotor
+
+    Outputs:
+    key    - hexadecimal sha1 digest
+
+    Properties Used:
+    N/A
+    """
+    sha = hashlib.sha1()
+    sha.update(('component:' + type(rotor).__name__).encode())
+    for name in GEOMETRY_INPUTS:
+        value = rotor.get(name,None)
+        if value is not None and not isinstance(value,(bool,str)):
+            value = np.atleast_1d(np.asarray(value,dtype=float)).tolist()
+        sha.update((name + ':' + repr(value)).encode())
+    for airfoil in rotor.get('Airfoils',Data()).values():
+        sha.update(('airfoil:' + os.path.basename(str(airfoil.get('coordinate_file',None)))).encode())
+        for filename in airfoil.get('polar_files',None) or []:
+            sha.update(('polar:' + os.path.basename(filename)).encode())
+    return sha.hexdigest()
+
+# ----------------------------------------------------------------------
+#   Inflow Signature
+# ----------------------------------------------------------------------
+def inflow_signature(rotor,conditions):
+    """Fingerprints everything a spin depends on besides geometry: every rotor
+    input, e.g. omega, pitch_command and y_axis_rotation, the per-rotor spin
+    settings and the freestream and frame conditions.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    rotor.inputs                 - all entries
+    rotor.<SPIN_SETTINGS>
+    conditions.freestream, conditions.frames
+
+    Outputs:
+    signature  - hexadecimal sha1 digest
+
+    Properties Used:
+    N/A
+    """
+    arrays = [rotor.inputs.get(name,None) for name in sorted(rotor.inputs.keys())] + \
+             [rotor.get(name,None) for name in SPIN_SETTINGS] + \
+             [conditions.freestream.density,
+              conditions.freestream.dynamic_viscosity,
+              conditions.freestream.speed_of_sound,
+              conditions.freestream.temperature,
+              conditions.frames.inertial.velocity_vector,
+              conditions.frames.body.transform_to_inertial]
+    sha = hashlib.sha1()
+    sha.update(repr(sorted(rotor.inputs.keys())).encode())
+    for array in arrays:
+        if array is None:
+            sha.update(b'none')
+        elif isinstance(array,(bool,str)):
+            sha.update(repr(array).encode())
+        else:
+            array = np.ascontiguousarray(array,dtype=float)
+            sha.update(str(array.shape).encode())
+            sha.update(array.tobytes())
+    return sha.hexdigest()
+
+# ----------------------------------------------------------------------
+#   Print Rotor Group Statistics
+# ----------------------------------------------------------------------
+def print_rotor_group_statistics():
+    print('Rotor spins evaluated: ' + str(rotor_group_statistics.misses) +
+          ', reused: ' + str(rotor_group_statistics.hits))
+    return
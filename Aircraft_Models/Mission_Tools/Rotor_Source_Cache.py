@@ -0,0 +1,206 @@
+# Rotor_Source_Cache.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+import SUAVE
+from SUAVE.Core import Data
+import collections
+import hashlib
+import copy
+import sys
+import numpy as np
+
+# prefix of the modules whose boundary layer solver is replaced by the cached one
+NOISE_MODULES = 'SUAVE.Methods.Noise'
+
+# cached source terms of this process, least recently used first
+_source_terms = collections.OrderedDict()
+
+# original functions replaced by enable_source_cache, keyed by module name
+_originals = {}
+
+# hit/miss counters for the current process
+source_cache_statistics          = Data()
+source_cache_statistics.hits     = 0
+source_cache_statistics.misses   = 0
+source_cache_statistics.entries  = 0
+
+# ----------------------------------------------------------------------
+#   Enable Source Cache
+# ----------------------------------------------------------------------
+def enable_source_cache(max_entries = 256):
+    """Caches the rotor noise source terms that do not depend on the observer. The
+    broadband model of Fidelity_One solves the boundary layer of every blade section
+    at every control point with the panel method to get the trailing edge
+    displacement and momentum thicknesses, skin friction and pressure gradient.
+    These only depend on the blade geometry and on the sectional angle of attack
+    and Reynolds number, i.e. on the rotor operating point (omega, inflow, loading
+    and atmosphere), so they are identical for every microphone grid, quadrant or
+    building microphone set evaluated over the same trajectory. With the cache
+    enabled, only the observer dependent part (retarded time, directivity and
+    propagation) is recomputed.
+
+    Assumptions:
+    The boundary layer solver is a deterministic function of its arguments.
+    Callers do not modify the returned source terms; copies are handed out anyway
+
+    Source:
+    None
+
+    Inputs:
+    max_entries   - source term sets kept in memory, least recently used evicted
+
+    Outputs:
+    patched       - names of the noise modules using the cached solver
+
+    Properties Used:
+    N/A
+    """
+    import SUAVE.Methods.Noise.Fidelity_One.Propeller
+
+    source_cache_statistics.max_entries = max_entries
+    patched = []
+    for name,module in list(sys.modules.items()):
+        if not name.startswith(NOISE_MODULES) or module == None:
+            continue
+        function = getattr(module,'airfoil_analysis',None)
+        if function == None or not callable(function) or name in _originals:
+            continue
+        _originals[name] = function
+        module.airfoil_analysis = cached_airfoil_analysis
+        patched.append(name)
+
+    if len(_originals) == 0:
+        print('Rotor source cache: no boundary layer solver found in ' + NOISE_MODULES + ', nothing is cached')
+    return patched
+
+# ----------------------------------------------------------------------
+#   Disable Source Cache
+# ----------------------------------------------------------------------
+def disable_source_cache():
+    """Restores the original boundary layer solver and clears the cache.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    for name,function in _originals.items():
+        sys.modules[name].airfoil_analysis = function
+    _originals.clear()
+    _source_terms.clear()
+    source_cache_statistics.entries = 0
+    return
+
+# ----------------------------------------------------------------------
+#   Cached Airfoil Analysis
+# ----------------------------------------------------------------------
+def cached_airfoil_analysis(*args,**kwargs):
+    """Drop-in replacement of airfoil_analysis that returns stored source terms for
+    inputs seen before.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    see SUAVE.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis
+
+    Outputs:
+    see SUAVE.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis
+
+    Properties Used:
+    N/A
+    """
+    key = source_term_key(args,kwargs)
+    if key in _source_terms:
+        _source_terms.move_to_end(key)
+        source_cache_statistics.hits += 1
+        return copy.deepcopy(_source_terms[key])
+
+    source_cache_statistics.misses += 1
+    function     = next(iter(_originals.values()))
+    source_terms = function(*args,**kwargs)
+
+    _source_terms[key] = copy.deepcopy(source_terms)
+    while len(_source_terms) > source_cache_statistics.get('max_entries',256):
+        _source_terms.popitem(last = False)
+    source_cache_statistics.entries = len(_source_terms)
+    return source_terms
+
+# ----------------------------------------------------------------------
+#   Source Term Key
+# ----------------------------------------------------------------------
+def source_term_key(args,kwargs):
+    """Content hash of the boundary layer solver inputs: airfoil geometry, sectional
+    angles of attack and Reynolds numbers, panel count and options.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    args, kwargs  - arguments of airfoil_analysis
+
+    Outputs:
+    key           - hexadecimal sha1 digest
+
+    Properties Used:
+    N/A
+    """
+    sha = hashlib.sha1()
+    for value in args:
+        update_key(sha,value)
+    for name in sorted(kwargs.keys()):
+        sha.update(name.encode())
+        update_key(sha,kwargs[name])
+    return sha.hexdigest()
+
+# ----------------------------------------------------------------------
+#   Update Key
+# ----------------------------------------------------------------------
+def update_key(sha,value):
+    if isinstance(value,dict):
+        for name in sorted(value.keys()):
+            sha.update(str(name).encode())
+            update_key(sha,value[name])
+    elif isinstance(value,np.ndarray) and value.dtype.kind in 'biuf':
+        sha.update(str(value.shape).encode())
+        sha.update(np.ascontiguousarray(value,dtype = float).tobytes())
+    elif isinstance(value,np.ndarray):
+        sha.update(repr(value.tolist()).encode())
+    elif isinstance(value,(list,tuple)):
+        sha.update(str(len(value)).encode())
+        for item in value:
+            update_key(sha,item)
+    else:
+        sha.update(repr(value).encode())
+    return
+
+# ----------------------------------------------------------------------
+#   Print Source Cache Statistics
+# ----------------------------------------------------------------------
+def print_source_cache_statistics(statistics = None):
+    if statistics == None:
+        statistics = source_cache_statistics
+    calls = statistics.hits + statistics.misses
+    print('Rotor source cache: ' + str(statistics.hits) + ' hits, ' + str(statistics.misses) + ' misses' +
+          (', ' + str(round(100.*statistics.hits/calls,1)) + ' % reused' if calls > 0 else ''))
+    return
@@ -0,0 +1,331 @@
+# Spectrum_Tables.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.dbA_noise import A_weighting
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools           import SPL_harmonic_to_third_octave
+import collections
+import hashlib
+import sys
+import time
+import numpy as np
+
+# prefix of the modules whose spectrum functions are replaced by the table ones
+NOISE_MODULES = 'SUAVE.Methods.Noise'
+
+# binning matrices and A-weighting vectors of this process, least recently used first
+_tables    = collections.OrderedDict()
+MAX_TABLES = 64
+
+# ----------------------------------------------------------------------
+#   Third Octave Spectrum
+# ----------------------------------------------------------------------
+def third_octave_spectrum(SPL,f,settings):
+    """Drop-in replacement of SPL_harmonic_to_third_octave. The spectrum is
+    converted to the energy domain and binned into the third octave bands of the
+    settings with a single batched matrix product, using a binning matrix that is
+    built once per frequency set and band set and then looked up.
+
+    Assumptions:
+    A frequency belongs to the band with lower_frequency <= f < upper_frequency.
+    Bands without energy are at 0 dB
+
+    Source:
+    None
+
+    Inputs:
+    SPL                          - spectrum, frequencies along the last axis   [dB]
+    f                            - frequencies, with the same last axis and leading
+                                   axes matching or broadcasting to those of SPL [Hz]
+    settings.lower_frequencies   - lower band edges                            [Hz]
+    settings.upper_frequencies   - upper band edges                            [Hz]
+
+    Outputs:
+    SPL_third_octave             - SPL.shape[:-1] + (bands,)                   [dB]
+
+    Properties Used:
+    N/A
+    """
+    f       = align_frequencies(f,SPL)
+    binning = third_octave_binning_matrix(f,settings)
+    energy  = 10**(np.nan_to_num(SPL,nan = -np.inf, posinf = -np.inf)/10)
+
+    # fold the axes the frequencies do not depend on into the rows of one matrix
+    # product per frequency set, instead of one vector-matrix product per spectrum
+    shared  = [axis for axis in range(SPL.ndim - 1) if f.shape[axis] > 1]
+    folded  = [axis for axis in range(SPL.ndim - 1) if f.shape[axis] == 1]
+    order   = shared + folded + [SPL.ndim - 1]
+    rows    = int(np.prod([SPL.shape[axis] for axis in folded]))
+    energy  = np.transpose(energy,order).reshape([SPL.shape[axis] for axis in shared] + [rows,SPL.shape[-1]])
+    binning = binning.reshape([f.shape[axis] for axis in shared] + list(binning.shape[-2:]))
+    energy  = np.matmul(energy,binning).reshape([SPL.shape[axis] for axis in shared + folded] + [binning.shape[-1]])
+    energy  = np.transpose(energy,np.argsort(order))
+
+    SPL_third_octave = np.zeros_like(energy)
+    SPL_third_octave[energy > 0] = 10*np.log10(energy[energy > 0])
+    return SPL_third_octave
+
+# ----------------------------------------------------------------------
+#   Weighted Spectrum
+# ----------------------------------------------------------------------
+def A_weighted_spectrum(SPL,f):
+    """Drop-in replacement of A_weighting that adds a stored A-weighting vector of
+    the frequency set instead of evaluating the weighting function again.
+
+    Assumptions:
+    None
+
+    Source:
+    IEC 61672-1:2013, A-weighting
+
+    Inputs:
+    SPL       - spectrum, frequencies along the last axis                     [dB]
+    f         - frequencies, see third_octave_spectrum                        [Hz]
+
+    Outputs:
+    SPL_dBA   - A-weighted spectrum                                           [dBA]
+
+    Properties Used:
+    N/A
+    """
+    return SPL + A_weighting_vector(align_frequencies(f,SPL))
+
+# ----------------------------------------------------------------------
+#   Align Frequencies
+# ----------------------------------------------------------------------
+def align_frequencies(f,SPL):
+    """Shapes the frequencies to broadcast against the spectrum and collapses the
+    leading axes along which they do not change, e.g. microphones and rotors, so
+    the tables hold one row per distinct frequency set.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    f         - frequencies, leading axes matching the first axes of SPL      [Hz]
+    SPL       - spectrum                                                      [dB]
+
+    Outputs:
+    f         - frequencies of shape broadcastable to SPL                     [Hz]
+
+    Properties Used:
+    N/A
+    """
+    f = np.asarray(f,dtype = float)
+    if f.ndim < SPL.ndim:
+        f = f.reshape(f.shape[:-1] + (1,)*(SPL.ndim - f.ndim) + f.shape[-1:])
+    for axis in range(f.ndim - 1):
+        if f.shape[axis] > 1 and np.all(f == f.take([0],axis = axis)):
+            f = f.take([0],axis = axis)
+    return f
+
+# ----------------------------------------------------------------------
+#   Third Octave Binning Matrix
+# ----------------------------------------------------------------------
+def third_octave_binning_matrix(f,settings):
+    """Returns the binning matrix of a frequency set, (..., frequencies, bands),
+    holding 1 where a frequency falls in a band. It is computed on the first
+    request for a frequency set and band set and stored in the table cache.
+
+    Assumptions:
+    See third_octave_spectrum
+
+    Source:
+    None
+
+    Inputs:
+    f         - frequencies                                                   [Hz]
+    settings  - see third_octave_spectrum
+
+    Outputs:
+    binning   - f.shape + (bands,)
+
+    Properties Used:
+    N/A
+    """
+    lf  = np.asarray(settings.lower_frequencies,dtype = float)
+    uf  = np.asarray(settings.upper_frequencies,dtype = float)
+    key = table_key('binning',f,lf,uf)
+    if key not in _tables:
+        store_table(key,((f[...,None] >= lf) & (f[...,None] < uf))*1.)
+    _tables.move_to_end(key)
+    return _tables[key]
+
+# ----------------------------------------------------------------------
+#   A Weighting Vector
+# ----------------------------------------------------------------------
+def A_weighting_vector(f):
+    """Returns the A-weighting of a frequency set, computed on the first request
+    and stored in the table cache.
+
+    Assumptions:
+    None
+
+    Source:
+    IEC 61672-1:2013, A-weighting
+
+    Inputs:
+    f         - frequencies                                                   [Hz]
+
+    Outputs:
+    A_f       - weighting, f.shape                                            [dB]
+
+    Properties Used:
+    N/A
+    """
+    key = table_key('A_weighting',f)
+    if key not in _tables:
+        with np.errstate(divide = 'ignore'):
+            Ra_f = ((12194**2)*(f**4))/(((f**2) + (20.6**2))*((f**2) + (12194**2))*
+                                         (np.sqrt(((f**2) + (107.7**2))*((f**2) + (737.9**2)))))
+            store_table(key,2.0 + 20*np.log10(Ra_f))
+    _tables.move_to_end(key)
+    return _tables[key]
+
+# ----------------------------------------------------------------------
+#   Table Key
+# ----------------------------------------------------------------------
+def table_key(name,*arrays):
+    sha = hashlib.sha1(name.encode())
+    for array in arrays:
+        sha.update(str(array.shape).encode())
+        sha.update(np.ascontiguousarray(array,dtype = float).tobytes())
+    return sha.hexdigest()
+
+# ----------------------------------------------------------------------
+#   Store Table
+# ----------------------------------------------------------------------
+def store_table(key,table):
+    table.setflags(write = False)
+    _tables[key] = table
+    while len(_tables) > MAX_TABLES:
+        _tables.popitem(last = False)
+    return
+
+# ----------------------------------------------------------------------
+#   Enable Spectrum Tables
+# ----------------------------------------------------------------------
+def enable_spectrum_tables():
+    """Routes the third octave binning and A-weighting of the SUAVE noise methods
+    through the table versions.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    patched   - names of the modules using the table versions
+
+    Properties Used:
+    N/A
+    """
+    import SUAVE.Methods.Noise.Fidelity_One.Propeller
+
+    replacements = {'SPL_harmonic_to_third_octave':(SPL_harmonic_to_third_octave,third_octave_spectrum),
+                    'A_weighting'                 :(A_weighting,A_weighted_spectrum)}
+    patched = []
+    for name,module in list(sys.modules.items()):
+        if not name.startswith(NOISE_MODULES) or module == None:
+            continue
+        for function_name,(original,replacement) in replacements.items():
+            if getattr(module,function_name,None) is original:
+                setattr(module,function_name,replacement)
+                patched.append(name)
+    return sorted(set(patched))
+
+# ----------------------------------------------------------------------
+#   Disable Spectrum Tables
+# ----------------------------------------------------------------------
+def disable_spectrum_tables():
+    replacements = {'SPL_harmonic_to_third_octave':(third_octave_spectrum,SPL_harmonic_to_third_octave),
+                    'A_weighting'                 :(A_weighted_spectrum,A_weighting)}
+    for name,module in list(sys.modules.items()):
+        if not name.startswith(NOISE_MODULES) or module == None:
+            continue
+        for function_name,(replacement,original) in replacements.items():
+            if getattr(module,function_name,None) is replacement:
+                setattr(module,function_name,original)
+    _tables.clear()
+    return
+
+# ----------------------------------------------------------------------
+#   Benchmark Spectrum Tables
+# ----------------------------------------------------------------------
+def benchmark_spectrum_tables(settings,number_of_control_points = 16,number_of_microphones = 400,number_of_rotors = 4,
+                              number_of_blades = 3,rpm = [1500.,3000.],repetitions = 5):
+    """Times the third octave binning and A-weighting of a synthetic harmonic
+    spectrum with the SUAVE functions and with the table versions, and checks
+    that both give the same levels.
+
+    Assumptions:
+    Blade passing harmonics of settings.harmonics at rotational speeds spread
+    over rpm, random harmonic levels between 40 and 90 dB
+
+    Source:
+    None
+
+    Inputs:
+    settings                  - noise settings with harmonics and band edges
+    number_of_control_points, number_of_microphones, number_of_rotors
+                              - dimensions of the spectrum
+    number_of_blades          - blades of the rotors
+    rpm                       - lowest and highest rotational speed          [rpm]
+    repetitions               - timed evaluations of each version
+
+    Outputs:
+    benchmark.original_time   - mean time of the SUAVE functions             [s]
+    benchmark.table_time      - mean time of the table versions, cache warm  [s]
+    benchmark.first_table_time- time of the first table evaluation           [s]
+    benchmark.speedup         - original_time/table_time
+    benchmark.maximum_error   - largest third octave dBA difference          [dB]
+
+    Properties Used:
+    N/A
+    """
+    harmonics = np.asarray(settings.harmonics,dtype = float)
+    omega     = np.linspace(rpm[0],rpm[1],number_of_control_points)*2*np.pi/60
+    f_cpt     = number_of_blades*omega[:,None]*harmonics[None,:]/(2*np.pi)
+    f         = np.tile(f_cpt[:,None,None,:],(1,number_of_microphones,number_of_rotors,1))
+    SPL       = 40 + 50*np.random.rand(number_of_control_points,number_of_microphones,number_of_rotors,len(harmonics))
+
+    def original():
+        return SPL_harmonic_to_third_octave(A_weighting(SPL,f),f_cpt,settings)
+
+    def table():
+        return third_octave_spectrum(A_weighted_spectrum(SPL,f),f_cpt,settings)
+
+    _tables.clear()
+    ti        = time.time()
+    SPL_table = table()
+    benchmark = Data()
+    benchmark.first_table_time = time.time() - ti
+
+    ti = time.time()
+    for i in range(repetitions):
+        SPL_original = original()
+    benchmark.original_time = (time.time() - ti)/repetitions
+
+    ti = time.time()
+    for i in range(repetitions):
+        SPL_table = table()
+    benchmark.table_time    = (time.time() - ti)/repetitions
+    benchmark.speedup       = benchmark.original_time/benchmark.table_time
+    benchmark.maximum_error = np.max(np.abs(np.nan_to_num(SPL_original) - np.nan_to_num(SPL_table)))
+
+    print('Spectrum tables: ' + str(round(benchmark.original_time*1000,3)) + ' ms SUAVE, ' +
+          str(round(benchmark.table_time*1000,3)) + ' ms tables (' + str(round(benchmark.first_table_time*1000,3)) +
+          ' ms first call), speedup ' + str(round(benchmark.speedup,2)) + ', maximum difference ' +
+          str(round(benchmark.maximum_error,4)) + ' dB')
+    return benchmark
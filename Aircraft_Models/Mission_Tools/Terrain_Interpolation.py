@@ -0,0 +1,346 @@
+# Terrain_Interpolation.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+from scipy.interpolate import griddata
+import Terrain_Store
+import time
+import sys
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Terrain Interpolator
+# ----------------------------------------------------------------------
+def terrain_interpolator(terrain):
+    """Returns the elevation grid of a terrain of Terrain_Store, with ascending
+    latitude and longitude axes, for terrain_elevation.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    terrain            - see Terrain_Store.load_terrain_file
+
+    Outputs:
+    grid.x             - ascending latitudes                                     [deg]
+    grid.y             - ascending longitudes                                    [deg]
+    grid.z             - (latitudes,longitudes) elevations                       [m]
+    grid.x_lookup, grid.y_lookup - cell tables of the axes, see axis_lookup
+
+    Properties Used:
+    N/A
+    """
+    latitude_order  = np.argsort(terrain.latitude)
+    longitude_order = np.argsort(terrain.longitude)
+    grid            = Data()
+    grid.x          = np.asarray(terrain.latitude,dtype = float)[latitude_order]
+    grid.y          = np.asarray(terrain.longitude,dtype = float)[longitude_order]
+    grid.z          = np.asarray(terrain.elevation,dtype = float)[latitude_order][:,longitude_order]
+    grid.x_lookup   = axis_lookup(grid.x)
+    grid.y_lookup   = axis_lookup(grid.y)
+    return grid
+
+# ----------------------------------------------------------------------
+#   Lattice Grid
+# ----------------------------------------------------------------------
+def lattice_grid(points,values):
+    """Detects whether scattered points cover a complete lattice of two coordinate
+    axes, as the rows of the topography files do, and reshapes their values to a
+    grid once.
+
+    Assumptions:
+    Lattice coordinates repeat exactly along each axis. The axes need not be evenly
+    spaced
+
+    Source:
+    None
+
+    Inputs:
+    points        - (x, y) tuple of coordinate arrays, or (points,2) array
+    values        - value of each point
+
+    Outputs:
+    grid.x        - ascending unique first coordinates
+    grid.y        - ascending unique second coordinates
+    grid.z        - (len(x),len(y)) values
+    grid.x_lookup, grid.y_lookup - cell tables of the axes, see axis_lookup
+    None when the points are not a complete lattice
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(points,tuple):
+        if len(points) != 2:
+            return None
+        x,y = [np.asarray(point,dtype = float).ravel() for point in points]
+    else:
+        points = np.asarray(points,dtype = float)
+        if points.ndim != 2 or points.shape[1] != 2:
+            return None
+        x,y = points[:,0],points[:,1]
+    values = np.asarray(values,dtype = float).ravel()
+    if len(x) != len(values) or len(y) != len(values):
+        return None
+
+    grid_x,index_x = np.unique(x,return_inverse = True)
+    grid_y,index_y = np.unique(y,return_inverse = True)
+    if len(grid_x) < 2 or len(grid_y) < 2 or len(grid_x)*len(grid_y) != len(values):
+        return None
+    flat_index = index_x*len(grid_y) + index_y
+    if len(np.unique(flat_index)) != len(values):
+        return None
+
+    grid               = Data()
+    grid.x             = grid_x
+    grid.y             = grid_y
+    grid.z             = np.zeros(len(values))
+    grid.z[flat_index] = values
+    grid.z             = grid.z.reshape(len(grid_x),len(grid_y))
+    grid.x_lookup      = axis_lookup(grid_x)
+    grid.y_lookup      = axis_lookup(grid_y)
+    return grid
+
+# ----------------------------------------------------------------------
+#   Terrain Elevation
+# ----------------------------------------------------------------------
+def terrain_elevation(grid,x,y,method = 'linear',fill_value = np.nan):
+    """Vectorized lookup of a regular grid, e.g. the elevation of microphones or
+    aircraft positions, by bilinear or bicubic interpolation.
+
+    Assumptions:
+    The cubic method is the cubic convolution of Keys (a = -0.5) in the index space
+    of the axes, with the stencil clamped at the grid edges. Linear and cubic
+    queries outside the grid are set to fill_value, nearest queries take the
+    nearest node, as with griddata
+
+    Source:
+    Keys, R., "Cubic convolution interpolation for digital image processing", IEEE
+    Transactions on Acoustics, Speech, and Signal Processing, 1981
+
+    Inputs:
+    grid          - see lattice_grid or terrain_interpolator
+    x, y          - query coordinates along the two axes of the grid, any matching shape
+    method        - 'linear', 'cubic' or 'nearest'
+    fill_value    - linear and cubic value outside the grid
+
+    Outputs:
+    z             - interpolated values, shape of x
+
+    Properties Used:
+    N/A
+    """
+    x     = np.asarray(x,dtype = float)
+    y     = np.asarray(y,dtype = float)
+    shape = np.broadcast(x,y).shape
+    x     = np.broadcast_to(x,shape).ravel()
+    y     = np.broadcast_to(y,shape).ravel()
+
+    i,t_x  = axis_index(grid.x,grid.x_lookup,x)
+    j,t_y  = axis_index(grid.y,grid.y_lookup,y)
+    N_y    = len(grid.y)
+    values = grid.z.ravel()
+
+    if method == 'nearest':
+        z = values[(i + (t_x > 0.5))*N_y + j + (t_y > 0.5)]
+    elif method == 'linear':
+        k     = i*N_y + j
+        z_low = values[k]       + t_y*(values[k + 1]       - values[k])
+        z_up  = values[k + N_y] + t_y*(values[k + N_y + 1] - values[k + N_y])
+        z     = z_low + t_x*(z_up - z_low)
+    elif method == 'cubic':
+        w_x = cubic_weights(t_x)
+        w_y = cubic_weights(t_y)
+        z   = np.zeros(len(x))
+        for m in range(4):
+            i_m = np.clip(i + m - 1,0,len(grid.x) - 1)*N_y
+            for n in range(4):
+                z += values[i_m + np.clip(j + n - 1,0,N_y - 1)]*w_x[m]*w_y[n]
+    else:
+        raise ValueError('Unknown terrain interpolation method ' + str(method))
+
+    if method != 'nearest':
+        outside    = (x < grid.x[0]) | (x > grid.x[-1]) | (y < grid.y[0]) | (y > grid.y[-1]) | np.isnan(x) | np.isnan(y)
+        z[outside] = fill_value
+    return z.reshape(shape)
+
+# ----------------------------------------------------------------------
+#   Axis Lookup
+# ----------------------------------------------------------------------
+def axis_lookup(axis):
+    """Table of the cell of an ascending axis for uniform bins of half the smallest
+    cell width, so a query finds its cell with one division, one lookup and at most
+    one correction, without a binary search over the axis."""
+    lookup       = Data()
+    lookup.start = axis[0]
+    lookup.width = np.min(np.diff(axis))/2
+    bins         = axis[0] + lookup.width*np.arange(int(np.ceil((axis[-1] - axis[0])/lookup.width)) + 1)
+    lookup.cells = np.minimum(np.maximum(np.searchsorted(axis,bins,side = 'right') - 1,0),len(axis) - 2)
+    return lookup
+
+# ----------------------------------------------------------------------
+#   Axis Index
+# ----------------------------------------------------------------------
+def axis_index(axis,lookup,q):
+    """Cell of an ascending axis holding each query, and the fraction of the cell
+    from its lower node."""
+    bins = np.minimum(np.maximum((q - lookup.start)/lookup.width,0),len(lookup.cells) - 1)
+    i    = lookup.cells[np.nan_to_num(bins).astype(np.intp)]
+    i   += (q >= axis[i + 1]) & (i < len(axis) - 2)
+    t    = np.minimum(np.maximum((q - axis[i])/(axis[i + 1] - axis[i]),0.),1.)
+    return i, np.nan_to_num(t)
+
+# ----------------------------------------------------------------------
+#   Cubic Weights
+# ----------------------------------------------------------------------
+def cubic_weights(t):
+    """Cubic convolution weights of the nodes i-1, i, i+1, i+2, a = -0.5"""
+    t2 = t*t
+    t3 = t2*t
+    return [-0.5*t3 + t2 - 0.5*t,
+             1.5*t3 - 2.5*t2 + 1.,
+            -1.5*t3 + 2.*t2 + 0.5*t,
+             0.5*t3 - 0.5*t2]
+
+# ----------------------------------------------------------------------
+#   Lattice Griddata
+# ----------------------------------------------------------------------
+def lattice_griddata(points,values,xi,method = 'linear',fill_value = np.nan,rescale = False):
+    """Drop-in replacement of scipy.interpolate.griddata that interpolates points
+    forming a complete lattice, such as topography files, on the lattice instead of
+    on a Delaunay triangulation of every point.
+
+    Assumptions:
+    Linear interpolation on the lattice is bilinear within each cell, where griddata
+    is linear on the two triangles its triangulation splits the cell into, so the
+    two differ inside cells and agree at the nodes. Cubic interpolation and points
+    that are not a lattice are passed to griddata
+
+    Source:
+    None
+
+    Inputs:
+    see scipy.interpolate.griddata
+
+    Outputs:
+    see scipy.interpolate.griddata
+
+    Properties Used:
+    N/A
+    """
+    grid = None
+    if method in ['linear','nearest'] and isinstance(xi,tuple) and len(xi) == 2:
+        grid = lattice_grid(points,values)
+    if grid == None:
+        return griddata(points,values,xi,method = method,fill_value = fill_value,rescale = rescale)
+    return terrain_elevation(grid,xi[0],xi[1],method,fill_value)
+
+# ----------------------------------------------------------------------
+#   Enable Terrain Interpolation
+# ----------------------------------------------------------------------
+def enable_terrain_interpolation():
+    """Routes the griddata interpolation of topography in
+    preprocess_topography_and_route_data through lattice_griddata.
+
+    Assumptions:
+    The modules of Terrain_Store.TOPOGRAPHY_MODULES import griddata from
+    scipy.interpolate by name
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    patched   - names of the modules using lattice_griddata
+
+    Properties Used:
+    N/A
+    """
+    import SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points
+
+    patched = []
+    for name in Terrain_Store.TOPOGRAPHY_MODULES:
+        module = sys.modules.get(name,None)
+        if module != None and getattr(module,'griddata',None) is griddata:
+            module.griddata = lattice_griddata
+            patched.append(name)
+    return patched
+
+# ----------------------------------------------------------------------
+#   Disable Terrain Interpolation
+# ----------------------------------------------------------------------
+def disable_terrain_interpolation():
+    for name in Terrain_Store.TOPOGRAPHY_MODULES:
+        module = sys.modules.get(name,None)
+        if module != None and getattr(module,'griddata',None) is lattice_griddata:
+            module.griddata = griddata
+    return
+
+# ----------------------------------------------------------------------
+#   Benchmark Terrain Interpolation
+# ----------------------------------------------------------------------
+def benchmark_terrain_interpolation(city = 'LA',area = 'Area',number_of_queries = 1000000):
+    """Times the interpolation of a terrain at random positions with griddata and
+    with the terrain grid, and compares the two.
+
+    Assumptions:
+    Positions uniformly distributed within the terrain bounds
+
+    Source:
+    None
+
+    Inputs:
+    city, area                  - terrain, see Terrain_Store.load_terrain
+    number_of_queries           - number of positions
+
+    Outputs:
+    benchmark.griddata_time     - time of griddata, linear                      [s]
+    benchmark.grid_time         - time of the bilinear grid lookup              [s]
+    benchmark.cubic_time        - time of the bicubic grid lookup               [s]
+    benchmark.speedup           - griddata_time/grid_time
+    benchmark.maximum_error     - largest bilinear-griddata difference          [m]
+    benchmark.node_error        - largest difference at the terrain nodes       [m]
+
+    Properties Used:
+    N/A
+    """
+    terrain   = Terrain_Store.load_terrain(city,area)
+    data      = Terrain_Store.terrain_points(terrain)
+    Long      = data[:,0]
+    Lat       = data[:,1]
+    Elev      = data[:,2]
+    lat_q     = terrain.bounds.south + (terrain.bounds.north - terrain.bounds.south)*np.random.rand(number_of_queries)
+    long_q    = terrain.bounds.west  + (terrain.bounds.east  - terrain.bounds.west )*np.random.rand(number_of_queries)
+
+    benchmark = Data()
+    ti        = time.time()
+    z_scipy   = griddata((Lat,Long),Elev,(lat_q,long_q),method = 'linear')
+    benchmark.griddata_time = time.time() - ti
+
+    ti        = time.time()
+    grid      = terrain_interpolator(terrain)
+    z_grid    = terrain_elevation(grid,lat_q,long_q,'linear')
+    benchmark.grid_time     = time.time() - ti
+
+    ti        = time.time()
+    terrain_elevation(grid,lat_q,long_q,'cubic')
+    benchmark.cubic_time    = time.time() - ti
+
+    benchmark.speedup       = benchmark.griddata_time/benchmark.grid_time
+    benchmark.maximum_error = float(np.nanmax(np.abs(z_grid - z_scipy)))
+    benchmark.node_error    = float(np.max(np.abs(terrain_elevation(grid,Lat,Long,'linear') - Elev)))
+
+    print('Terrain interpolation, ' + str(number_of_queries) + ' positions on ' + terrain.name + ': ' +
+          str(round(benchmark.griddata_time*1000,1)) + ' ms griddata, ' + str(round(benchmark.grid_time*1000,1)) +
+          ' ms bilinear, ' + str(round(benchmark.cubic_time*1000,1)) + ' ms bicubic, speedup ' +
+          str(round(benchmark.speedup,1)) + ', maximum difference ' + str(round(benchmark.maximum_error,2)) +
+          ' m, at nodes ' + str(round(benchmark.node_error,4)) + ' m')
+    return benchmark
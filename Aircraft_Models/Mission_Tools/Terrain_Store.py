@@ -0,0 +1,332 @@
+# Terrain_Store.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import hashlib
+import json
+import glob
+import sys
+import os
+import numpy as np
+
+# bump to invalidate every stored terrain, e.g. after a change in how terrains are stored
+STORE_VERSION = 2
+
+# directories searched for topography files, earlier directories take precedence
+TERRAIN_DIRECTORIES = [os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','..','Trajectory_Modeling','3d_Landscape_Data'),
+                       os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','..','Trajectory_Modeling','3d_Landscape_Simulation')]
+
+default_store_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)),'Terrain_Store')
+
+# modules whose topography files are read from the store
+TOPOGRAPHY_MODULES = ['SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points']
+
+# ----------------------------------------------------------------------
+#   Terrain Registry
+# ----------------------------------------------------------------------
+def terrain_registry(directories = None):
+    """Finds the topography files, <city>_Metropolitan_<area>.txt, of the terrain
+    directories by city and area.
+
+    Assumptions:
+    A file found in more than one directory is taken from the first directory,
+    copies with different contents are reported
+
+    Source:
+    None
+
+    Inputs:
+    directories                - defaults to TERRAIN_DIRECTORIES
+
+    Outputs:
+    registry.<city>.<area>     - path of the topography file, e.g. registry.LA.Zoomed_Area
+
+    Properties Used:
+    N/A
+    """
+    if directories == None:
+        directories = TERRAIN_DIRECTORIES
+
+    registry = Data()
+    for directory in directories:
+        for path in sorted(glob.glob(os.path.join(directory,'*_Metropolitan_*.txt'))):
+            city,area = os.path.splitext(os.path.basename(path))[0].split('_Metropolitan_',1)
+            if city not in registry:
+                registry[city] = Data()
+            if area not in registry[city]:
+                registry[city][area] = os.path.normpath(path)
+            elif file_key(path) != file_key(registry[city][area]):
+                print('Terrain registry: ' + os.path.normpath(path) + ' differs from ' + registry[city][area] + ', using the latter')
+    return registry
+
+# ----------------------------------------------------------------------
+#   Load Terrain
+# ----------------------------------------------------------------------
+def load_terrain(city,area = 'Area',store_directory = None):
+    """Loads the terrain of a city from the store, converting its topography file
+    on first use.
+
+    Assumptions:
+    See load_terrain_file
+
+    Source:
+    None
+
+    Inputs:
+    city              - e.g. 'LA', 'SF', 'NY', 'BOS', 'RIO_BRA'
+    area              - e.g. 'Area', 'Area_Small', 'Area_Large', 'Zoomed_Area'
+    store_directory   - defaults to Mission_Tools/Terrain_Store
+
+    Outputs:
+    terrain           - see load_terrain_file
+
+    Properties Used:
+    N/A
+    """
+    registry = terrain_registry()
+    if city not in registry or area not in registry[city]:
+        raise ValueError('No topography file for ' + city + ' ' + area + ', available: ' +
+                         ', '.join([name + ' ' + ', '.join(registry[name].keys()) for name in registry.keys()]))
+    return load_terrain_file(registry[city][area],store_directory)
+
+# ----------------------------------------------------------------------
+#   Load Terrain File
+# ----------------------------------------------------------------------
+def load_terrain_file(topography_file,store_directory = None):
+    """Loads the terrain of a topography file from the store, memory-mapping its
+    elevations, and converts the file first if it is not stored yet.
+
+    Assumptions:
+    Stored terrains are found by the contents of the topography file, so an edited
+    file is converted again and identical copies share one stored terrain
+
+    Source:
+    None
+
+    Inputs:
+    topography_file      - whitespace separated longitude, latitude, elevation rows
+    store_directory      - defaults to Mission_Tools/Terrain_Store
+
+    Outputs:
+    terrain.name         - name of the topography file
+    terrain.longitude    - longitudes of the grid columns, in file order           [deg]
+    terrain.latitude     - latitudes of the grid rows, in file order               [deg]
+    terrain.elevation    - read-only (latitudes,longitudes) float64 memory map     [m]
+    terrain.bounds       - west, east, south and north edges                       [deg]
+
+    Properties Used:
+    N/A
+    """
+    if store_directory == None:
+        store_directory = default_store_directory
+
+    key        = file_key(topography_file)
+    store_file = os.path.join(store_directory,key)
+    if not (os.path.isfile(store_file + '.json') and os.path.isfile(store_file + '.npy')):
+        convert_terrain_file(topography_file,store_directory)
+
+    with open(store_file + '.json','r') as file:
+        metadata = json.load(file)
+    terrain           = Data()
+    terrain.name      = metadata['name']
+    terrain.longitude = np.array(metadata['longitude'])
+    terrain.latitude  = np.array(metadata['latitude'])
+    terrain.elevation = np.load(store_file + '.npy',mmap_mode = 'r')
+    terrain.bounds    = Data(metadata['bounds'])
+    return terrain
+
+# ----------------------------------------------------------------------
+#   Convert Terrain File
+# ----------------------------------------------------------------------
+def convert_terrain_file(topography_file,store_directory = None):
+    """Converts a topography file to a float64 elevation grid and a metadata file
+    with the grid axes and bounds.
+
+    Assumptions:
+    The rows of the file cover a complete longitude/latitude lattice, one latitude
+    after the other, as the Metropolitan_Area files do. Elevations are stored as
+    float64, the dtype of np.loadtxt, so the stored terrain reads back exactly
+
+    Source:
+    None
+
+    Inputs:
+    topography_file   - see load_terrain_file
+    store_directory   - defaults to Mission_Tools/Terrain_Store
+
+    Outputs:
+    store_file        - path of the stored terrain, without extension
+
+    Properties Used:
+    N/A
+    """
+    if store_directory == None:
+        store_directory = default_store_directory
+
+    data      = np.loadtxt(topography_file)
+    longitude = data[:len(np.unique(data[:,0])),0]
+    latitude  = data[::len(longitude),1]
+    if len(longitude)*len(latitude) != len(data) or \
+       not np.array_equal(terrain_points(Data(longitude = longitude,latitude = latitude,elevation = data[:,2].reshape(len(latitude),len(longitude)))),data):
+        raise ValueError(topography_file + ' is not a complete longitude/latitude lattice in row order')
+
+    elevation = data[:,2].reshape(len(latitude),len(longitude))
+    metadata  = {'name'      : os.path.basename(topography_file),
+                 'version'   : STORE_VERSION,
+                 'longitude' : longitude.tolist(),
+                 'latitude'  : latitude.tolist(),
+                 'bounds'    : {'west' : float(np.min(longitude)),'east' : float(np.max(longitude)),
+                                'south': float(np.min(latitude)) ,'north': float(np.max(latitude))}}
+
+    # write to temporary files first so that concurrent runs never read a partial terrain
+    if not os.path.isdir(store_directory):
+        os.makedirs(store_directory,exist_ok = True)
+    store_file     = os.path.join(store_directory,file_key(topography_file))
+    temporary_file = store_file + '.' + str(os.getpid()) + '.tmp'
+    with open(temporary_file,'wb') as file:
+        np.save(file,elevation)
+    os.replace(temporary_file,store_file + '.npy')
+    with open(temporary_file,'w') as file:
+        json.dump(metadata,file)
+    os.replace(temporary_file,store_file + '.json')
+    return store_file
+
+# ----------------------------------------------------------------------
+#   Convert Terrain Files
+# ----------------------------------------------------------------------
+def convert_terrain_files(directories = None,store_directory = None):
+    """One-time conversion of every topography file of the terrain directories.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    directories       - defaults to TERRAIN_DIRECTORIES
+    store_directory   - defaults to Mission_Tools/Terrain_Store
+
+    Outputs:
+    converted         - paths of the stored terrains
+
+    Properties Used:
+    N/A
+    """
+    if directories == None:
+        directories = TERRAIN_DIRECTORIES
+    if store_directory == None:
+        store_directory = default_store_directory
+
+    converted = []
+    for directory in directories:
+        for path in sorted(glob.glob(os.path.join(directory,'*_Metropolitan_*.txt'))):
+            store_file = os.path.join(store_directory,file_key(path))
+            if not (os.path.isfile(store_file + '.json') and os.path.isfile(store_file + '.npy')):
+                store_file = convert_terrain_file(path,store_directory)
+                print('Converted ' + os.path.normpath(path))
+            converted.append(store_file)
+    return sorted(set(converted))
+
+# ----------------------------------------------------------------------
+#   Terrain Points
+# ----------------------------------------------------------------------
+def terrain_points(terrain):
+    """Returns the terrain as the (points,3) longitude, latitude, elevation array of
+    np.loadtxt of its topography file, in the same row order.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    terrain     - see load_terrain_file
+
+    Outputs:
+    data        - longitude, latitude and elevation columns        [deg, deg, m]
+
+    Properties Used:
+    N/A
+    """
+    longitude,latitude = np.meshgrid(terrain.longitude,terrain.latitude)
+    return np.stack([longitude.ravel(),latitude.ravel(),np.asarray(terrain.elevation,dtype = float).ravel()],axis = 1)
+
+# ----------------------------------------------------------------------
+#   File Key
+# ----------------------------------------------------------------------
+def file_key(topography_file):
+    sha = hashlib.sha1(str(STORE_VERSION).encode())
+    with open(topography_file,'rb') as file:
+        sha.update(file.read())
+    return os.path.splitext(os.path.basename(topography_file))[0] + '_' + sha.hexdigest()[:16]
+
+# ----------------------------------------------------------------------
+#   Terrain Numpy
+# ----------------------------------------------------------------------
+class Terrain_Numpy(object):
+    """Stands in for numpy in the modules of TOPOGRAPHY_MODULES, reading topography
+    files with np.loadtxt from the store and passing everything else to numpy.
+    Files that are not a complete lattice are read with np.loadtxt.
+    """
+    def __getattr__(self,name):
+        return getattr(np,name)
+
+    def loadtxt(self,fname,*args,**kwargs):
+        if len(args) == 0 and len(kwargs) == 0 and isinstance(fname,str) and \
+           '_Metropolitan_' in os.path.basename(fname) and os.path.isfile(fname):
+            try:
+                return terrain_points(load_terrain_file(fname))
+            except ValueError:
+                pass
+        return np.loadtxt(fname,*args,**kwargs)
+
+terrain_numpy = Terrain_Numpy()
+
+# ----------------------------------------------------------------------
+#   Enable Terrain Store
+# ----------------------------------------------------------------------
+def enable_terrain_store():
+    """Routes the np.loadtxt of topography files in preprocess_topography_and_route_data
+    through the terrain store.
+
+    Assumptions:
+    The modules of TOPOGRAPHY_MODULES read topography files with
+    np.loadtxt(topography_file) of their module level numpy import
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    patched   - names of the modules reading topography from the store
+
+    Properties Used:
+    N/A
+    """
+    import SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points
+
+    patched = []
+    for name in TOPOGRAPHY_MODULES:
+        module = sys.modules.get(name,None)
+        if module != None and getattr(module,'np',None) is np:
+            module.np = terrain_numpy
+            patched.append(name)
+    return patched
+
+# ----------------------------------------------------------------------
+#   Disable Terrain Store
+# ----------------------------------------------------------------------
+def disable_terrain_store():
+    for name in TOPOGRAPHY_MODULES:
+        module = sys.modules.get(name,None)
+        if module != None and getattr(module,'np',None) is terrain_numpy:
+            module.np = np
+    return
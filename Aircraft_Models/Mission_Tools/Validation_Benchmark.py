@@ -0,0 +1,373 @@
+# Validation_Benchmark.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import matplotlib.pyplot as plt
+import matplotlib.colors as colors
+import tracemalloc
+import json
+import time
+import os
+import numpy as np
+
+import Parallel_Noise
+
+# ----------------------------------------------------------------------
+#   Run Validation Benchmark
+# ----------------------------------------------------------------------
+def run_validation_benchmark(cases,plot_parameters,reference_data = {},filename = 'noise_validation',baseline = None,tolerance = 0.01):
+    """Runs noise validation cases one after the other and records, per case, the
+    wall time, the peak memory, the curves of the figures the case draws and the
+    error of its SUAVE curves against experimental data. The results are written
+    as JSON and compared against a baseline written by an earlier run, so a change
+    to the noise methods can be shown to leave the validation curves in place.
+
+    Assumptions:
+    Cases draw their results with matplotlib, in figures the case creates, and do
+    not save figures. Curves are told apart by their label, 'SUAVE', 'Exp.' or a
+    reference code, or else by the line colors of the plot parameters. Without a
+    reference file for a figure, the error is taken against the experimental
+    curves of the same figure, or else against its reference code curves, as
+    recorded in error.against. Peak memory is the peak of the allocations traced
+    by tracemalloc while the case runs, which slows the case down slightly.
+    tracemalloc only sees this process, so the propeller noise is evaluated
+    serially while the cases run, see Parallel_Noise.serial_noise
+
+    Source:
+    None
+
+    Inputs:
+    cases                        - ordered dict, case name: function(plot_parameters,save_figures)
+    plot_parameters              - plot parameters passed to the cases, with Slc, Elc and Rlc
+    reference_data               - dict, figure name: (reference file, section, x scale),
+                                   experimental data the SUAVE curves of the figure are
+                                   compared to, see load_reference_data
+    filename                     - results written as filename_benchmark.json, or None
+    baseline                     - results file of an earlier run, or None
+    tolerance                    - largest curve shift against the baseline        [dB]
+
+    Outputs:
+    results.<case>.time          - wall time                                     [s]
+    results.<case>.peak_memory   - peak traced memory                            [bytes]
+    results.<case>.errors        - figure: rms_error, maximum_error, points, against [dB]
+    results.<case>.curves        - key: label, kind, x, y
+    results.comparison           - see compare_benchmark, when a baseline is given
+
+    Properties Used:
+    N/A
+    """
+    results = Data()
+    for case_name,case in cases.items():
+        plt.close('all')
+        print('Running ' + case_name)
+        serial = Parallel_Noise.serial_noise(True)
+        tracemalloc.start()
+        ti = time.time()
+        try:
+            case(plot_parameters,False)
+        finally:
+            Parallel_Noise.serial_noise(serial)
+        case_time   = time.time() - ti
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        curves = figure_curves(plot_parameters)
+        errors = Data()
+        for figure_name in sorted(set([curve.figure for curve in curves.values()])):
+            if figure_name in reference_data:
+                reference_file,section,x_scale = reference_data[figure_name]
+                reference                      = load_reference_data(reference_file)[section]
+                experiments                    = [Data(x = reference[:,0]*x_scale,y = reference[:,1])]
+                against                        = os.path.basename(reference_file)
+            else:
+                experiments = [curve for curve in curves.values() if curve.figure == figure_name and curve.kind == 'experiment']
+                against     = 'experiment'
+            if len(experiments) == 0:
+                experiments = [curve for curve in curves.values() if curve.figure == figure_name and curve.kind == 'reference']
+                against     = 'reference'
+            error = validation_error(curves,figure_name,experiments)
+            if error != None:
+                error.against       = against
+                errors[figure_name] = error
+
+        results[case_name]             = Data()
+        results[case_name].time        = case_time
+        results[case_name].peak_memory = peak_memory
+        results[case_name].errors      = errors
+        results[case_name].curves      = curves
+        plt.close('all')
+
+    if baseline != None and os.path.isfile(baseline):
+        results.comparison = compare_benchmark(results,read_benchmark(baseline),tolerance)
+
+    print_benchmark(results,list(cases.keys()))
+    if filename != None:
+        write_benchmark(results,list(cases.keys()),filename + '_benchmark.json')
+    return results
+
+# ----------------------------------------------------------------------
+#   Figure Curves
+# ----------------------------------------------------------------------
+def figure_curves(plot_parameters):
+    """Collects the lines of the open figures.
+
+    Assumptions:
+    See run_validation_benchmark
+
+    Source:
+    None
+
+    Inputs:
+    plot_parameters   - plot parameters with the SUAVE (Slc), experimental (Elc) and
+                        reference code (Rlc) colors
+
+    Outputs:
+    curves.<key>      - figure, label, kind ('SUAVE', 'experiment', 'reference' or
+                        'other'), x and y,
+                        key 'figure/axes index/line index'
+
+    Properties Used:
+    N/A
+    """
+    SUAVE_colors      = [colors.to_rgba(color) for color in plot_parameters.Slc]
+    experiment_colors = [colors.to_rgba(color) for color in plot_parameters.Elc]
+    reference_colors  = [colors.to_rgba(color) for color in plot_parameters.Rlc]
+    curves            = Data()
+    for number in plt.get_fignums():
+        figure      = plt.figure(number)
+        figure_name = figure.get_label() if figure.get_label() != '' else str(number)
+        for i,axes in enumerate(figure.axes):
+            for j,line in enumerate(axes.get_lines()):
+                label = line.get_label().strip()
+                color = colors.to_rgba(line.get_color())
+                if label.startswith('SUAVE'):
+                    kind = 'SUAVE'
+                elif label.startswith('Exp'):
+                    kind = 'experiment'
+                elif label.startswith(('Ref','CFD','ANOPP')):
+                    kind = 'reference'
+                elif label.startswith('_') and color in SUAVE_colors:
+                    kind = 'SUAVE'
+                elif label.startswith('_') and color in experiment_colors:
+                    kind = 'experiment'
+                elif label.startswith('_') and color in reference_colors:
+                    kind = 'reference'
+                else:
+                    kind = 'other'
+                key         = figure_name + '/' + str(i) + '/' + str(j)
+                curves[key] = Data(figure = figure_name,axes = i,label = label,kind = kind,
+                                   x = np.asarray(line.get_xdata(),dtype = float).ravel(),
+                                   y = np.asarray(line.get_ydata(),dtype = float).ravel())
+    return curves
+
+# ----------------------------------------------------------------------
+#   Validation Error
+# ----------------------------------------------------------------------
+def validation_error(curves,figure_name,experiments):
+    """Error of the SUAVE curves of a figure against experimental data. Each
+    experimental curve is compared to the SUAVE curve covering most of its points,
+    interpolated linearly at the experimental abscissae.
+
+    Assumptions:
+    Experimental points outside the abscissa range of the SUAVE curve are not
+    compared
+
+    Source:
+    None
+
+    Inputs:
+    curves        - see figure_curves
+    figure_name   - figure compared
+    experiments   - experimental curves, with x and y
+
+    Outputs:
+    error.rms_error      - root mean square error over the compared points      [dB]
+    error.maximum_error  - largest absolute error                               [dB]
+    error.points         - number of compared points
+    None when no point can be compared
+
+    Properties Used:
+    N/A
+    """
+    SUAVE_curves = [curve for curve in curves.values() if curve.figure == figure_name and curve.kind == 'SUAVE']
+    differences  = []
+    for experiment in experiments:
+        best = np.zeros(0)
+        for curve in SUAVE_curves:
+            valid = np.isfinite(curve.x) & np.isfinite(curve.y)
+            if np.sum(valid) < 2:
+                continue
+            order   = np.argsort(curve.x[valid])
+            x       = curve.x[valid][order]
+            y       = curve.y[valid][order]
+            covered = (experiment.x >= x[0]) & (experiment.x <= x[-1]) & np.isfinite(experiment.y)
+            if np.sum(covered) > len(best):
+                best = np.interp(experiment.x[covered],x,y) - experiment.y[covered]
+        differences.append(best)
+    if len(differences) == 0 or sum([len(difference) for difference in differences]) == 0:
+        return None
+
+    differences         = np.concatenate(differences)
+    error               = Data()
+    error.rms_error     = float(np.sqrt(np.mean(differences**2)))
+    error.maximum_error = float(np.max(np.abs(differences)))
+    error.points        = int(len(differences))
+    return error
+
+# ----------------------------------------------------------------------
+#   Load Reference Data
+# ----------------------------------------------------------------------
+def load_reference_data(filename):
+    """Reads an experimental data file of sections, each a title line followed by
+    'x, y' rows, with sections separated by blank lines, as the files of
+    Reference_Data_and_Images.
+
+    Assumptions:
+    A line that does not start with a number begins a new section. Rows without
+    both values are skipped
+
+    Source:
+    None
+
+    Inputs:
+    filename          - reference data file
+
+    Outputs:
+    data[<title>]     - (points,2) array of the section, title without surrounding spaces
+
+    Properties Used:
+    N/A
+    """
+    data  = {}
+    title = None
+    with open(filename,'r') as file:
+        for line in file:
+            line = line.strip()
+            if line == '':
+                continue
+            values = [value.strip() for value in line.split(',')]
+            try:
+                x = float(values[0])
+            except ValueError:
+                title       = line
+                data[title] = []
+                continue
+            if title != None and len(values) == 2 and values[1] != '':
+                data[title].append([x,float(values[1])])
+    return {title:np.array(rows).reshape(-1,2) for title,rows in data.items()}
+
+# ----------------------------------------------------------------------
+#   Compare Benchmark
+# ----------------------------------------------------------------------
+def compare_benchmark(results,baseline,tolerance):
+    """Compares the results of a benchmark run against a baseline run.
+
+    Assumptions:
+    Curves are matched by key. A curve whose number of points changed, or that is
+    missing from either run, counts as shifted
+
+    Source:
+    None
+
+    Inputs:
+    results     - see run_validation_benchmark
+    baseline    - results of the baseline run, see read_benchmark
+    tolerance   - largest curve shift                                           [dB]
+
+    Outputs:
+    comparison.<case>.time_ratio        - time/baseline time
+    comparison.<case>.memory_ratio      - peak memory/baseline peak memory
+    comparison.<case>.maximum_shift     - largest curve difference              [dB]
+    comparison.<case>.shifted_curves    - keys of the curves shifted beyond tolerance
+    comparison.<case>.error_change      - figure: change of the rms error       [dB]
+    cases missing from the baseline are not compared
+
+    Properties Used:
+    N/A
+    """
+    comparison = Data()
+    for case_name,case in results.items():
+        if case_name not in baseline:
+            continue
+        base           = baseline[case_name]
+        shifts         = {}
+        for key in set(list(case.curves.keys()) + list(base.curves.keys())):
+            if key not in case.curves or key not in base.curves or len(case.curves[key].y) != len(base.curves[key].y):
+                shifts[key] = np.inf
+                continue
+            difference  = np.abs(case.curves[key].y - base.curves[key].y)
+            difference  = difference[np.isfinite(difference)]
+            shifts[key] = float(np.max(difference)) if len(difference) > 0 else 0.
+
+        comparison[case_name]                = Data()
+        comparison[case_name].time_ratio     = case.time/base.time
+        comparison[case_name].memory_ratio   = case.peak_memory/max(base.peak_memory,1)
+        comparison[case_name].maximum_shift  = max(shifts.values()) if len(shifts) > 0 else 0.
+        comparison[case_name].shifted_curves = sorted([key for key in shifts if shifts[key] > tolerance])
+        comparison[case_name].error_change   = Data()
+        for figure_name in case.errors:
+            if figure_name in base.errors:
+                comparison[case_name].error_change[figure_name] = case.errors[figure_name].rms_error - base.errors[figure_name].rms_error
+    return comparison
+
+# ----------------------------------------------------------------------
+#   Write Benchmark
+# ----------------------------------------------------------------------
+def write_benchmark(results,case_names,filename):
+    output = {}
+    for case_name in case_names:
+        case   = results[case_name]
+        curves = {}
+        for key,curve in case.curves.items():
+            curves[key] = {'figure':curve.figure,'axes':curve.axes,'label':curve.label,'kind':curve.kind,
+                           'x':curve.x.tolist(),'y':curve.y.tolist()}
+        output[case_name] = {'time'       : case.time,
+                             'peak_memory': case.peak_memory,
+                             'errors'     : {name:dict(error) for name,error in case.errors.items()},
+                             'curves'     : curves}
+    with open(filename,'w') as file:
+        json.dump(output,file,indent = 1)
+    return
+
+# ----------------------------------------------------------------------
+#   Read Benchmark
+# ----------------------------------------------------------------------
+def read_benchmark(filename):
+    with open(filename,'r') as file:
+        output = json.load(file)
+    results = Data()
+    for case_name,case in output.items():
+        results[case_name]             = Data()
+        results[case_name].time        = case['time']
+        results[case_name].peak_memory = case['peak_memory']
+        results[case_name].errors      = Data()
+        for name,error in case['errors'].items():
+            results[case_name].errors[name] = Data(error)
+        results[case_name].curves      = Data()
+        for key,curve in case['curves'].items():
+            results[case_name].curves[key] = Data(figure = curve['figure'],axes = curve['axes'],label = curve['label'],kind = curve['kind'],
+                                                  x = np.array(curve['x'],dtype = float),y = np.array(curve['y'],dtype = float))
+    return results
+
+# ----------------------------------------------------------------------
+#   Print Benchmark
+# ----------------------------------------------------------------------
+def print_benchmark(results,case_names):
+    print('Noise validation benchmark')
+    for case_name in case_names:
+        case = results[case_name]
+        line = '  ' + case_name.ljust(34) + str(round(case.time,3)).rjust(10) + ' s' + \
+               str(round(case.peak_memory/2**20,2)).rjust(10) + ' MB'
+        if len(case.errors) > 0:
+            line += '   rms error ' + str(round(np.mean([error.rms_error for error in case.errors.values()]),3)) + ' dB'
+        print(line)
+        if 'comparison' in results and case_name in results.comparison:
+            comparison = results.comparison[case_name]
+            print('    baseline: time x' + str(round(comparison.time_ratio,3)) + ', memory x' + str(round(comparison.memory_ratio,3)) +
+                  ', maximum curve shift ' + str(round(comparison.maximum_shift,4)) + ' dB, ' +
+                  str(len(comparison.shifted_curves)) + ' curves shifted')
+    return
@@ -0,0 +1,218 @@
+# Warm_Start.py
+#
+# Created: Oct 2026
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Data
+import pickle
+import re
+import numpy as np
+
+# converged unknowns of this process, keyed by segment tag without the flight and day suffix
+_converged = {}
+
+# ----------------------------------------------------------------------
+#   Add Warm Start
+# ----------------------------------------------------------------------
+def add_warm_start(mission,results_file = None):
+    """Seeds the unknowns of every segment with those of the last converged segment
+    of the same kind, i.e. the same tag apart from the "_F_<flight>_D<day>" suffix.
+    Sources are earlier flights of the same mission, earlier evaluations in this
+    process (e.g. previous quadrants) and, optionally, a saved results file.
+    Residual evaluations are counted per segment to report what the warm start saves.
+
+    Assumptions:
+    Segments of the same kind have the same number of control points and unknowns;
+    segments that do not match keep their default unknowns
+
+    Source:
+    None
+
+    Inputs:
+    mission       - mission of segments, before evaluation
+    results_file  - pickled results (with extension) of a previous run
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    if results_file != None:
+        with open(results_file, 'rb') as file:
+            load_warm_start(pickle.load(file))
+
+    for segment in mission.segments.values():
+        segment.process.initialize.warm_start            = seed_unknowns
+        segment.process.iterate.warm_start               = count_residual_evaluation
+        segment.process.finalize.post_process.warm_start = store_unknowns
+    return
+
+# ----------------------------------------------------------------------
+#   Load Warm Start
+# ----------------------------------------------------------------------
+def load_warm_start(results):
+    """Stores the converged unknowns of previously evaluated results as warm start
+    sources.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    results  - results of mission.evaluate()
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    for segment in results.segments.values():
+        store_unknowns(segment)
+    return
+
+# ----------------------------------------------------------------------
+#   Segment Kind
+# ----------------------------------------------------------------------
+def segment_kind(tag):
+    return re.sub(r'_F_\d+_D\d+$','',tag)
+
+# ----------------------------------------------------------------------
+#   Seed Unknowns
+# ----------------------------------------------------------------------
+def seed_unknowns(segment):
+    """Replaces the default unknowns of a segment with converged ones of the same
+    kind, if any, and resets the residual evaluation counter.
+
+    Assumptions:
+    Runs after the state has been expanded to the control points
+
+    Source:
+    None
+
+    Inputs:
+    segment.state.unknowns
+
+    Outputs:
+    segment.state.unknowns
+    segment.state.numerics.warm_started
+    segment.state.numerics.residual_evaluations
+    segment.state.numerics.cold_residual_evaluations   - evaluations of the source's cold solve
+
+    Properties Used:
+    N/A
+    """
+    numerics                            = segment.state.numerics
+    numerics.warm_started               = False
+    numerics.residual_evaluations       = 0
+    numerics.cold_residual_evaluations  = None
+
+    source = _converged.get(segment_kind(segment.tag),None)
+    if source == None:
+        return
+
+    unknowns = segment.state.unknowns
+    if set(source.unknowns.keys()) != set(unknowns.keys()):
+        return
+    for name in unknowns.keys():
+        if np.shape(source.unknowns[name]) != np.shape(unknowns[name]):
+            return
+
+    for name in unknowns.keys():
+        unknowns[name] = np.copy(source.unknowns[name])
+    numerics.warm_started              = True
+    numerics.cold_residual_evaluations = source.cold_residual_evaluations
+    return
+
+# ----------------------------------------------------------------------
+#   Count Residual Evaluation
+# ----------------------------------------------------------------------
+def count_residual_evaluation(segment):
+    segment.state.numerics.residual_evaluations = segment.state.numerics.get('residual_evaluations',0) + 1
+    return
+
+# ----------------------------------------------------------------------
+#   Store Unknowns
+# ----------------------------------------------------------------------
+def store_unknowns(segment):
+    """Stores the converged unknowns of a segment as the warm start source for its
+    kind.
+
+    Assumptions:
+    Only converged segments are stored
+
+    Source:
+    None
+
+    Inputs:
+    segment.state.unknowns
+    segment.state.numerics
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    numerics = segment.state.numerics
+    if not numerics.get('converged',True) or len(segment.state.unknowns) == 0:
+        return
+
+    kind     = segment_kind(segment.tag)
+    previous = _converged.get(kind,None)
+
+    source          = Data()
+    source.unknowns = Data()
+    for name in segment.state.unknowns.keys():
+        source.unknowns[name] = np.copy(segment.state.unknowns[name])
+
+    # keep the evaluation count of the first cold solve as the reference
+    if numerics.get('warm_started',False) and previous != None:
+        source.cold_residual_evaluations = previous.cold_residual_evaluations
+    else:
+        source.cold_residual_evaluations = numerics.get('residual_evaluations',None)
+    _converged[kind] = source
+    return
+
+# ----------------------------------------------------------------------
+#   Print Warm Start Report
+# ----------------------------------------------------------------------
+def print_warm_start_report(results):
+    """Prints residual evaluations per segment and the evaluations saved by warm
+    starting with respect to a cold solve of the same kind of segment.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    results  - results of a mission with add_warm_start
+
+    Outputs:
+    saved    - total residual evaluations saved
+
+    Properties Used:
+    N/A
+    """
+    saved = 0
+    print('{:<40} {:>8} {:>8} {:>8}'.format('Segment','Evals','Cold','Saved'))
+    for segment in results.segments.values():
+        numerics = segment.state.numerics
+        evals    = numerics.get('residual_evaluations',None)
+        cold     = numerics.get('cold_residual_evaluations',None)
+        if evals == None:
+            continue
+        if numerics.get('warm_started',False) and cold != None:
+            saved += cold - evals
+            print('{:<40} {:>8} {:>8} {:>8}'.format(segment.tag,evals,cold,cold - evals))
+        else:
+            print('{:<40} {:>8} {:>8} {:>8}'.format(segment.tag,evals,'-','-'))
+    print('Residual evaluations saved by warm start: ' + str(saved))
+    return saved
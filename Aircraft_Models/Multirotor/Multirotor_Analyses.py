@@ -58,14 +58,7 @@ def base_analysis(vehicle,N_gm_x,N_gm_y,min_y,max_y,min_x,max_x,aircraft_range,r
     if run_noise_model: 
         # ------------------------------------------------------------------
         #  Noise Analysis
-        noise = SUAVE.Analyses.Noise.Fidelity_One()   
-        noise.geometry = vehicle
-        noise.settings.level_ground_microphone_x_resolution = N_gm_x
-        noise.settings.level_ground_microphone_y_resolution = N_gm_y
-        noise.settings.level_ground_microphone_min_y        = min_y
-        noise.settings.level_ground_microphone_max_y        = max_y
-        noise.settings.level_ground_microphone_min_x        = min_x
-        noise.settings.level_ground_microphone_max_x        = max_x
+        noise = noise_analysis_setup(vehicle,N_gm_x,N_gm_y,min_y,max_y,min_x,max_x)
         analyses.append(noise)
     
     # ------------------------------------------------------------------
@@ -85,5 +78,20 @@ def base_analysis(vehicle,N_gm_x,N_gm_y,min_y,max_y,min_x,max_x,aircraft_range,r
     atmosphere.features.planet = planet.features
     analyses.append(atmosphere)   
 
-    return analyses    
+    return analyses
 
+# ------------------------------------------------------------------
+#   Noise Analysis
+# ------------------------------------------------------------------
+def noise_analysis_setup(vehicle,N_gm_x,N_gm_y,min_y,max_y,min_x,max_x):
+
+    noise = SUAVE.Analyses.Noise.Fidelity_One()   
+    noise.geometry = vehicle
+    noise.settings.level_ground_microphone_x_resolution = N_gm_x
+    noise.settings.level_ground_microphone_y_resolution = N_gm_y
+    noise.settings.level_ground_microphone_min_y        = min_y
+    noise.settings.level_ground_microphone_max_y        = max_y
+    noise.settings.level_ground_microphone_min_x        = min_x
+    noise.settings.level_ground_microphone_max_x        = max_x
+    
+    return noise 
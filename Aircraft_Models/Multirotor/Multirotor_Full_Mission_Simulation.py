@@ -21,6 +21,11 @@ import Multirotor_Analyses
 import Multirotor_Missions
 import Multirotor_Plots
 
+import sys 
+sys.path.append('../Mission_Tools')  
+import Quadrant_Runner
+import Warm_Start
+
 # ----------------------------------------------------------------------
 #   Main
 # ----------------------------------------------------------------------
@@ -44,59 +49,29 @@ def main():
     max_y             = 0.5*Units.nmi   # maxiumum y (lateral) coordinate of acoustic computational domain
     min_x             = 0.*Units.nmi    # minimum x (longitudinal) coordinate of acoustic computational domain 
     max_x             = aircraft_range  # maxiumum x (longitudinal) coordinate of acoustic computational domain   
+    number_of_workers = None            # number of quadrant worker processes, defaults to all cores 
+    warm_start        = False           # seed segment unknowns from converged segments of the same kind 
+    warm_start_file   = None            # results pickle of a previous run to warm start from 
+    profile_mission   = False           # write per-segment, per-process-step timing reports 
+    noise_replay      = True            # solve the trajectory once without noise, then replay the noise of every quadrant 
      
-    # SET UP VEHICLE 
-    vehicle           = Multirotor_Vehicle.vehicle_setup() 
-    
-    # SET UP CONFIGURATIONS 
-    configs           = Multirotor_Vehicle.configs_setup(vehicle) 
-    
     # devide computational domain to increase noise prediction
     if run_noise_model:
         n = 3  
     else:
         n = 2
     Y_LIM = np.linspace(min_y,max_y,n)     
-    X_LIM = np.linspace(min_x,max_x,n)                      
-    Q_idx             = 1
-    for i in range(len(X_LIM)-1):
-        for j in range(len(Y_LIM)-1): 
-            print('Running Quardant:' + str(Q_idx)) 
-            min_x = X_LIM[i]
-            max_x = X_LIM[i+1]
-            min_y = Y_LIM[j]
-            max_y = Y_LIM[j+1]
-        
-            configs_analyses  = Multirotor_Analyses.analyses_setup(configs,N_gm_x,N_gm_y,min_y,max_y,min_x,max_x,
-                                               aircraft_range,run_noise_model) 
-            
-            # SET UP MISSION PROFILE 
-            base_mission      = Multirotor_Missions.full_mission_setup(configs_analyses,vehicle,simulated_days,flights_per_day,
-                                                    aircraft_range,reserve_segment,control_points,recharge_battery )
-            missions_analyses = Multirotor_Missions.missions_setup(base_mission) 
-            
-            # DEFINE ANALYSES 
-            analyses          = SUAVE.Analyses.Analysis.Container()
-            analyses.configs  = configs_analyses
-            analyses.missions = missions_analyses 
-            
-            # FINALIZE SIMULATION 
-            configs.finalize()
-            analyses.finalize()     
-            
-            # APPEND MISSION TO SIMULATION 
-            mission           = analyses.missions.base
-            
-            # RUN SIMULATION !!
-            noise_results     = mission.evaluate()   
-            
-            # SAVE RESULTS
-            filename          = 'Multirotor_Full_Mission_Noise_Q' + str(Q_idx)+ '_Nx' + str(N_gm_x) + '_Ny' + str(N_gm_y)
-            save_results(noise_results,filename)  
-            
-            # stop simulation clock
-            Q_idx += 1   
-      
+    X_LIM = np.linspace(min_x,max_x,n)                  
+    quadrants         = Quadrant_Runner.setup_quadrants(X_LIM,Y_LIM)
+    
+    # RUN QUADRANTS ON A PROCESS POOL, VEHICLE IS BUILT ONCE PER WORKER 
+    settings          = Quadrant_Runner.full_mission_settings(simulated_days,flights_per_day,aircraft_range,reserve_segment,recharge_battery,
+                                                              control_points,run_noise_model,N_gm_x,N_gm_y,warm_start,warm_start_file,profile_mission)
+    noise_results, _  = Quadrant_Runner.run_full_mission(Multirotor_Vehicle.vehicle_setup,Multirotor_Vehicle.configs_setup,quadrant_setup,quadrant_noise_setup,
+                                                         settings,quadrants,'Multirotor_Full_Mission',number_of_workers,noise_replay)
+    if warm_start:
+        Warm_Start.print_warm_start_report(noise_results)
+    
     if plot_mission: 
         Multirotor_Plots.plot_results(noise_results,run_noise_model)       
                 
@@ -107,6 +82,37 @@ def main():
     
     return     
 
+# ----------------------------------------------------------------------
+#   Quadrant Setup
+# ----------------------------------------------------------------------
+def quadrant_setup(configs,vehicle,quadrant,settings):
+    
+    configs_analyses  = Multirotor_Analyses.analyses_setup(configs,settings.N_gm_x,settings.N_gm_y,quadrant.min_y,quadrant.max_y,
+                                                           quadrant.min_x,quadrant.max_x,settings.aircraft_range,settings.run_noise_model) 
+    
+    # SET UP MISSION PROFILE 
+    base_mission      = Multirotor_Missions.full_mission_setup(configs_analyses,vehicle,settings.simulated_days,settings.flights_per_day,
+                                            settings.aircraft_range,settings.reserve_segment,settings.control_points,settings.recharge_battery)
+    if settings.warm_start:
+        Warm_Start.add_warm_start(base_mission,settings.warm_start_file)
+    missions_analyses = Multirotor_Missions.missions_setup(base_mission) 
+    
+    # DEFINE ANALYSES 
+    analyses          = SUAVE.Analyses.Analysis.Container()
+    analyses.configs  = configs_analyses
+    analyses.missions = missions_analyses 
+    
+    return analyses 
+
+# ----------------------------------------------------------------------
+#   Quadrant Noise Setup
+# ----------------------------------------------------------------------
+def quadrant_noise_setup(vehicle,quadrant,settings):
+    
+    noise = Multirotor_Analyses.noise_analysis_setup(vehicle,settings.N_gm_x,settings.N_gm_y,quadrant.min_y,quadrant.max_y,
+                                                       quadrant.min_x,quadrant.max_x)
+    return noise 
+
 # ----------------------------------------------------------------------
 #   Save Results
 # ----------------------------------------------------------------------
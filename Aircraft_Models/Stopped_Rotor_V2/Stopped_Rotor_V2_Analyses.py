@@ -74,19 +74,7 @@ def topography_base_analysis(vehicle,topography_data,run_noise_model):
     if run_noise_model:  
         # ------------------------------------------------------------------
         #  Noise Analysis
-        noise = SUAVE.Analyses.Noise.Fidelity_One()   
-        noise.geometry = vehicle
-        noise.settings.ground_microphone_x_resolution   = topography_data.ground_microphone_x_resolution           
-        noise.settings.ground_microphone_y_resolution   = topography_data.ground_microphone_y_resolution          
-        noise.settings.ground_microphone_x_stencil      = topography_data.ground_microphone_x_stencil             
-        noise.settings.ground_microphone_y_stencil      = topography_data.ground_microphone_y_stencil             
-        noise.settings.ground_microphone_min_y          = topography_data.ground_microphone_min_x                 
-        noise.settings.ground_microphone_max_y          = topography_data.ground_microphone_max_x                 
-        noise.settings.ground_microphone_min_x          = topography_data.ground_microphone_min_y                 
-        noise.settings.ground_microphone_max_x          = topography_data.ground_microphone_max_y                 
-        noise.settings.ground_microphone_locations      = topography_data.cartesian_microphone_locations            
-        noise.settings.aircraft_departure_location      = topography_data.departure_location   
-        noise.settings.aircraft_destimation_location    = topography_data.destination_location                              
+        noise = noise_analysis_setup(vehicle,topography_data,True)
         analyses.append(noise)                                                       
                                                                               
     # ------------------------------------------------------------------
@@ -142,17 +130,7 @@ def level_ground_base_analysis(vehicle,level_ground_data,run_noise_model):
     if run_noise_model:  
         # ------------------------------------------------------------------
         #  Noise Analysis
-        noise = SUAVE.Analyses.Noise.Fidelity_One()   
-        noise.geometry = vehicle                     
-        noise.settings.ground_microphone_x_resolution   = level_ground_data.ground_microphone_x_resolution           
-        noise.settings.ground_microphone_y_resolution   = level_ground_data.ground_microphone_y_resolution          
-        noise.settings.ground_microphone_x_stencil      = level_ground_data.ground_microphone_x_stencil             
-        noise.settings.ground_microphone_y_stencil      = level_ground_data.ground_microphone_y_stencil             
-        noise.settings.ground_microphone_min_y          = level_ground_data.ground_microphone_min_x                 
-        noise.settings.ground_microphone_max_y          = level_ground_data.ground_microphone_max_x                 
-        noise.settings.ground_microphone_min_x          = level_ground_data.ground_microphone_min_y                 
-        noise.settings.ground_microphone_max_x          = level_ground_data.ground_microphone_max_y                 
-        noise.settings.ground_microphone_locations      = level_ground_data.cartesian_microphone_locations         
+        noise = noise_analysis_setup(vehicle,level_ground_data,False)
         analyses.append(noise)                                                       
                                                                               
     # ------------------------------------------------------------------
@@ -172,4 +150,26 @@ def level_ground_base_analysis(vehicle,level_ground_data,run_noise_model):
     atmosphere.features.planet = planet.features
     analyses.append(atmosphere)   
 
-    return analyses   
+    return analyses
+
+# ------------------------------------------------------------------
+#   Noise Analysis
+# ------------------------------------------------------------------
+def noise_analysis_setup(vehicle,microphone_data,topography):
+
+    noise = SUAVE.Analyses.Noise.Fidelity_One()   
+    noise.geometry = vehicle
+    noise.settings.ground_microphone_x_resolution   = microphone_data.ground_microphone_x_resolution           
+    noise.settings.ground_microphone_y_resolution   = microphone_data.ground_microphone_y_resolution          
+    noise.settings.ground_microphone_x_stencil      = microphone_data.ground_microphone_x_stencil             
+    noise.settings.ground_microphone_y_stencil      = microphone_data.ground_microphone_y_stencil             
+    noise.settings.ground_microphone_min_y          = microphone_data.ground_microphone_min_x                 
+    noise.settings.ground_microphone_max_y          = microphone_data.ground_microphone_max_x                 
+    noise.settings.ground_microphone_min_x          = microphone_data.ground_microphone_min_y                 
+    noise.settings.ground_microphone_max_x          = microphone_data.ground_microphone_max_y                 
+    noise.settings.ground_microphone_locations      = microphone_data.cartesian_microphone_locations            
+    if topography:
+        noise.settings.aircraft_departure_location      = microphone_data.departure_location   
+        noise.settings.aircraft_destimation_location    = microphone_data.destination_location                              
+    
+    return noise 
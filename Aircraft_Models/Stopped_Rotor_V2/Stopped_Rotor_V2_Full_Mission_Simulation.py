@@ -8,6 +8,7 @@
 # ---------------------------------------------------------------------
 import SUAVE
 from SUAVE.Core import Units, Data   
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points import generate_ground_microphone_points
 import pickle
 from SUAVE.Plots.Performance.Mission_Plots import *  
 from SUAVE.Plots.Geometry   import *  
@@ -21,6 +22,11 @@ import Stopped_Rotor_V2_Analyses
 import Stopped_Rotor_V2_Missions
 import Stopped_Rotor_V2_Plots 
 
+import sys 
+sys.path.append('../Mission_Tools')  
+import Quadrant_Runner
+import Warm_Start 
+
 
 try:
     import vsp 
@@ -42,60 +48,45 @@ def main():
     simulated_days    = 1               # number of days simulated 
     flights_per_day   = 1               # number of flights per day 
     aircraft_range    = 30 *Units.nmi   # total ground distance 
-    reserve_segment   = False           # reserve segment flag, if true, ground distance not included  
+    reserve_segment   = False           # the baseline mission has no reserve segment 
     recharge_battery  = False           # flag to simulate battery recharge  
     plot_mission      = True            # plot mission flag  
     control_points    = 10              # number of control points per segment 
     true_course       = 80 * Units.degrees
     run_noise_model   = False           # flag to run noise analysis    
-    N_lat             = 20              # total number of microphones in longitudinal direction on ground 
-    N_long            = 20              # total number of microphones in lateral direction on ground  
-    n_lat             = 2               # number of microphones in stencil longitudinal direction on ground 
-    n_long            = 2               # number of microphones in stencil lateral direction on ground  
+    N_gm_x            = 20              # number of microphones in longitudinal direction on ground 
+    N_gm_y            = 20              # number of microphones in lateral direction on ground  
+    n_gm_x            = 2               # number of microphones in stencil longitudinal direction on ground 
+    n_gm_y            = 2               # number of microphones in stencil lateral direction on ground  
     min_y             = -1E5            # minimum y (lateral) coordinate of acoustic computational domain 
     max_y             = 1E5             # maxiumum y (lateral) coordinate of acoustic computational domain
     min_x             = 0               # minimum x (longitudinal) coordinate of acoustic computational domain 
     max_x             = 2E5             # maxiumum x (longitudinal) coordinate of acoustic computational domain 
-    mic_xyz           = None 
-    start_x           = 500
-    start_y           = 500
-    starting_altitude = 0
-    ending_altitude   = 100
-     
-    # SET UP VEHICLE 
-    vehicle           = Stopped_Rotor_V2_Vehicle.vehicle_setup() 
-    #write(vehicle,"Stopped_Rotor_V2")     
-    
-    # SET UP CONFIGURATIONS 
-    configs           = Stopped_Rotor_V2_Vehicle.configs_setup(vehicle) 
+    number_of_workers = None            # number of quadrant worker processes, defaults to all cores 
+    warm_start        = False           # seed segment unknowns from converged segments of the same kind 
+    warm_start_file   = None            # results pickle of a previous run to warm start from 
+    profile_mission   = False           # write per-segment, per-process-step timing reports 
+    noise_replay      = True            # solve the trajectory once without noise, then replay the noise of every quadrant 
      
-    configs_analyses  = Stopped_Rotor_V2_Analyses.analyses_setup(configs,N_lat,N_long,n_lat,n_long,mic_xyz,min_y,max_y,min_x,max_x,
-                                                                 start_x,start_y,aircraft_range,run_noise_model)
+    # devide computational domain to increase noise prediction
+    if run_noise_model:
+        n = 3  
+    else:
+        n = 2
+    Y_LIM = np.linspace(min_y,max_y,n)     
+    X_LIM = np.linspace(min_x,max_x,n)                  
+    quadrants         = Quadrant_Runner.setup_quadrants(X_LIM,Y_LIM)
     
-    # SET UP MISSION PROFILE 
-    base_mission      = Stopped_Rotor_V2_Missions.full_mission_setup_low_altitude_constant_elevation_cruise(configs_analyses,vehicle,simulated_days,flights_per_day,
-                                            aircraft_range,reserve_segment,control_points,recharge_battery,true_course,
-                                            starting_altitude,ending_altitude)
-    missions_analyses = Stopped_Rotor_V2_Missions.missions_setup(base_mission) 
-    
-    # DEFINE ANALYSES 
-    analyses          = SUAVE.Analyses.Analysis.Container()
-    analyses.configs  = configs_analyses
-    analyses.missions = missions_analyses 
-    
-    # FINALIZE SIMULATION 
-    configs.finalize()
-    analyses.finalize()     
-    
-    # APPEND MISSION TO SIMULATION 
-    mission           = analyses.missions.base
-    
-    # RUN SIMULATION !!
-    noise_results     = mission.evaluate()   
-    
-    # SAVE RESULTS
-    filename          = 'Stopped_Rotor_V2_Full_Mission_Noise_Nx' + str(N_lat) + '_Ny' + str(N_long)
-    save_results(noise_results,filename)   
+    # RUN QUADRANTS ON A PROCESS POOL, VEHICLE IS BUILT ONCE PER WORKER 
+    settings          = Quadrant_Runner.full_mission_settings(simulated_days,flights_per_day,aircraft_range,reserve_segment,recharge_battery,
+                                                              control_points,run_noise_model,N_gm_x,N_gm_y,warm_start,warm_start_file,profile_mission)
+    settings.true_course          = true_course 
+    settings.microphone_x_stencil = n_gm_x 
+    settings.microphone_y_stencil = n_gm_y 
+    noise_results, _  = Quadrant_Runner.run_full_mission(Stopped_Rotor_V2_Vehicle.vehicle_setup,Stopped_Rotor_V2_Vehicle.configs_setup,quadrant_setup,
+                                                         quadrant_noise_setup,settings,quadrants,'Stopped_Rotor_V2_Full_Mission',number_of_workers,noise_replay)
+    if warm_start:
+        Warm_Start.print_warm_start_report(noise_results)
       
     if plot_mission: 
         Stopped_Rotor_V2_Plots.plot_results(noise_results,run_noise_model,save_figure_flag = False )       
@@ -107,6 +98,56 @@ def main():
     
     return     
 
+# ----------------------------------------------------------------------
+#   Quadrant Setup
+# ----------------------------------------------------------------------
+def quadrant_setup(configs,vehicle,quadrant,settings):
+    
+    level_ground_data = quadrant_ground_data(quadrant,settings)
+    configs_analyses  = Stopped_Rotor_V2_Analyses.level_ground_analyses_setup(configs,level_ground_data,settings.run_noise_model) 
+    
+    # SET UP MISSION PROFILE 
+    base_mission      = Stopped_Rotor_V2_Missions.full_mission_setup_baseline(configs_analyses,vehicle,settings.simulated_days,settings.flights_per_day,
+                                                                              settings.control_points,settings.recharge_battery,level_ground_data)
+    if settings.warm_start:
+        Warm_Start.add_warm_start(base_mission,settings.warm_start_file)
+    missions_analyses = Stopped_Rotor_V2_Missions.missions_setup(base_mission) 
+    
+    # DEFINE ANALYSES 
+    analyses          = SUAVE.Analyses.Analysis.Container()
+    analyses.configs  = configs_analyses
+    analyses.missions = missions_analyses 
+    
+    return analyses 
+
+# ----------------------------------------------------------------------
+#   Quadrant Noise Setup
+# ----------------------------------------------------------------------
+def quadrant_noise_setup(vehicle,quadrant,settings):
+    
+    noise = Stopped_Rotor_V2_Analyses.noise_analysis_setup(vehicle,quadrant_ground_data(quadrant,settings),False)
+    return noise 
+
+# ----------------------------------------------------------------------
+#   Quadrant Ground Data
+# ----------------------------------------------------------------------
+def quadrant_ground_data(quadrant,settings):
+    # level ground microphones of the quadrant and the straight route flown over them 
+    level_ground_data                                = Data()
+    level_ground_data.ground_microphone_x_resolution = settings.N_gm_x
+    level_ground_data.ground_microphone_y_resolution = settings.N_gm_y
+    level_ground_data.ground_microphone_x_stencil    = settings.microphone_x_stencil
+    level_ground_data.ground_microphone_y_stencil    = settings.microphone_y_stencil
+    level_ground_data.ground_microphone_min_x        = quadrant.min_x
+    level_ground_data.ground_microphone_max_x        = quadrant.max_x
+    level_ground_data.ground_microphone_min_y        = quadrant.min_y
+    level_ground_data.ground_microphone_max_y        = quadrant.max_y
+    level_ground_data.cartesian_microphone_locations = generate_ground_microphone_points(quadrant.min_x,quadrant.max_x,quadrant.min_y,quadrant.max_y,
+                                                                                         settings.N_gm_x,settings.N_gm_y)
+    level_ground_data.flight_range                   = settings.aircraft_range
+    level_ground_data.true_course                    = settings.true_course
+    return level_ground_data 
+
 # ----------------------------------------------------------------------
 #   Save Results
 # ----------------------------------------------------------------------
@@ -79,6 +79,45 @@ def plot_results(results,run_noise_model,save_figure_flag,line_style='bo-'):
     return     
  
 
+# ------------------------------------------------------------------
+#   Plot Noise Metrics
+# ------------------------------------------------------------------
+def plot_noise_metrics(noise_metrics,save_figure_flag,min_SPL = 35,max_SPL = 80):
+    """Plots the maximum and day-night average level of every ground microphone
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs
+    noise_metrics   - output of Noise_Metrics.noise_metrics or Running_Noise_Metrics.finalize
+    min_SPL,max_SPL - contour range  [dBA]
+
+    Outputs: 
+    None
+
+    Properties Used:
+    N/A	
+    """
+    X = noise_metrics.ground_microphone_locations[:,:,0]
+    Y = noise_metrics.ground_microphone_locations[:,:,1]
+    
+    for name,label in [('Lmax','$L_{max}$ (dBA)'),('L_dn','$L_{dn}$ (dBA)')]:
+        fig  = plt.figure('Noise_Metrics_' + name)
+        fig.set_size_inches(12,6)
+        axes = fig.add_subplot(1,1,1)
+        CS   = axes.contourf(X,Y,noise_metrics[name + '_ground'], levels = np.linspace(min_SPL,max_SPL,10), cmap=plt.cm.jet, extend='both')
+        cbar = fig.colorbar(CS)
+        cbar.ax.set_ylabel(label, rotation =  90)
+        axes.set_ylabel('y (m)',labelpad = 12)
+        axes.set_xlabel('x (m)')
+        plt.tight_layout()
+        if save_figure_flag:
+            plt.savefig('Noise_Metrics_' + name + '.png')
+    return
+
 # ------------------------------------------------------------------
 #   Set Axis Parameters 
 # ------------------------------------------------------------------
@@ -29,10 +29,16 @@ import numpy as np
 import pylab as plt
 from copy import deepcopy 
 
+import sys 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','Mission_Tools'))
+from Rotor_Design_Cache import cached_rotor_design
+from BEM_Rotor_IO       import read_bem_rotor, set_design_point
+from Rotor_Grouping     import group_identical_rotors
+
 # ----------------------------------------------------------------------
 #   Build the Vehicle
 # ----------------------------------------------------------------------
-def vehicle_setup(MTOW = None):
+def vehicle_setup(MTOW = None,use_design_cache = False,from_bem = False,group_rotors = False):
      
     
     # ------------------------------------------------------------------
@@ -703,9 +709,17 @@ def vehicle_setup(MTOW = None):
                                          rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_200000.txt' ,
                                          rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_500000.txt' ,
                                          rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_1000000.txt' ]
-    propeller.append_airfoil(airfoil)  
-    propeller.airfoil_polar_stations      = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0] 
-    propeller                        = propeller_design(propeller)
+    if from_bem:
+        # skip the design, read the shipped blade geometry
+        propeller                    = read_bem_rotor(rel_path + 'propeller_1.bem',propeller,airfoil)
+        propeller                    = set_design_point(propeller,propeller.design_altitude,V_inf,propeller.angular_velocity)
+    else:
+        propeller.append_airfoil(airfoil)  
+        propeller.airfoil_polar_stations  = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0] 
+        if use_design_cache:
+            propeller                = cached_rotor_design(propeller,propeller_design)
+        else:
+            propeller                = propeller_design(propeller)
     
     propeller_origins                = [[  6.583,propeller_nacelle_origins[0][1] , propeller_nacelle_origins[1][2]] ,
                                         [  6.583,propeller_nacelle_origins[1][1] ,propeller_nacelle_origins[1][2]]]
@@ -736,9 +750,18 @@ def vehicle_setup(MTOW = None):
                                          rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_200000.txt' ,
                                          rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_500000.txt' ,
                                          rel_path + '../Airfoils/Polars/NACA_4412_polar_Re_1000000.txt' ]
-    rotor.append_airfoil(airfoil)    
-    rotor.airfoil_polar_stations          = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
-    rotor                            = lift_rotor_design(rotor)   
+    if from_bem:
+        # skip the design, read the shipped blade geometry
+        rotor                        = read_bem_rotor(rel_path + 'lift_rotor_1.bem',rotor,airfoil)
+        rotor                        = set_design_point(rotor,rotor.design_altitude,rotor.freestream_velocity,
+                                                        rotor.design_tip_mach*speed_of_sound/rotor.tip_radius,lift_rotor = True)
+    else:
+        rotor.append_airfoil(airfoil)    
+        rotor.airfoil_polar_stations      = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
+        if use_design_cache:
+            rotor                    = cached_rotor_design(rotor,lift_rotor_design)
+        else:
+            rotor                    = lift_rotor_design(rotor)   
 
     lift_rotor_origins   = [[ -0.073, 1.950,  1.2] ,  [  -0.073, -1.950 ,  1.2],
                             [ 4.440 , 1.950 ,  1.2] ,[ 4.440 , -1.950,  1.2],
@@ -755,6 +778,11 @@ def vehicle_setup(MTOW = None):
         lift_rotor.origin                 = [lift_rotor_origins[ii]]
         lift_rotor.phase_offset_angle     = angle_offsets[ii]
         net.lift_rotors.append(lift_rotor)   
+
+    if group_rotors:
+        # spin each set of identical rotors once per control point
+        group_identical_rotors(net.lift_rotors)
+        group_identical_rotors(net.propellers)
     
     #------------------------------------------------------------------
     # Design Motors
@@ -30,6 +30,10 @@ import numpy as np
 import pylab as plt 
 
 import plotly.graph_objects as go  
+
+import sys 
+sys.path.append('../Mission_Tools')
+import Building_Visibility
  
 # ----------------------------------------------------------------------
 #   Main
@@ -38,6 +42,7 @@ def main():
 
     ti = time.time()
     run_analysis = True 
+    building_shadowing = False # skip the noise sources of building microphones shadowed from the aircraft and reduce shadowed levels 
     
     if run_analysis:
         simulated_days  = 1
@@ -57,7 +62,11 @@ def main():
     
         # mission analysis
         mission = analyses.missions.base
+        if building_shadowing:
+            Building_Visibility.enable_building_shadowing()
         results = mission.evaluate() 
+        if building_shadowing:
+            Building_Visibility.disable_building_shadowing()
     
         tf = time.time()
         print ('time taken: ' + str(round(((tf-ti)/60),3)) + ' mins')      
@@ -16,6 +16,7 @@ from SUAVE.Plots.Geometry import plot_propeller
 
 # Python Imports 
 import time 
+import tracemalloc
 import numpy as np  
 import scipy as sp
 from scipy.special import jv 
@@ -39,6 +40,11 @@ from New_Propellers_Rotors.design_APC_11x45_prop   import design_APC_11x45_prop
 from New_Propellers_Rotors.design_APC_10x7_prop    import design_APC_10x7_prop 
 from New_Propellers_Rotors.design_APC_11x8_prop    import design_APC_11x8_prop
 from New_Propellers_Rotors.design_SR1_prop         import design_SR1_prop 
+
+sys.path.append('../../Aircraft_Models/Mission_Tools')
+from Parallel_Noise import benchmark_parallel_noise , benchmark_microphone_chunks
+from Spectrum_Tables import benchmark_spectrum_tables
+from Validation_Benchmark import run_validation_benchmark
 # ----------------------------------------------------------------------
 #   Main
 # ---------------------------------------------------------------------- 
@@ -91,6 +97,10 @@ def main():
     #Skew_function(plot_parameters,save_figures)  
     #Total_Rotor_Spenctrum_Sensitivity_Validation(plot_parameters,save_figures) 
     #ANOPP2_Validation(plot_parameters,save_figures) 
+    #Parallel_Noise_Scaling(plot_parameters,save_figures) 
+    #Spectrum_Table_Benchmark(plot_parameters,save_figures) 
+    #Noise_Memory_Benchmark(plot_parameters,save_figures) 
+    #Noise_Validation_Benchmark(plot_parameters,save_figures) 
 
     tf = time.time() 
     print ('time taken: '+ str(round(((tf-ti)),3)) + ' sec')        
@@ -113,10 +123,14 @@ def Harmonic_Spectrum_Shape_Sensitivity(PP,save_figures):
     sensitivity_name      = ['omega','beta_c','chord','dT_dr','dQ_dr','t_c','MCA']
     M_name                = ['50 % ','75 % ','100 % ','125 % ','150 % ']   
 
- 
+    # stack every variable and multiplier case, evaluated in one batch 
+    multipliers = np.ones((len(sensitivity_variables),len(M),8))
+    for var_idx in range(len(sensitivity_variables)):
+        multipliers[var_idx,:,var_idx] = M 
+    harmonics, SPL_dBA = harmonic_sensitivity_spectra(multipliers.reshape(-1,8))
+    SPL_dBA            = SPL_dBA.reshape(len(sensitivity_variables),len(M),len(harmonics))
 
     for var_idx in range(len(sensitivity_variables)):
-        multipliers = np.ones(8) 
         fig_1  = plt.figure() 
         fig_1.set_size_inches(PP.figure_width,PP.figure_height)    
         axis_1 = fig_1.add_subplot(1,1,1) 
@@ -124,177 +138,7 @@ def Harmonic_Spectrum_Shape_Sensitivity(PP,save_figures):
         axis_1.set_ylabel('SPL (dBA)') 
         axis_1.set_xlabel('Blade Passing Frequency')                
         for idx in range(len(M)):
-            multipliers[var_idx] = M[idx]  
-
-            # Define Network 
-            net                                = Battery_Propeller()     
-            net.number_of_propeller_engines    = 1
-            net.identical_propellers           = True
-            prop                               = design_F8745D4_prop()
-            net.propellers.append(prop)
-        
-        
-            # Set-up Validation Conditions 
-            a                       = 343.376
-            T                       = 288.16889478  
-            density                 = 1.2250	
-            dynamic_viscosity       = 1.81E-5  
-            theta                   = np.array([-30])*Units.degrees
-            S                       = np.array([4]) # np.linspace(2,10,5) 
-            omega                   = np.array([2390]) * Units.rpm * multipliers[0]      
-        
-            # Set twist target
-            three_quarter_twist     = 21 * Units.degrees  * multipliers[1] 
-            n                       = len(prop.twist_distribution)
-            beta                    = prop.twist_distribution
-            beta_75                 = beta[round(n*0.75)] 
-            delta_beta              = three_quarter_twist-beta_75
-            prop.twist_distribution = beta + delta_beta 
-            prop.chord_distribution = prop.chord_distribution * multipliers[2] 
-            prop.thickness_to_chord = prop.thickness_to_chord * multipliers[5]  
-        
-            # microphone locations
-            ctrl_pts                = len(omega) 
-            dim_theta               = len(theta)
-            dim_S                   = len(S) 
-            num_mic                 = dim_S*dim_theta
-        
-            theta                   = np.repeat(np.repeat(np.atleast_2d(theta).T ,dim_S , axis = 1)[np.newaxis,:,:],ctrl_pts, axis = 0)  
-            S                       = np.repeat(np.repeat(np.atleast_2d(S)       ,dim_theta, axis = 0)[np.newaxis,:,:],ctrl_pts, axis = 0) 
-            x_vals                  = S*np.sin(theta)
-            y_vals                  = -S*np.cos(theta)
-            z_vals                  = np.zeros_like(x_vals) 
-        
-            mic_locations           = np.zeros((ctrl_pts,num_mic,3))   
-            mic_locations[:,:,0]    = x_vals.reshape(ctrl_pts,num_mic) 
-            mic_locations[:,:,1]    = y_vals.reshape(ctrl_pts,num_mic) 
-            mic_locations[:,:,2]    = z_vals.reshape(ctrl_pts,num_mic)     
-        
-            # Set up for Propeller Model
-            prop.inputs.omega                            = np.atleast_2d(omega).T
-            prop.inputs.pitch_command                    = 0.
-            conditions                                   = Aerodynamics()
-            conditions._size                             = 3
-            conditions.freestream.density                = np.ones((ctrl_pts,1)) * density
-            conditions.freestream.dynamic_viscosity      = np.ones((ctrl_pts,1)) * dynamic_viscosity   
-            conditions.freestream.speed_of_sound         = np.ones((ctrl_pts,1)) * a 
-            conditions.freestream.temperature            = np.ones((ctrl_pts,1)) * T 
-            conditions.frames.inertial.velocity_vector   = np.array([[77.2, 0. ,0.]])
-            conditions.propulsion.throttle               = np.ones((ctrl_pts,1))*1.0
-            conditions.aerodynamics.angle_of_attack      = np.ones((ctrl_pts,1))* 0. * Units.degrees 
-            conditions.frames.body.transform_to_inertial = np.array([[[1., 0., 0.],[0., 1., 0.],[0., 0., 1.]]])
-            conditions.noise.total_microphone_locations  = mic_locations
-         
-        
-            # Run Propeller model 
-            F, Q, P, Cp , aeroacoustic_data , etap       = prop.spin(conditions)   
-            
-            # Prepare Inputs for Noise Model    
-            segment                                                = Segment() 
-            segment.state.conditions                               = conditions
-            segment.state.conditions.expand_rows(ctrl_pts)
-            settings                                               = Data()
-            settings                                               = setup_noise_settings(segment)
-        
-            num_mic                                                = len(conditions.noise.total_microphone_locations[0] )  
-            conditions.noise.number_of_microphones                 = num_mic   
-        
-            # unpack 
-            conditions           = segment.state.conditions
-            microphone_locations = conditions.noise.total_microphone_locations
-            angle_of_attack      = conditions.aerodynamics.angle_of_attack 
-            velocity_vector      = conditions.frames.inertial.velocity_vector
-            freestream           = conditions.freestream  
-            harmonics            = settings.harmonics    
-         
-        
-            # compute position vector from point source at rotor hub to microphones
-            position_vector = compute_point_source_coordinates(conditions,net.propellers,microphone_locations,settings)  
-        
-            num_h        = len(harmonics)     
-            num_cpt      = len(angle_of_attack)
-            num_mic      = len(position_vector[0,:,0,0])
-            num_rot      = len(position_vector[0,0,:,0])  
-            rotor        = net.propellers[list(net.propellers.keys())[0]] 
-            num_r        = len(rotor.radius_distribution) 
-            orientation  = np.array(rotor.orientation_euler_angles) * 1 
-            body2thrust  = sp.spatial.transform.Rotation.from_rotvec(orientation).as_matrix()
-        
-            # ----------------------------------------------------------------------------------
-            # Rotational Noise  Thickness and Loading Noise
-            # ----------------------------------------------------------------------------------  
-            # [control point ,microphones, rotors, radial distribution, harmonics]  
-            m              = np.tile(harmonics[None,None,None,None,:],(num_cpt,num_mic,num_rot,num_r,1))                 # harmonic number 
-            m_1d           = harmonics                                                                                         
-            p_ref          = 2E-5                                                                                        # referece atmospheric pressure
-            a              = np.tile(freestream.speed_of_sound[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))      # speed of sound
-            rho            = np.tile(freestream.density[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))             # air density   
-            alpha          = np.tile((angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))           
-            x              = np.tile(position_vector[:,:,:,0][:,:,:,None,None],(1,1,1,num_r,num_h))                      # x component of position vector of rotor to microphone 
-            y              = np.tile(position_vector[:,:,:,1][:,:,:,None,None],(1,1,1,num_r,num_h))                      # y component of position vector of rotor to microphone
-            z              = np.tile(position_vector[:,:,:,2][:,:,:,None,None],(1,1,1,num_r,num_h))                      # z component of position vector of rotor to microphone
-            Vx             = np.tile(velocity_vector[:,0][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # x velocity of rotor  
-            Vy             = np.tile(velocity_vector[:,1][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # y velocity of rotor 
-            Vz             = np.tile(velocity_vector[:,2][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # z velocity of rotor 
-            B              = rotor.number_of_blades                                                                      # number of rotor blades
-            omega          = np.tile(aeroacoustic_data.omega[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # angular velocity       
-            dT_dr          = np.tile(aeroacoustic_data.blade_dT_dr[:,None,None,:,None],(1,num_mic,num_rot,1,num_h)) * multipliers[3]      # nondimensionalized differential thrust distribution 
-            dQ_dr          = np.tile(aeroacoustic_data.blade_dQ_dr[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))* multipliers[4]       # nondimensionalized differential torque distribution
-            R              = np.tile(rotor.radius_distribution[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h)) # radial location     
-            c              = np.tile(rotor.chord_distribution[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h))  # blade chord    
-            R_tip          = rotor.tip_radius                                                     
-            t_c            = np.tile(rotor.thickness_to_chord[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h)) # thickness to chord ratio
-            MCA            = np.tile(rotor.mid_chord_alignment[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h)) # Mid Chord Alighment  
-            f              = B*omega*m/(2*np.pi) 
-            D              = 2*R[0,0,0,-1,:]                                                                             # rotor diameter    
-            r              = R/R[0,0,0,-1,:]                                                                             # non dimensional radius distribution  
-            S              = np.sqrt(x**2 + y**2 + z**2)                                                                 # distance between rotor and the observer    
-            theta          = np.arccos(x/S)                                                            
-            Y              = np.sqrt(y**2 + z**2)                                                                        # observer distance from rotor axis          
-            V              = np.sqrt(Vx**2 + Vy**2 + Vz**2)                                                              # velocity magnitude
-            M_x            = V/a                                                                                         
-            V_tip          = R_tip*omega                                                                                 # blade_tip_speed 
-            M_t            = V_tip/a                                                                                     # tip Mach number 
-            M_r            = np.sqrt(M_x**2 + (r**2)*(M_t**2))                                                           # section relative Mach number     
-            B_D            = c/D                                                                                         
-            phi            = np.arctan(z/y)                                                                              # tangential angle   
-        
-            # retarted  theta angle in the retarded reference frame
-            theta_r        = np.arccos(np.cos(theta)*np.sqrt(1 - (M_x**2)*(np.sin(theta))**2) + M_x*(np.sin(theta))**2 )   
-            theta_r_prime  = np.arccos(np.cos(theta_r)*np.cos(alpha) + np.sin(theta_r)*np.sin(phi)*np.sin(alpha) )
-        
-            # initialize thickness and loading noise matrices
-            psi_L          = np.zeros((num_cpt,num_mic,num_rot,num_r,num_h))
-            psi_V          = np.zeros((num_cpt,num_mic,num_rot,num_r,num_h))
-        
-            # normalized thickness  and loading shape functions                
-            k_x               = ((2*m*B*B_D*M_t)/(M_r*(1 - M_x*np.cos(theta_r))))      # wave number 
-            psi_V[:,:,:,0,:]  = 2/3   
-            psi_L[:,:,:,0,:]  = 1     
-            psi_V[:,:,:,1:,:] = (8/(k_x[:,:,:,1:,:]**2))*((2/k_x[:,:,:,1:,:])*np.sin(0.5*k_x[:,:,:,1:,:]) - np.cos(0.5*k_x[:,:,:,1:,:]))    
-            psi_L[:,:,:,1:,:] = (2/k_x[:,:,:,1:,:])*np.sin(0.5*k_x[:,:,:,1:,:])                  
-        
-            # sound pressure for thickness noise   
-            Jmb               = jv(m*B,((m*B*r*M_t*np.sin(theta_r_prime))/(1 - M_x*np.cos(theta_r))))  
-            phi_s             = ((2*m*B*M_t)/(M_r*(1 - M_x*np.cos(theta_r))))*(MCA/D)
-            phi_prime         = np.arccos((np.sin(theta_r)/np.sin(theta_r_prime))*np.cos(phi))      
-            S_r               = Y/(np.sin(theta_r))                                # distance in retarded reference frame                                                                             
-            exponent_fraction = np.exp(1j*m_1d*B*((omega*S_r/a) +  phi_prime - np.pi/2))/(1 - M_x*np.cos(theta_r))
-            p_mT_H_integral   = -((M_r**2)*(t_c)*np.exp(1j*phi_s)*Jmb*(k_x**2)*psi_V ) * ((rho*(a**2)*B*np.sin(theta_r))/(4*np.sqrt(2)*np.pi*(Y/D)))* exponent_fraction
-            p_mT_H            = np.trapz(p_mT_H_integral,x = r[0,0,0,:,0], axis =3) 
-        
-            p_mT_H_abs        = abs(p_mT_H)             
-            p_mL_H_integral   = (((np.cos(theta_r_prime)/(1 - M_x*np.cos(theta_r)))*dT_dr - (1/((r**2)*M_t*R_tip))*dQ_dr)
-                                 * np.exp(1j*phi_s)*Jmb * psi_L)*(m_1d*B*M_t*np.sin(theta_r)/ (2*np.sqrt(2)*np.pi*Y*R_tip)) *exponent_fraction
-            p_mL_H            = np.trapz(p_mL_H_integral,x = r[0,0,0,:,0], axis = 3 ) 
-            p_mL_H_abs        =  abs(p_mL_H)  
-        
-            # sound pressure levels  
-            SPL_prop_harmonic_bpf_spectrum     = 20*np.log10((abs(p_mL_H_abs + p_mT_H_abs))/p_ref) 
-            SPL_prop_harmonic_bpf_spectrum_dBA = A_weighting(SPL_prop_harmonic_bpf_spectrum,f[:,:,:,0,:])        
-             
-
-            axis_1.plot(harmonics,SPL_prop_harmonic_bpf_spectrum_dBA[0,0,0],color = PP.colors[idx], 
+            axis_1.plot(harmonics,SPL_dBA[var_idx,idx],color = PP.colors[idx], 
                             linestyle = PP.line_style, markersize = PP.m, marker = PP.markers[idx],
                           label = M_name[idx] + sensitivity_variables[var_idx] )      
             axis_1.legend(loc='upper right', ncol= 3, prop={'size': PP.legend_font_size})     
@@ -306,6 +150,209 @@ def Harmonic_Spectrum_Shape_Sensitivity(PP,save_figures):
      
     return    
 
+# ------------------------------------------------------------------ 
+# Harmonic Sensitivity Spectra
+# ------------------------------------------------------------------     
+def harmonic_sensitivity_spectra(multipliers):
+    '''Harmonic spectra of the F8745D4 propeller for a batch of sensitivity cases, one row
+    of multipliers (omega, 0.75 beta_c, chord, dT/dr, dQ/dr, t/c, M.C.A) per case. The
+    cases are stacked along the control points: the rotor is spun once per distinct blade
+    geometry (twist, chord and t/c change the rotor itself) with the rotational speeds of
+    its cases, and the thickness and loading noise of all cases is evaluated at once. 
+    '''   
+    num_cpt                 = len(multipliers)
+    geometries, geometry_id = np.unique(multipliers[:,[1,2,5]],axis = 0,return_inverse = True)
+    geometry_id             = geometry_id.flatten()
+
+    # Set-up Validation Conditions 
+    a                       = 343.376
+    T                       = 288.16889478  
+    density                 = 1.2250	
+    dynamic_viscosity       = 1.81E-5  
+    theta                   = np.array([-30])*Units.degrees
+    S                       = np.array([4]) # np.linspace(2,10,5) 
+
+    # microphone locations
+    dim_theta               = len(theta)
+    dim_S                   = len(S) 
+    num_mic                 = dim_S*dim_theta
+
+    theta                   = np.repeat(np.repeat(np.atleast_2d(theta).T ,dim_S , axis = 1)[np.newaxis,:,:],num_cpt, axis = 0)  
+    S                       = np.repeat(np.repeat(np.atleast_2d(S)       ,dim_theta, axis = 0)[np.newaxis,:,:],num_cpt, axis = 0) 
+    x_vals                  = S*np.sin(theta)
+    y_vals                  = -S*np.cos(theta)
+    z_vals                  = np.zeros_like(x_vals) 
+
+    mic_locations           = np.zeros((num_cpt,num_mic,3))   
+    mic_locations[:,:,0]    = x_vals.reshape(num_cpt,num_mic) 
+    mic_locations[:,:,1]    = y_vals.reshape(num_cpt,num_mic) 
+    mic_locations[:,:,2]    = z_vals.reshape(num_cpt,num_mic)     
+
+    # Run Propeller model once per blade geometry 
+    for geo_idx in range(len(geometries)):
+        cases                   = np.where(geometry_id == geo_idx)[0]
+        ctrl_pts                = len(cases)
+        prop                    = design_F8745D4_prop()
+        omega                   = np.array([2390]) * Units.rpm * multipliers[cases,0]      
+
+        # Set twist target
+        three_quarter_twist     = 21 * Units.degrees  * geometries[geo_idx,0] 
+        n                       = len(prop.twist_distribution)
+        beta                    = prop.twist_distribution
+        beta_75                 = beta[round(n*0.75)] 
+        delta_beta              = three_quarter_twist-beta_75
+        prop.twist_distribution = beta + delta_beta 
+        prop.chord_distribution = prop.chord_distribution * geometries[geo_idx,1] 
+        prop.thickness_to_chord = prop.thickness_to_chord * geometries[geo_idx,2]  
+
+        # Set up for Propeller Model
+        prop.inputs.omega                            = np.atleast_2d(omega).T
+        prop.inputs.pitch_command                    = 0.
+        conditions                                   = Aerodynamics()
+        conditions._size                             = 3
+        conditions.freestream.density                = np.ones((ctrl_pts,1)) * density
+        conditions.freestream.dynamic_viscosity      = np.ones((ctrl_pts,1)) * dynamic_viscosity   
+        conditions.freestream.speed_of_sound         = np.ones((ctrl_pts,1)) * a 
+        conditions.freestream.temperature            = np.ones((ctrl_pts,1)) * T 
+        conditions.frames.inertial.velocity_vector   = np.tile(np.array([[77.2, 0. ,0.]]),(ctrl_pts,1))
+        conditions.propulsion.throttle               = np.ones((ctrl_pts,1))*1.0
+        conditions.aerodynamics.angle_of_attack      = np.ones((ctrl_pts,1))* 0. * Units.degrees 
+        conditions.frames.body.transform_to_inertial = np.tile(np.array([[[1., 0., 0.],[0., 1., 0.],[0., 0., 1.]]]),(ctrl_pts,1,1))
+
+        F, Q, P, Cp , aeroacoustic_data , etap       = prop.spin(conditions)   
+
+        if geo_idx == 0:
+            num_r              = len(prop.radius_distribution) 
+            omega_cases        = np.zeros((num_cpt,1))
+            dT_dr_cases        = np.zeros((num_cpt,num_r))
+            dQ_dr_cases        = np.zeros((num_cpt,num_r))
+            chord_cases        = np.zeros((num_cpt,num_r))
+            t_c_cases          = np.zeros((num_cpt,num_r))
+        omega_cases[cases]     = aeroacoustic_data.omega
+        dT_dr_cases[cases]     = aeroacoustic_data.blade_dT_dr * multipliers[cases,3][:,None]
+        dQ_dr_cases[cases]     = aeroacoustic_data.blade_dQ_dr * multipliers[cases,4][:,None]
+        chord_cases[cases]     = prop.chord_distribution
+        t_c_cases[cases]       = prop.thickness_to_chord
+    MCA_cases                  = prop.mid_chord_alignment[None,:] * multipliers[:,6][:,None]
+
+    # Define Network 
+    net                                = Battery_Propeller()     
+    net.number_of_propeller_engines    = 1
+    net.identical_propellers           = True
+    net.propellers.append(prop)
+
+    # Prepare Inputs for Noise Model    
+    conditions                                   = Aerodynamics()
+    conditions._size                             = 3
+    conditions.freestream.density                = np.ones((num_cpt,1)) * density
+    conditions.freestream.dynamic_viscosity      = np.ones((num_cpt,1)) * dynamic_viscosity   
+    conditions.freestream.speed_of_sound         = np.ones((num_cpt,1)) * a 
+    conditions.freestream.temperature            = np.ones((num_cpt,1)) * T 
+    conditions.frames.inertial.velocity_vector   = np.tile(np.array([[77.2, 0. ,0.]]),(num_cpt,1))
+    conditions.propulsion.throttle               = np.ones((num_cpt,1))*1.0
+    conditions.aerodynamics.angle_of_attack      = np.ones((num_cpt,1))* 0. * Units.degrees 
+    conditions.frames.body.transform_to_inertial = np.tile(np.array([[[1., 0., 0.],[0., 1., 0.],[0., 0., 1.]]]),(num_cpt,1,1))
+    conditions.noise.total_microphone_locations  = mic_locations
+    segment                                      = Segment() 
+    segment.state.conditions                     = conditions
+    segment.state.conditions.expand_rows(num_cpt)
+    settings                                     = Data()
+    settings                                     = setup_noise_settings(segment)
+    conditions.noise.number_of_microphones       = num_mic   
+
+    # unpack 
+    conditions           = segment.state.conditions
+    microphone_locations = conditions.noise.total_microphone_locations
+    angle_of_attack      = conditions.aerodynamics.angle_of_attack 
+    velocity_vector      = conditions.frames.inertial.velocity_vector
+    freestream           = conditions.freestream  
+    harmonics            = settings.harmonics    
+
+    # compute position vector from point source at rotor hub to microphones
+    position_vector = compute_point_source_coordinates(conditions,net.propellers,microphone_locations,settings)  
+
+    num_h        = len(harmonics)     
+    num_mic      = len(position_vector[0,:,0,0])
+    num_rot      = len(position_vector[0,0,:,0])  
+    rotor        = net.propellers[list(net.propellers.keys())[0]] 
+    orientation  = np.array(rotor.orientation_euler_angles) * 1 
+    body2thrust  = sp.spatial.transform.Rotation.from_rotvec(orientation).as_matrix()
+
+    # ----------------------------------------------------------------------------------
+    # Rotational Noise  Thickness and Loading Noise
+    # ----------------------------------------------------------------------------------  
+    # [control point ,microphones, rotors, radial distribution, harmonics]  
+    m              = np.tile(harmonics[None,None,None,None,:],(num_cpt,num_mic,num_rot,num_r,1))                 # harmonic number 
+    m_1d           = harmonics                                                                                         
+    p_ref          = 2E-5                                                                                        # referece atmospheric pressure
+    a              = np.tile(freestream.speed_of_sound[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))      # speed of sound
+    rho            = np.tile(freestream.density[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))             # air density   
+    alpha          = np.tile((angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))           
+    x              = np.tile(position_vector[:,:,:,0][:,:,:,None,None],(1,1,1,num_r,num_h))                      # x component of position vector of rotor to microphone 
+    y              = np.tile(position_vector[:,:,:,1][:,:,:,None,None],(1,1,1,num_r,num_h))                      # y component of position vector of rotor to microphone
+    z              = np.tile(position_vector[:,:,:,2][:,:,:,None,None],(1,1,1,num_r,num_h))                      # z component of position vector of rotor to microphone
+    Vx             = np.tile(velocity_vector[:,0][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # x velocity of rotor  
+    Vy             = np.tile(velocity_vector[:,1][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # y velocity of rotor 
+    Vz             = np.tile(velocity_vector[:,2][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # z velocity of rotor 
+    B              = rotor.number_of_blades                                                                      # number of rotor blades
+    omega          = np.tile(omega_cases[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))                    # angular velocity       
+    dT_dr          = np.tile(dT_dr_cases[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))                        # nondimensionalized differential thrust distribution 
+    dQ_dr          = np.tile(dQ_dr_cases[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))                        # nondimensionalized differential torque distribution
+    R              = np.tile(rotor.radius_distribution[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h)) # radial location     
+    c              = np.tile(chord_cases[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))                        # blade chord    
+    R_tip          = rotor.tip_radius                                                     
+    t_c            = np.tile(t_c_cases[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))                          # thickness to chord ratio
+    MCA            = np.tile(MCA_cases[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))                          # Mid Chord Alighment  
+    f              = B*omega*m/(2*np.pi) 
+    D              = 2*R[0,0,0,-1,:]                                                                             # rotor diameter    
+    r              = R/R[0,0,0,-1,:]                                                                             # non dimensional radius distribution  
+    S              = np.sqrt(x**2 + y**2 + z**2)                                                                 # distance between rotor and the observer    
+    theta          = np.arccos(x/S)                                                            
+    Y              = np.sqrt(y**2 + z**2)                                                                        # observer distance from rotor axis          
+    V              = np.sqrt(Vx**2 + Vy**2 + Vz**2)                                                              # velocity magnitude
+    M_x            = V/a                                                                                         
+    V_tip          = R_tip*omega                                                                                 # blade_tip_speed 
+    M_t            = V_tip/a                                                                                     # tip Mach number 
+    M_r            = np.sqrt(M_x**2 + (r**2)*(M_t**2))                                                           # section relative Mach number     
+    B_D            = c/D                                                                                         
+    phi            = np.arctan(z/y)                                                                              # tangential angle   
+
+    # retarted  theta angle in the retarded reference frame
+    theta_r        = np.arccos(np.cos(theta)*np.sqrt(1 - (M_x**2)*(np.sin(theta))**2) + M_x*(np.sin(theta))**2 )   
+    theta_r_prime  = np.arccos(np.cos(theta_r)*np.cos(alpha) + np.sin(theta_r)*np.sin(phi)*np.sin(alpha) )
+
+    # initialize thickness and loading noise matrices
+    psi_L          = np.zeros((num_cpt,num_mic,num_rot,num_r,num_h))
+    psi_V          = np.zeros((num_cpt,num_mic,num_rot,num_r,num_h))
+
+    # normalized thickness  and loading shape functions                
+    k_x               = ((2*m*B*B_D*M_t)/(M_r*(1 - M_x*np.cos(theta_r))))      # wave number 
+    psi_V[:,:,:,0,:]  = 2/3   
+    psi_L[:,:,:,0,:]  = 1     
+    psi_V[:,:,:,1:,:] = (8/(k_x[:,:,:,1:,:]**2))*((2/k_x[:,:,:,1:,:])*np.sin(0.5*k_x[:,:,:,1:,:]) - np.cos(0.5*k_x[:,:,:,1:,:]))    
+    psi_L[:,:,:,1:,:] = (2/k_x[:,:,:,1:,:])*np.sin(0.5*k_x[:,:,:,1:,:])                  
+
+    # sound pressure for thickness noise   
+    Jmb               = jv(m*B,((m*B*r*M_t*np.sin(theta_r_prime))/(1 - M_x*np.cos(theta_r))))  
+    phi_s             = ((2*m*B*M_t)/(M_r*(1 - M_x*np.cos(theta_r))))*(MCA/D)
+    phi_prime         = np.arccos((np.sin(theta_r)/np.sin(theta_r_prime))*np.cos(phi))      
+    S_r               = Y/(np.sin(theta_r))                                # distance in retarded reference frame                                                                             
+    exponent_fraction = np.exp(1j*m_1d*B*((omega*S_r/a) +  phi_prime - np.pi/2))/(1 - M_x*np.cos(theta_r))
+    p_mT_H_integral   = -((M_r**2)*(t_c)*np.exp(1j*phi_s)*Jmb*(k_x**2)*psi_V ) * ((rho*(a**2)*B*np.sin(theta_r))/(4*np.sqrt(2)*np.pi*(Y/D)))* exponent_fraction
+    p_mT_H            = np.trapz(p_mT_H_integral,x = r[0,0,0,:,0], axis =3) 
+
+    p_mT_H_abs        = abs(p_mT_H)             
+    p_mL_H_integral   = (((np.cos(theta_r_prime)/(1 - M_x*np.cos(theta_r)))*dT_dr - (1/((r**2)*M_t*R_tip))*dQ_dr)
+                         * np.exp(1j*phi_s)*Jmb * psi_L)*(m_1d*B*M_t*np.sin(theta_r)/ (2*np.sqrt(2)*np.pi*Y*R_tip)) *exponent_fraction
+    p_mL_H            = np.trapz(p_mL_H_integral,x = r[0,0,0,:,0], axis = 3 ) 
+    p_mL_H_abs        =  abs(p_mL_H)  
+
+    # sound pressure levels  
+    SPL_prop_harmonic_bpf_spectrum     = 20*np.log10((abs(p_mL_H_abs + p_mT_H_abs))/p_ref) 
+    SPL_prop_harmonic_bpf_spectrum_dBA = A_weighting(SPL_prop_harmonic_bpf_spectrum,f[:,:,:,0,:])        
+
+    return harmonics, SPL_prop_harmonic_bpf_spectrum_dBA[:,0,0]    
+
 
 
 # ------------------------------------------------------------------ 
@@ -730,10 +777,14 @@ def Broadband_Spectrum_Shape_Sensitivity(PP,save_figures):
     sensitivity_name      =  ['Re','alpha','delta','delta_star','dp_dx', 'C_f', 'Ue' , 'theta' ]
     M_name                = [r'50 % ',r'75 % ',r'100 % ',r'125 % ',r'150 % ']   
 
-    
+    # stack every variable and multiplier case, evaluated in one batch 
+    multipliers = np.ones((len(sensitivity_variables),len(M),8))
+    for var_idx in range(len(sensitivity_variables)):
+        multipliers[var_idx,:,var_idx] = M 
+    frequency, var = broadband_sensitivity_spectra(multipliers.reshape(-1,8))
+    var            = var.reshape((len(sensitivity_variables),len(M)) + var.shape[1:])
 
     for var_idx in range(len(sensitivity_variables)):
-        multipliers = np.ones(8) 
         fig_1  = plt.figure() 
         fig_1.set_size_inches(PP.figure_width,PP.figure_height) 
         axis_1 = fig_1.add_subplot(1,1,1) 
@@ -741,83 +792,7 @@ def Broadband_Spectrum_Shape_Sensitivity(PP,save_figures):
         axis_1.set_ylabel(r'$10log_{10}$ ($\Phi$)') 
         axis_1.set_xlabel('Frequency (Hz)')                
         for idx in range(len(M)):
-            multipliers[var_idx] = M[idx] 
-
-            pi           = np.pi 
-            rho          = 1.2                                               
-            kine_visc    = np.array([[0.0000150]])                        
-            num_sec      = 1 # number of sections  
-            N_r          = 1
-            ctrl_pts     = 1
-            BSR          = 100 # broadband spectrum resolution
-            frequency    = np.linspace(1E2,1E4,BSR) 
-            w            = 2*pi*frequency
-            Re           = np.array([[1.5E6]]) * multipliers[0] 
-            alpha        = np.array([[6.]]) *Units.degrees * multipliers[1]                                        
-            V_inf        = 69.5
-            chord        = Re*kine_visc/V_inf
-            kine_visc    = vectorize(kine_visc,ctrl_pts,num_sec,N_r,BSR,method = 1)
-            delta        = np.zeros((ctrl_pts,N_r,num_sec,BSR,2))  
-            delta_star   = np.zeros_like(delta)
-            dp_dx        = np.zeros_like(delta)
-            C_f          = np.zeros_like(delta)
-            tau_w        = np.zeros_like(delta)
-            Ue           = np.zeros_like(delta)
-            Theta        = np.zeros_like(delta)
-
-            # ------------------------------------------------------------
-            # ****** TRAILING EDGE BOUNDARY LAYER PROPERTY CALCULATIONS  ******  
-            npanel                  = 50
-            Re_batch                = np.atleast_2d(np.ones(num_sec)*Re[0,0]).T 
-            AoA_batch               = np.atleast_2d(np.ones(num_sec)*alpha[0,0]).T       
-            airfoil_geometry        = compute_naca_4series(['0012'],npoints=npanel) 
-            airfoil_stations        = [0] * num_sec
-            AP                      = airfoil_analysis(airfoil_geometry,AoA_batch,Re_batch, npanel, batch_analysis = False, airfoil_stations = airfoil_stations)     
-
-            TE_idx                  = -4 
-            delta[:,:,:,:,0]        = vectorize(AP.delta[:,TE_idx]                         ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[2]             
-            delta[:,:,:,:,1]        = vectorize(AP.delta[:,-TE_idx]                        ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[2]  
-            delta_star[:,:,:,:,0]   = vectorize(AP.delta_star[:,TE_idx]                    ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[3]                    
-            delta_star[:,:,:,:,1]   = vectorize(AP.delta_star[:,-TE_idx]                   ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[3]   
-            surface_dcp_dx          = (np.diff(AP.Cp*0.5*rho*(V_inf**2),axis = 1)/(np.diff(AP.x,axis = 1)*chord))  
-            dp_dx[:,:,:,:,0]        = vectorize(abs(surface_dcp_dx[:,TE_idx]),ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[4]         
-            dp_dx[:,:,:,:,1]        = vectorize(abs(surface_dcp_dx[:,-TE_idx]),ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[4]               
-            C_f[:,:,:,:,0]          = vectorize(AP.Cf[:,TE_idx]                            ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[5]                        
-            C_f[:,:,:,:,1]          = vectorize(AP.Cf[:,-TE_idx]                           ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[5]          
-            Ue[:,:,:,:,0]           = vectorize(AP.Ue_Vinf[:,TE_idx]*V_inf                 ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[6]                     
-            Ue[:,:,:,:,1]           = vectorize(AP.Ue_Vinf[:,-TE_idx]*V_inf                ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[6]                                    
-            Theta[:,:,:,:,0]        = vectorize(AP.theta[:,TE_idx]                         ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[7]                     
-            Theta[:,:,:,:,1]        = vectorize(AP.theta[:,-TE_idx]                        ,ctrl_pts,num_sec,N_r,BSR,method = 2)* multipliers[7]    
-            tau_w                   = C_f*(0.5*rho*(Ue**2))
-
-            # ------------------------------------------------------------
-            # ****** BLADE MOTION CALCULATIONS ******  
-            omega   = vectorize(w,ctrl_pts,num_sec,N_r,BSR,method = 3)                                                
-
-            # ------------------------------------------------------------
-            # ****** EMPIRICAL WALL PRESSURE SPECTRUM ******  
-            # equation 8 
-            mu_tau              = (tau_w/rho)**0.5 
-            ones                = np.ones_like(mu_tau)  
-            R_T                 = (delta/Ue)/(kine_visc/(mu_tau**2))       
-            beta_c              =  (Theta/tau_w)*dp_dx                                                    
-            Delta               = delta/delta_star    
-            e                   = 3.7 + 1.5*beta_c             
-            d                   =  4.76*((1.4/Delta)**0.75)*(0.375*e - 1)                            
-            PI                  = 0.8*((beta_c + 0.5)**3/4)                        
-            a                   = (2.82*(Delta**2)*((6.13*(Delta**(-0.75)) + d)**e))*(4.2*(PI/Delta) + 1)   
-            h_star              = np.minimum(3*ones,(0.139 + 3.1043*beta_c)) + 7  
-            d_star              = d   
-            d_star[beta_c<0.5]  = np.maximum(ones,1.5*d)[beta_c<0.5] 
-            expression_F        = (omega*delta_star/Ue)     
-            expression_C        = np.maximum(a, (0.25*beta_c - 0.52)*a)*(expression_F**2) 
-            expression_D        = (4.76*(expression_F**0.75) + d_star)**e                                
-            expression_E        = (8.8*(R_T**(-0.57))*expression_F)**h_star                              
-            Phi_pp_expression   =  expression_C/( expression_D + expression_E)                           
-            Phi_pp              = ((tau_w**2)*delta_star*Phi_pp_expression)/Ue      
-            var                 = 10*np.log10((Phi_pp)/((2E-5)**2))   
-
-            axis_1.semilogx(frequency,var[0,0,0,:,0],color = PP.colors[idx], 
+            axis_1.semilogx(frequency,var[var_idx,idx,0,0,:,0],color = PP.colors[idx], 
                             linestyle = PP.line_style, markersize = PP.m, marker = PP.markers[idx],
                           label = M_name[idx] + sensitivity_variables[var_idx])      
             axis_1.legend(loc='upper right', ncol= 3, prop={'size': PP.legend_font_size})    
@@ -830,6 +805,84 @@ def Broadband_Spectrum_Shape_Sensitivity(PP,save_figures):
 
     return   
 
+# ------------------------------------------------------------------ 
+# Broadband Sensitivity Spectra
+# ------------------------------------------------------------------ 
+def broadband_sensitivity_spectra(multipliers):
+    '''Wall pressure spectra of a NACA 0012 trailing edge for a batch of sensitivity cases,
+    one row of multipliers (Re, alpha, delta, delta*, dp/dx, C_f, U_e, theta) per case. The
+    cases are stacked along the control points, so the boundary layer of every case is 
+    solved in one panel method call and the spectra are evaluated at once.
+    '''
+
+    pi           = np.pi 
+    rho          = 1.2                                               
+    kine_visc    = np.array([[0.0000150]])                        
+    num_sec      = 1 # number of sections  
+    N_r          = 1
+    ctrl_pts     = len(multipliers)
+    BSR          = 100 # broadband spectrum resolution
+    frequency    = np.linspace(1E2,1E4,BSR) 
+    w            = 2*pi*frequency
+    Re           = np.atleast_2d(1.5E6 * multipliers[:,0]).T 
+    alpha        = np.atleast_2d(6. * multipliers[:,1]).T *Units.degrees                                        
+    V_inf        = 69.5
+    chord        = Re*kine_visc/V_inf
+    kine_visc    = vectorize(kine_visc,ctrl_pts,num_sec,N_r,1,method = 1)
+
+    # ------------------------------------------------------------
+    # ****** TRAILING EDGE BOUNDARY LAYER PROPERTY CALCULATIONS  ******  
+    npanel                  = 50
+    Re_batch                = Re 
+    AoA_batch               = alpha       
+    airfoil_geometry        = compute_naca_4series(['0012'],npoints=npanel) 
+    airfoil_stations        = [0] * ctrl_pts
+    AP                      = airfoil_analysis(airfoil_geometry,AoA_batch,Re_batch, npanel, batch_analysis = False, airfoil_stations = airfoil_stations)     
+
+    # [control point, rotors, sections, frequencies, suction/pressure side], the boundary
+    # layer is the same at every frequency so that axis is left to broadcast 
+    def stack(suction,pressure,multiplier):
+        return np.stack([suction*multiplier,pressure*multiplier],axis = 1)[:,None,None,None,:]*np.ones((1,N_r,num_sec,1,1))
+
+    TE_idx                  = -4 
+    surface_dcp_dx          = (np.diff(AP.Cp*0.5*rho*(V_inf**2),axis = 1)/(np.diff(AP.x,axis = 1)*chord))  
+    delta                   = stack(AP.delta[:,TE_idx]           ,AP.delta[:,-TE_idx]            ,multipliers[:,2])             
+    delta_star              = stack(AP.delta_star[:,TE_idx]      ,AP.delta_star[:,-TE_idx]       ,multipliers[:,3])                    
+    dp_dx                   = stack(abs(surface_dcp_dx[:,TE_idx]),abs(surface_dcp_dx[:,-TE_idx]) ,multipliers[:,4])         
+    C_f                     = stack(AP.Cf[:,TE_idx]              ,AP.Cf[:,-TE_idx]               ,multipliers[:,5])                        
+    Ue                      = stack(AP.Ue_Vinf[:,TE_idx]*V_inf   ,AP.Ue_Vinf[:,-TE_idx]*V_inf    ,multipliers[:,6])                     
+    Theta                   = stack(AP.theta[:,TE_idx]           ,AP.theta[:,-TE_idx]            ,multipliers[:,7])    
+    tau_w                   = C_f*(0.5*rho*(Ue**2))
+
+    # ------------------------------------------------------------
+    # ****** BLADE MOTION CALCULATIONS ******  
+    omega   = np.broadcast_to(w[None,None,None,:,None],(ctrl_pts,N_r,num_sec,BSR,2))                                                
+
+    # ------------------------------------------------------------
+    # ****** EMPIRICAL WALL PRESSURE SPECTRUM ******  
+    # equation 8 
+    mu_tau              = (tau_w/rho)**0.5 
+    ones                = np.ones_like(mu_tau)  
+    R_T                 = (delta/Ue)/(kine_visc/(mu_tau**2))       
+    beta_c              =  (Theta/tau_w)*dp_dx                                                    
+    Delta               = delta/delta_star    
+    e                   = 3.7 + 1.5*beta_c             
+    d                   =  4.76*((1.4/Delta)**0.75)*(0.375*e - 1)                            
+    PI                  = 0.8*((beta_c + 0.5)**3/4)                        
+    a                   = (2.82*(Delta**2)*((6.13*(Delta**(-0.75)) + d)**e))*(4.2*(PI/Delta) + 1)   
+    h_star              = np.minimum(3*ones,(0.139 + 3.1043*beta_c)) + 7  
+    d_star              = d   
+    d_star[beta_c<0.5]  = np.maximum(ones,1.5*d)[beta_c<0.5] 
+    expression_F        = (omega*delta_star/Ue)     
+    expression_C        = np.maximum(a, (0.25*beta_c - 0.52)*a)*(expression_F**2) 
+    expression_D        = (4.76*(expression_F**0.75) + d_star)**e                                
+    expression_E        = (8.8*(R_T**(-0.57))*expression_F)**h_star                              
+    Phi_pp_expression   =  expression_C/( expression_D + expression_E)                           
+    Phi_pp              = ((tau_w**2)*delta_star*Phi_pp_expression)/Ue      
+    var                 = 10*np.log10((Phi_pp)/((2E-5)**2))   
+
+    return frequency, var   
+
 # ------------------------------------------------------------------ 
 # Broadband Spectrum Validation
 # ------------------------------------------------------------------     
@@ -858,14 +911,7 @@ def Broadband_Spectrum_Validation(PP,save_figures):
     alpha        = np.array([[6.]]) *Units.degrees                                      
     V_inf        = 69.5
     chord        = Re*kine_visc/V_inf
-    kine_visc    = vectorize(kine_visc,ctrl_pts,num_sec,N_r,BSR,method = 1)
-    delta        = np.zeros((ctrl_pts,N_r,num_sec,BSR,2))  
-    delta_star   = np.zeros_like(delta)
-    dp_dx        = np.zeros_like(delta)
-    C_f          = np.zeros_like(delta)
-    tau_w        = np.zeros_like(delta)
-    Ue           = np.zeros_like(delta)
-    Theta        = np.zeros_like(delta)
+    kine_visc    = vectorize(kine_visc,ctrl_pts,num_sec,N_r,1,method = 1)
 
     # ------------------------------------------------------------
     # ****** TRAILING EDGE BOUNDARY LAYER PROPERTY CALCULATIONS  ******  
@@ -876,21 +922,20 @@ def Broadband_Spectrum_Validation(PP,save_figures):
     airfoil_stations        = [0] * num_sec
     AP                      = airfoil_analysis(airfoil_geometry,AoA_batch,Re_batch, airfoil_stations = airfoil_stations)     
 
+    # [control point, rotors, sections, frequencies, suction/pressure side], the boundary
+    # layer is the same at every frequency so that axis is left to broadcast 
     TE_idx                  = -12
-    
-    delta[:,:,:,:,0]        = vectorize(AP.delta[:,:,TE_idx]                       ,ctrl_pts,num_sec,N_r,BSR,method = 2)              
-    delta[:,:,:,:,1]        = vectorize(AP.delta[:,:,-TE_idx]                        ,ctrl_pts,num_sec,N_r,BSR,method = 2)   
-    delta_star[:,:,:,:,0]   = vectorize(AP.delta_star[:,:,TE_idx]                    ,ctrl_pts,num_sec,N_r,BSR,method = 2)                     
-    delta_star[:,:,:,:,1]   = vectorize(AP.delta_star[:,:,-TE_idx]                   ,ctrl_pts,num_sec,N_r,BSR,method = 2)    
+    def sides(values):
+        return np.stack([vectorize(values[:,:,TE_idx] ,ctrl_pts,num_sec,N_r,1,method = 2),
+                         vectorize(values[:,:,-TE_idx],ctrl_pts,num_sec,N_r,1,method = 2)],axis = 4)
+
     surface_dcp_dx          = AP.dcp_dx*0.5*rho*(V_inf**2)/chord
-    dp_dx[:,:,:,:,0]        = vectorize(abs(surface_dcp_dx[:,:,TE_idx]),ctrl_pts,num_sec,N_r,BSR,method = 2)       
-    dp_dx[:,:,:,:,1]        = vectorize(abs(surface_dcp_dx[:,:,-TE_idx]),ctrl_pts,num_sec,N_r,BSR,method = 2)           
-    C_f[:,:,:,:,0]          = vectorize(AP.cf[:,:,TE_idx]                            ,ctrl_pts,num_sec,N_r,BSR,method = 2)                        
-    C_f[:,:,:,:,1]          = vectorize(AP.cf[:,:,-TE_idx]                           ,ctrl_pts,num_sec,N_r,BSR,method = 2)          
-    Ue[:,:,:,:,0]           = vectorize(AP.Ue_Vinf[:,:,TE_idx]*V_inf                 ,ctrl_pts,num_sec,N_r,BSR,method = 2)                     
-    Ue[:,:,:,:,1]           = vectorize(AP.Ue_Vinf[:,:,-TE_idx]*V_inf                ,ctrl_pts,num_sec,N_r,BSR,method = 2)                                    
-    Theta[:,:,:,:,0]        = vectorize(AP.theta[:,:,TE_idx]                         ,ctrl_pts,num_sec,N_r,BSR,method = 2)                     
-    Theta[:,:,:,:,1]        = vectorize(AP.theta[:,:,-TE_idx]                        ,ctrl_pts,num_sec,N_r,BSR,method = 2)    
+    delta                   = sides(AP.delta)              
+    delta_star              = sides(AP.delta_star)                     
+    dp_dx                   = sides(abs(surface_dcp_dx))       
+    C_f                     = sides(AP.cf)                        
+    Ue                      = sides(AP.Ue_Vinf*V_inf)                     
+    Theta                   = sides(AP.theta)    
     tau_w                   = C_f*(0.5*rho*(Ue**2))
 
     # ------------------------------------------------------------
@@ -2238,6 +2283,182 @@ def ANOPP2_Validation(PP,save_figures):
     
     return 
 
+# ------------------------------------------------------------------ 
+# APC SF Noise Case
+# ------------------------------------------------------------------ 
+def APC_SF_noise_case(N_mic_x,N_mic_y):
+    """Network, rotor outputs, segment and noise settings of the APC SF rotor at
+    three rotational speeds, with an N_mic_x x N_mic_y ground microphone grid
+    5 m below the rotor"""
+    APC_SF = design_APC_11x_4_7_prop()   
+    
+    # Atmosheric conditions 
+    a                     = 343   
+    density               = 1.225
+    dynamic_viscosity     = 1.78899787e-05   
+    T                     = 286.16889478 
+
+    # Define Network
+    net_APC_SF                                  = Battery_Propeller()
+    net_APC_SF.number_of_propeller_engines      = 1        
+    net_APC_SF.identical_propellers             = True  
+    net_APC_SF.propellers.append(APC_SF)    
+
+    # Run conditions                            
+    APC_SF_omega_vector                         = np.array([3600,4200,4800]) * Units.rpm 
+    ctrl_pts                                    = len(APC_SF_omega_vector)   
+    velocity                                    = 0.08*APC_SF_omega_vector*APC_SF.tip_radius 
+
+    # Microphone Locations 
+    X,Y             = np.meshgrid(np.linspace(-10,10,N_mic_x),np.linspace(-10,10,N_mic_y),indexing = 'ij')
+    positions       = np.zeros((N_mic_x*N_mic_y,3))
+    positions[:,0]  = X.flatten()
+    positions[:,1]  = Y.flatten()
+    positions[:,2]  = 5.
+
+    # Define conditions 
+    APC_SF.thrust_angle                                            = 0. * Units.degrees
+    APC_SF.inputs.omega                                            = np.atleast_2d(APC_SF_omega_vector).T
+    APC_SF_conditions                                              = Aerodynamics() 
+    APC_SF_conditions.freestream.density                           = np.ones((ctrl_pts,1)) * density
+    APC_SF_conditions.freestream.dynamic_viscosity                 = np.ones((ctrl_pts,1)) * dynamic_viscosity   
+    APC_SF_conditions.freestream.speed_of_sound                    = np.ones((ctrl_pts,1)) * a 
+    APC_SF_conditions.freestream.temperature                       = np.ones((ctrl_pts,1)) * T
+    v_mat                                                          = np.zeros((ctrl_pts,3))
+    v_mat[:,0]                                                     = velocity 
+    APC_SF_conditions.frames.inertial.velocity_vector              = v_mat 
+    APC_SF_conditions.propulsion.throttle                          = np.ones((ctrl_pts,1)) * 1.0 
+    APC_SF_conditions.frames.body.transform_to_inertial            = np.array([[[1., 0., 0.],[0., 1., 0.],[0., 0., 1.]]])
+
+    # Run Propeller BEMT new model  
+    APC_SF_thrust, APC_SF_torque, APC_SF_power, APC_SF_Cp, acoustic_outputs  , APC_SF_etap  =  APC_SF.spin(APC_SF_conditions)  
+    
+    # Prepare Inputs for Noise Model  
+    APC_SF_conditions.noise.total_microphone_locations             = np.repeat(positions[ np.newaxis,:,: ],ctrl_pts,axis=0)
+    APC_SF_conditions.aerodynamics.angle_of_attack                 = np.ones((ctrl_pts,1))* 0. * Units.degrees 
+    APC_SF_segment                                                 = Segment() 
+    APC_SF_segment.state.conditions                                = APC_SF_conditions
+    APC_SF_segment.state.conditions.expand_rows(ctrl_pts)
+    APC_SF_settings                                                = Data()
+    APC_SF_settings                                                = setup_noise_settings(APC_SF_segment)
+    
+    return net_APC_SF, acoustic_outputs, APC_SF_segment, APC_SF_settings
+
+# ------------------------------------------------------------------ 
+# Parallel Noise Scaling
+# ------------------------------------------------------------------ 
+def Parallel_Noise_Scaling(PP,save_figures):
+    """Wall time of the microphone-parallel propeller noise on a 100 x 100
+    ground microphone grid below the APC SF rotor, for increasing numbers of
+    workers"""
+    net_APC_SF, acoustic_outputs, APC_SF_segment, APC_SF_settings = APC_SF_noise_case(100,100)
+
+    # Run Noise Model    
+    benchmark = benchmark_parallel_noise(net_APC_SF.propellers,acoustic_outputs,APC_SF_segment,APC_SF_settings,[1,2,4,8,12])
+    print('Speedup: ' + str(np.round(benchmark.speedup,2)) + ', maximum SPL difference: ' + str(np.max(benchmark.maximum_error)) + ' dB')
+
+    fig = plt.figure('Parallel_Noise_Scaling')
+    fig.set_size_inches(PP.figure_width,PP.figure_height)
+    axes = fig.add_subplot(1,1,1)
+    axes.plot(benchmark.workers,benchmark.workers, color = PP.Rlc[0], linestyle = PP.Rls, linewidth = PP.lw, label = 'Linear')
+    axes.plot(benchmark.workers,benchmark.speedup, color = PP.Slc[0], linestyle = PP.Sls, marker = PP.Slm, markersize = PP.m, linewidth = PP.lw, label = 'SUAVE')
+    axes.set_xlabel('Workers')
+    axes.set_ylabel('Speedup')
+    axes.legend(loc='upper left', prop={'size': PP.legend_font})
+    fig.tight_layout()
+    if save_figures:
+        plt.savefig('Parallel_Noise_Scaling.png')
+    return 
+
+
+# ------------------------------------------------------------------ 
+# Spectrum Table Benchmark
+# ------------------------------------------------------------------ 
+def Spectrum_Table_Benchmark(PP,save_figures):
+    """Wall time of the third octave binning and A-weighting of harmonic spectra
+    with the SUAVE functions and with the cached binning matrices and A-weighting
+    vectors of Spectrum_Tables, for increasing numbers of microphones.
+    """
+    settings          = setup_noise_settings(Data())
+    microphone_counts = np.array([16,64,256,1024,4096])
+    original_times    = np.zeros(len(microphone_counts))
+    table_times       = np.zeros(len(microphone_counts))
+    for i in range(len(microphone_counts)):
+        benchmark         = benchmark_spectrum_tables(settings,number_of_microphones = microphone_counts[i])
+        original_times[i] = benchmark.original_time
+        table_times[i]    = benchmark.table_time
+
+    fig = plt.figure('Spectrum_Table_Benchmark')
+    fig.set_size_inches(PP.figure_width,PP.figure_height)
+    axes = fig.add_subplot(1,1,1)
+    axes.loglog(microphone_counts,original_times*1000, color = PP.Rlc[0], linestyle = PP.Rls, marker = PP.Rlm, markersize = PP.m, linewidth = PP.lw, label = 'SUAVE')
+    axes.loglog(microphone_counts,table_times*1000, color = PP.Slc[0], linestyle = PP.Sls, marker = PP.Slm, markersize = PP.m, linewidth = PP.lw, label = 'Tables')
+    axes.set_xlabel('Microphones')
+    axes.set_ylabel('Time (ms)')
+    axes.legend(loc='upper left', prop={'size': PP.legend_font})
+    fig.tight_layout()
+    if save_figures:
+        plt.savefig('Spectrum_Table_Benchmark.png')
+    return 
+
+# ------------------------------------------------------------------ 
+# Noise Memory Benchmark
+# ------------------------------------------------------------------ 
+def Noise_Memory_Benchmark(PP,save_figures):
+    """Peak memory of the whole broadband evaluation, boundary layer solution and
+    wall pressure spectra, for increasing batches of sensitivity cases against the
+    size of the spectra it returns, and of the propeller noise on a 100 x 100
+    microphone grid below the APC SF rotor for decreasing microphone chunk sizes"""
+    
+    # broadband evaluation 
+    for num_cases in [1,10,100]:
+        tracemalloc.start()
+        frequency,spectra = broadband_sensitivity_spectra(np.ones((num_cases,8)))
+        peak_memory       = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('Broadband spectra of ' + str(num_cases) + ' cases: ' + str(round(peak_memory/2**20,2)) + ' MB peak, ' +
+              str(round(spectra.nbytes/2**20,2)) + ' MB of spectra')
+    
+    # propeller noise by microphone chunks 
+    net_APC_SF, acoustic_outputs, APC_SF_segment, APC_SF_settings = APC_SF_noise_case(100,100)
+    benchmark = benchmark_microphone_chunks(net_APC_SF.propellers,acoustic_outputs,APC_SF_segment,APC_SF_settings,[None,4096,1024,256])
+
+    fig = plt.figure('Noise_Memory_Benchmark')
+    fig.set_size_inches(PP.figure_width,PP.figure_height)
+    axes = fig.add_subplot(1,1,1)
+    axes.semilogx(benchmark.chunk_sizes,benchmark.peak_memory/2**20, color = PP.Slc[0], linestyle = PP.Sls, marker = PP.Slm, markersize = PP.m, linewidth = PP.lw, label = 'SUAVE')
+    axes.set_xlabel('Microphones per Chunk')
+    axes.set_ylabel('Peak Memory (MB)')
+    axes.legend(loc='upper left', prop={'size': PP.legend_font})
+    fig.tight_layout()
+    if save_figures:
+        plt.savefig('Noise_Memory_Benchmark.png')
+    return 
+
+# ------------------------------------------------------------------ 
+# Noise Validation Benchmark
+# ------------------------------------------------------------------ 
+def Noise_Validation_Benchmark(PP,save_figures):
+    """Wall time, peak memory and error against experimental data of the harmonic,
+    broadband, high fidelity and ANOPP2 validation cases, written to
+    Noise_Validation_benchmark.json. When Noise_Validation_Baseline_benchmark.json,
+    a copy of an earlier run, is present the curves of the cases are compared to it
+    """
+    cases = {'Harmonic_Stength_Validation'    : Harmonic_Stength_Validation,
+             'Harmonic_Directivty_Validation' : Harmonic_Directivty_Validation,
+             'Broadband_Spectrum_Validation'  : Broadband_Spectrum_Validation,
+             'Broadband_Noise_Validation'     : Broadband_Noise_Validation,
+             'High_Fidelity_Validation_1'     : High_Fidelity_Validation_1,
+             'High_Fidelity_Validation_2'     : High_Fidelity_Validation_2,
+             'ANOPP2_Validation'              : ANOPP2_Validation}
+    
+    # Hubbard directivity, the polar SUAVE curves are in radians 
+    reference_data = {'Propeller_Noise_Directivity_Validation_Harm_1': ('Reference_Data_and_Images/Hubbard_exp_data_1_2_harmonics.txt','First harmonic',Units.degrees),
+                      'Propeller_Noise_Directivity_Validation_Harm_2': ('Reference_Data_and_Images/Hubbard_exp_data_1_2_harmonics.txt','Second harmonic',Units.degrees)}
+    
+    results = run_validation_benchmark(cases,PP,reference_data,filename = 'Noise_Validation',
+                                       baseline = 'Noise_Validation_Baseline_benchmark.json')
+    return results
 
 def setup_noise_settings(sts): 
 
@@ -2272,17 +2493,23 @@ def setup_noise_settings(sts):
 # Vectorize Function
 # ------------------------------------------------------------------ 
 def vectorize(vec,ctrl_pts,num_sec,N_r,BSR,method):
+    '''Expands vec to the (control point, rotor, section, frequency, side) layout of
+    the broadband model. Only the small leading axes are repeated, the frequency and
+    side axes are broadcast views, so the result is read-only and takes no memory
+    beyond vec.
+    '''
     vec = np.atleast_2d(vec)
     if method == 1:
-        res = np.repeat(np.repeat(np.repeat(np.repeat(vec,N_r,axis = 1)[:,:,np.newaxis],
-                                            num_sec,axis = 2)[:,:,:,np.newaxis],BSR,axis = 3)[:,:,:,:,np.newaxis],2,axis = 4)
+        res = np.repeat(vec,N_r,axis = 1)[:,:,np.newaxis,np.newaxis,np.newaxis]
+        res = np.broadcast_to(res,res.shape[:2] + (num_sec,BSR,2))
 
     elif method == 2:
-        res = np.repeat(np.repeat(np.repeat(vec,N_r,axis = 1)[:,:,np.newaxis],num_sec,axis = 2)[:,:,:,np.newaxis],BSR,axis = 3) 
-
+        res = np.repeat(vec,N_r,axis = 1)[:,:,np.newaxis,np.newaxis]
+        res = np.broadcast_to(res,res.shape[:2] + (num_sec,BSR))
 
     elif method == 3:
-        res = np.repeat(np.repeat(np.repeat(vec[:,np.newaxis,:],N_r,axis = 0)[:,:,np.newaxis,:],num_sec,axis = 0)[:,:,:,:,np.newaxis],2,axis = 4) 
+        res = np.repeat(np.repeat(vec[:,np.newaxis,:],N_r,axis = 0)[:,:,np.newaxis,:],num_sec,axis = 0)[:,:,:,:,np.newaxis]
+        res = np.broadcast_to(res,res.shape[:4] + (2,))
 
     return res 
 
@@ -1,9 +1,13 @@
 import numpy as np
 from SUAVE.Core import Units
 import matplotlib.pyplot as plt
-from scipy.interpolate import griddata
 import matplotlib.colors
 
+import sys 
+sys.path.append('../../Aircraft_Models/Mission_Tools')  
+import Terrain_Store
+import Terrain_Interpolation
+
 
 # ----------------------------------------------------------------------
 #   Main
@@ -43,7 +47,8 @@ def  modified_code():
                   'axes.titlesize': 32,
                   'font.size': 10})
     
-    topography_file        = 'LA_Metropolitan_Zoomed_Area.txt'  
+    city                   = 'LA'  
+    area                   = 'Zoomed_Area'  
      
     colors_undersea = plt.cm.terrain(np.linspace(0, 0.17, 56))
     colors_land     = plt.cm.terrain(np.linspace(0.25, 1, 200)) 
@@ -53,7 +58,8 @@ def  modified_code():
     cut_terrain_map = matplotlib.colors.LinearSegmentedColormap.from_list('cut_terrain', colors)
     
     
-    data = np.loadtxt(topography_file)
+    terrain = Terrain_Store.load_terrain(city,area)
+    data    = Terrain_Store.terrain_points(terrain)
     Long = data[:,0]
     Lat  = data[:,1]
     Elev = data[:,2] 
@@ -68,7 +74,7 @@ def  modified_code():
     
     [long_dist,lat_dist]  = np.meshgrid(np.linspace(0,y_dist_max,N_long),np.linspace(0,x_dist_max,N_lat))
     [long_deg,lat_deg]    = np.meshgrid(np.linspace(np.min(Long),np.max(Long),N_long),np.linspace(np.min(Lat),np.max(Lat),N_lat)) 
-    z_deg                 = griddata((Lat,Long), Elev, (lat_deg, long_deg), method='linear')     
+    z_deg                 = Terrain_Interpolation.terrain_elevation(Terrain_Interpolation.terrain_interpolator(terrain), lat_deg, long_deg, method='linear')     
          
     norm = FixPointNormalize(sealevel=0,vmax=np.max(z_deg),vmin=np.min(z_deg)) 
     
@@ -104,7 +110,8 @@ def downloaded_code():
     cut_terrain_map = matplotlib.colors.LinearSegmentedColormap.from_list('cut_terrain', colors)
     
     
-    data = np.loadtxt('LA_Metropolitan_Area.txt'); 
+    terrain = Terrain_Store.load_terrain('LA','Area')
+    data    = Terrain_Store.terrain_points(terrain)
     Long = data[:,0]
     Lat  = data[:,1]
     Elev = data[:,2] 
@@ -115,7 +122,7 @@ def downloaded_code():
     pts = 1000   
      
     [x,y] = np.meshgrid(np.linspace(np.min(Long),np.max(Long),pts),np.linspace(np.min(Lat),np.max(Lat),pts))
-    z = griddata((Long, Lat), Elev, (x, y), method='linear')
+    z = Terrain_Interpolation.terrain_elevation(Terrain_Interpolation.terrain_interpolator(terrain), y, x, method='linear')
     x = np.matrix.flatten(x)
     y = np.matrix.flatten(y)
     z = np.matrix.flatten(z)
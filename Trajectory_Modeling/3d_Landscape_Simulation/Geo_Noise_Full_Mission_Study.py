@@ -13,17 +13,29 @@ import pickle
 from SUAVE.Plots.Performance.Mission_Plots import *  
 from SUAVE.Plots.Geometry                  import * 
 
+import functools
 import time  
 import numpy as np
 import pylab as plt
 
 import sys 
 sys.path.append('../../Aircraft_Models/Stopped_Rotor_V2')  
+sys.path.append('../../Aircraft_Models/Mission_Tools')  
 
 import Stopped_Rotor_V2_Vehicle
 import Stopped_Rotor_V2_Analyses 
 import Stopped_Rotor_V2_Missions
 import Stopped_Rotor_V2_Plots  
+import Periodic_Mission
+import Mission_Profiler
+import Adaptive_Control_Points
+import Adaptive_Stencil
+import Noise_Hemisphere
+import Noise_Metrics
+import Parallel_Noise
+import Spectrum_Tables
+import Terrain_Store
+import Terrain_Interpolation
 try:
     import vsp 
     from SUAVE.Input_Output.OpenVSP.vsp_write import write 
@@ -46,11 +58,23 @@ def main():
     simulated_days             = 1               # number of days simulated 
     flights_per_day            = 1               # number of flights per day   
     recharge_battery           = False           # flag to simulate battery recharge  
+    periodic_mission           = False           # solve one flight and carry the battery state over the remaining flights 
+    profile_mission            = False           # write per-segment, per-process-step timing reports 
     plot_mission               = True            # plot mission flag  
     control_points             = 10              # number of control points per segment 
+    adaptive_control_points    = False           # refine control points per segment from a coarse count 
+    coarse_control_points      = 5               # starting number of control points per segment in adaptive mode 
     
     # noise analysis parameters 
     run_noise_model            = True     
+    adaptive_stencil           = False           # size the ground microphone stencil per control point after the trajectory is solved 
+    background_noise           = 35.             # SPL floor the adaptive stencil grows to [dBA] 
+    hemisphere_noise           = False           # interpolate rotor noise from a sphere of directions instead of evaluating every microphone 
+    parallel_noise             = False           # split the microphones of the rotor noise over a process pool, reused for the whole mission 
+    microphone_chunk_size      = None            # microphones the rotor noise is evaluated for at once to bound its peak memory, all if None 
+    spectrum_tables            = False           # bin third octave spectra and A-weight them with cached tables 
+    terrain_store              = False           # read the topography file from a converted store in Mission_Tools/Terrain_Store 
+    terrain_interpolation      = False           # interpolate the topography with the lattice grid interpolation instead of scipy griddata 
     
     # strings for savign results 
     city                       = 'LA'  
@@ -59,6 +83,10 @@ def main():
     
 
     if RUN_NEW_MODEL_FLAG:    
+        if terrain_store:
+            Terrain_Store.enable_terrain_store()
+        if terrain_interpolation:
+            Terrain_Interpolation.enable_terrain_interpolation()
         topography_data = preprocess_topography_and_route_data(topography_file                       = 'LA_Metropolitan_Zoomed_Area.txt',
                                                                departure_coordinates                 = [33.94067953101678, -118.40513722978149],
                                                                destination_coordinates               = [33.81713622114423, -117.92111163722772],
@@ -66,6 +94,8 @@ def main():
                                                                number_of_longitudinal_microphones    = 101,
                                                                latitudinal_microphone_stencil_size   = 3,
                                                                longitudinal_microphone_stencil_size  = 3 )
+        Terrain_Store.disable_terrain_store()
+        Terrain_Interpolation.disable_terrain_interpolation()
          
         # -------------------------------------------------------------------------------------------    
         # SET UP VEHICLE
@@ -76,20 +106,28 @@ def main():
         # SET UP CONFIGURATIONS 
         # -------------------------------------------------------------------------------------------
         configs           = Stopped_Rotor_V2_Vehicle.configs_setup(vehicle)  
-        configs_analyses  = Stopped_Rotor_V2_Analyses.topography_analyses_setup(configs,topography_data,run_noise_model)
+        # the adaptive stencil and adaptive control points evaluate noise once the trajectory is solved 
+        configs_analyses  = Stopped_Rotor_V2_Analyses.topography_analyses_setup(configs,topography_data,run_noise_model and not adaptive_stencil and not adaptive_control_points)
+        noise_setup       = functools.partial(Stopped_Rotor_V2_Analyses.noise_analysis_setup,microphone_data = topography_data,topography = True)
     
         # -------------------------------------------------------------------------------------------    
         # SET UP MISSION PROFILE  
         # -------------------------------------------------------------------------------------------    
-        base_mission      = Stopped_Rotor_V2_Missions.low_altitude_constant_elevation_cruise(configs_analyses,vehicle,simulated_days,flights_per_day,control_points,recharge_battery,topography_data)
-        missions_analyses = Stopped_Rotor_V2_Missions.missions_setup(base_mission) 
+        # in adaptive mode the mission is built, and profiled, on every refinement pass instead 
+        if adaptive_control_points:
+            base_mission  = None
+        elif periodic_mission:
+            base_mission  = Stopped_Rotor_V2_Missions.low_altitude_constant_elevation_cruise(configs_analyses,vehicle,1,1,control_points,recharge_battery,topography_data)
+        else:
+            base_mission  = Stopped_Rotor_V2_Missions.low_altitude_constant_elevation_cruise(configs_analyses,vehicle,simulated_days,flights_per_day,control_points,recharge_battery,topography_data)
     
         # -------------------------------------------------------------------------------------------    
         # DEFINE ANALYSES 
         # -------------------------------------------------------------------------------------------
         analyses          = SUAVE.Analyses.Analysis.Container()
         analyses.configs  = configs_analyses
-        analyses.missions = missions_analyses 
+        if base_mission != None:
+            analyses.missions = Stopped_Rotor_V2_Missions.missions_setup(base_mission) 
         
     
         # -------------------------------------------------------------------------------------------    
@@ -101,26 +139,75 @@ def main():
         # -------------------------------------------------------------------------------------------    
         # APPEND MISSION TO SIMULATION 
         # -------------------------------------------------------------------------------------------    
-        mission           = analyses.missions.base
+        # community noise metrics are accumulated segment by segment while the noise is evaluated or replayed 
+        running_metrics   = Noise_Metrics.Running_Noise_Metrics()
+        if base_mission != None:
+            mission       = analyses.missions.base
+            if profile_mission:
+                Mission_Profiler.profile_mission(mission)
+            if run_noise_model and not periodic_mission:
+                running_metrics = Noise_Metrics.add_noise_metrics(mission)
         
     
         # -------------------------------------------------------------------------------------------    
         # RUN SIMULATION !!
         # -------------------------------------------------------------------------------------------
-        noise_results     = mission.evaluate() 
+        if hemisphere_noise:
+            Noise_Hemisphere.enable_hemisphere_noise()
+        if parallel_noise or microphone_chunk_size != None:
+            Parallel_Noise.enable_parallel_noise(configs_analyses,None if parallel_noise else 1,microphone_chunk_size)
+        if spectrum_tables:
+            Spectrum_Tables.enable_spectrum_tables()
+        if adaptive_control_points:
+            def mission_setup(N):
+                mission = Stopped_Rotor_V2_Missions.low_altitude_constant_elevation_cruise(configs_analyses,vehicle,simulated_days,flights_per_day,N,recharge_battery,topography_data)
+                if profile_mission:
+                    # timings are cleared on every pass, the report covers the last pass 
+                    Mission_Profiler.profile_mission(mission)
+                return mission
+            replay_setup  = noise_setup if run_noise_model and not adaptive_stencil else None 
+            noise_results = Adaptive_Control_Points.adaptive_mission_evaluate(mission_setup,coarse_control_points,noise_setup = replay_setup,
+                                                                              noise_metrics = running_metrics)
+        elif periodic_mission:
+            periodic      = Periodic_Mission.evaluate_periodic_mission(mission,vehicle,simulated_days,flights_per_day,recharge_battery)
+            noise_results = periodic.results
+        else:
+            noise_results = mission.evaluate() 
+        
+        if run_noise_model and adaptive_stencil:
+            noise_results = Adaptive_Stencil.adaptive_stencil_replay(noise_results,noise_setup,background_noise,noise_metrics = running_metrics)
+        if parallel_noise or microphone_chunk_size != None:
+            Parallel_Noise.disable_parallel_noise()
+        if spectrum_tables:
+            Spectrum_Tables.disable_spectrum_tables()
     
         # -------------------------------------------------------------------------------------------    
         # SAVE RESULTS
         # -------------------------------------------------------------------------------------------
         filename          = 'SR_V2_Geo_Noise' + city + '_' +  departure_location + '_to_' + destination_location
         save_results(noise_results,filename)   
+        if run_noise_model:
+            # a periodic mission is evaluated more than once, its metrics are streamed from the results 
+            if running_metrics.metrics == None:
+                noise_metrics = Noise_Metrics.noise_metrics(noise_results)
+            else:
+                noise_metrics = running_metrics.finalize()
+            save_results(noise_metrics,filename + '_Noise_Metrics')
+        if profile_mission:
+            report        = Mission_Profiler.write_profile_report(noise_results,filename)
+            Mission_Profiler.print_profile_summary(report)
     
     else:
         filename          = 'SR_V2_Geo_Noise' + city + '_' +  departure_location + '_to_' + destination_location
         noise_results = load_results(filename) 
+        if run_noise_model:
+            noise_metrics = load_results(filename + '_Noise_Metrics')
         
     if plot_mission: 
-        Stopped_Rotor_V2_Plots.plot_results(noise_results,run_noise_model,save_figure_flag = True)       
+        # the noise is plotted from the metrics, not from the (time, 201, 101) microphone history 
+        Stopped_Rotor_V2_Plots.plot_results(noise_results,False,save_figure_flag = True)       
+        if run_noise_model:
+            Stopped_Rotor_V2_Plots.plot_noise_metrics(noise_metrics,save_figure_flag = True)
     
     
     tf = time.time() 
@@ -12,6 +12,12 @@ import numpy as np
 import matplotlib.pyplot as plt    
 import numpy as np   
 import pickle  
+import sys 
+sys.path.append('../../Aircraft_Models/Mission_Tools')  
+
+import Noise_Metrics
+import Contour_Refinement
+import Noise_Settings
  
 # ----------------------------------------------------------------------
 #   Main
@@ -44,12 +50,18 @@ def main():
     header                 = 'Results/'  
     vehicle_tag            = 'SR_V2_TG_Noise_Angle_' 
     true_course_angles_deg = [0,45,90,135,180] 
+    refine_contour         = False    # replay the noise at quadtree microphones refined around the contour levels 
+    contour_levels         = [55.]    # contour levels refined [dBA] 
+    contour_depth          = 3        # number of quadtree splits of a cell of the results grid 
     
     for ang in range(len(true_course_angles_deg)):
         true_course_angle_deg = true_course_angles_deg[ang] 
         sr_noise_filename      = header + vehicle_tag + str(true_course_angle_deg) + '_Nx' + str(N_gm_x) + '_Ny' + str(N_gm_y) 
         sr_noise_results_raw   = load_results(sr_noise_filename )    
         plot_noise_contour(sr_noise_results_raw,plot_parameters,save_fig_name =  'SR_'+ str(true_course_angle_deg) ) 
+        if refine_contour:
+            footprint = refined_noise_contour(sr_noise_results_raw,contour_levels,contour_depth)
+            plot_refined_noise_contour(footprint,plot_parameters,save_fig_name =  'SR_'+ str(true_course_angle_deg) ) 
          
     return
  
@@ -70,7 +82,8 @@ def process_results(res,N_gm_x ,N_gm_y,vehicle_name ):
     PD.time_normalized = np.zeros(data_dimension)   
     PD.num_gm          = res.segments[0].conditions.noise.number_of_ground_microphones 
     PD.gm_mic_loc      = res.segments[0].analyses.noise.settings.ground_microphone_locations.reshape(N_gm_x,N_gm_y,3)
-    PD.SPL_contour     = np.zeros((data_dimension,N_gm_x,N_gm_y)) 
+    PD.noise_metrics   = Noise_Metrics.noise_metrics(res)   # running metrics, no (time, N_gm_x, N_gm_y) history 
+    PD.max_SPL_contour = PD.noise_metrics.Lmax_ground 
     PD.N_gm_x          = N_gm_x  
     PD.N_gm_y          = N_gm_y  
     PD.aircraft_pos    = np.zeros((data_dimension,3))  
@@ -83,19 +96,15 @@ def process_results(res,N_gm_x ,N_gm_y,vehicle_name ):
         time_normalized = res.segments[i].conditions.frames.inertial.time[:,0]/Flight_Time
         ground_distance = res.segments[i].conditions.frames.inertial.position_vector[:,0]  
         altitude        = res.segments[i].conditions.freestream.altitude[:,0]  
-        SPL_contour     = res.segments[i].conditions.noise.total_SPL_dBA   
         pos             = res.segments[i].conditions.frames.inertial.position_vector  
         
-        SPL_contour = np.nan_to_num(SPL_contour)
-        print(np.max(SPL_contour))
-        
         PD.time_normalized[i*num_ctrl_pts:(i+1)*num_ctrl_pts] = time_normalized
         PD.time[i*num_ctrl_pts:(i+1)*num_ctrl_pts]            = time          
         PD.ground_distance[i*num_ctrl_pts:(i+1)*num_ctrl_pts] = ground_distance      
         PD.altitude[i*num_ctrl_pts:(i+1)*num_ctrl_pts]        = altitude       
-        PD.SPL_contour[i*num_ctrl_pts:(i+1)*num_ctrl_pts,:,:] = SPL_contour.reshape(num_ctrl_pts,N_gm_x,N_gm_y)   
         PD.aircraft_pos[i*num_ctrl_pts:(i+1)*num_ctrl_pts,:]  = pos       
         
+    print(np.max(PD.max_SPL_contour))
             
     return PD
 
@@ -119,17 +128,16 @@ def post_process_noise_data(results):
         if  results.segments[i].battery_discharge == False:
             pass
         else:      
-            S_gm_x = results.segments[i].analyses.noise.settings.microphone_x_stencil
-            S_gm_y = results.segments[i].analyses.noise.settings.microphone_y_stencil
             S_locs = results.segments[i].conditions.noise.ground_microphone_stencil_locations
             for j in range(N_ctrl_pts):
                 idx                    = i*N_ctrl_pts + j 
                 Aircraft_pos[idx,0]    = results.segments[i].conditions.frames.inertial.position_vector[j,0] 
                 Aircraft_pos[idx,1]    = results.segments[i].conditions.frames.inertial.position_vector[j,1] 
                 Aircraft_pos[idx,2]    = -results.segments[i].conditions.frames.inertial.position_vector[j,2] 
-                stencil_length         = S_gm_x*2 + 1
-                stencil_width          = S_gm_y*2 + 1
-                SPL_contour_gm[idx,int(S_locs[j,0]):int(S_locs[j,1]),int(S_locs[j,2]):int(S_locs[j,3])]  = results.segments[i].conditions.noise.total_SPL_dBA[j].reshape(stencil_length ,stencil_width )  
+                # window of the stencil, clipped at the grid edges or the full grid of an adaptive stencil 
+                stencil_length         = int(S_locs[j,1]) - int(S_locs[j,0])
+                stencil_width          = int(S_locs[j,3]) - int(S_locs[j,2])
+                SPL_contour_gm[idx,int(S_locs[j,0]):int(S_locs[j,1]),int(S_locs[j,2]):int(S_locs[j,3])]  = results.segments[i].conditions.noise.total_SPL_dBA[j,:stencil_length*stencil_width].reshape(stencil_length ,stencil_width )  
                 if N_bm > 0:
                     SPL_contour_bm[idx,:]  = results.segments[i].conditions.noise.total_SPL_dBA[j,-N_bm:]  
     
@@ -151,18 +159,16 @@ def post_process_noise_data(results):
 def plot_noise_contour(res,PP,save_fig_name):    
 
 
-    noise_data = post_process_noise_data(res)     
+    threshold_dbA = 55 
+    noise_data    = Noise_Metrics.noise_metrics(res,[threshold_dbA])     
 
-    SPL_contour_gm  = noise_data.SPL_dBA_ground_mic        
-    Aircraft_pos    = noise_data.aircraft_position       
-    X               = noise_data.SPL_dBA_ground_mic_loc[:,:,0]  
-    Y               = noise_data.SPL_dBA_ground_mic_loc[:,:,1]  
-    Z               = noise_data.SPL_dBA_ground_mic_loc[:,:,2]   
+    X               = noise_data.ground_microphone_locations[:,:,0]  
+    Y               = noise_data.ground_microphone_locations[:,:,1]  
+    Z               = noise_data.ground_microphone_locations[:,:,2]   
     
-    threshold_dbA = 55 
-    max_SPL_gm    = np.max(SPL_contour_gm,axis=0)
+    max_SPL_gm    = noise_data.Lmax_ground
     threshold_idx = np.where(max_SPL_gm.flatten() > threshold_dbA)[0]
-    print( 'Percentage over thresholds: ' + str( round(len(threshold_idx)*100/noise_data.N_gm, 2)))
+    print( 'Percentage over thresholds: ' + str( round(len(threshold_idx)*100/max_SPL_gm.size, 2)))
     
     # ---------------------------------------------------------------------------
     # Full Noise Contour 
@@ -184,6 +190,57 @@ def plot_noise_contour(res,PP,save_fig_name):
  
     return 
    
+# ------------------------------------------------------------------
+# Refined Noise Contours
+# ------------------------------------------------------------------
+def refined_noise_contour(res,levels,max_depth):
+    '''Replays the noise of the results at quadtree microphones refined around the
+    contour levels, over the extent and coarse resolution of the results grid'''
+
+    settings      = res.segments[0].analyses.noise.settings
+    mic_locations = settings.ground_microphone_locations
+    x_res,y_res   = Noise_Settings.settings_names(settings,Noise_Settings.RESOLUTION_SETTINGS)
+    N_gm_x,N_gm_y = settings[x_res],settings[y_res]
+    evaluate      = Contour_Refinement.replay_microphone_evaluator(res,Contour_Refinement.results_noise_setup(res))
+    footprint     = Contour_Refinement.refine_noise_contour(evaluate,np.min(mic_locations[:,0]),np.max(mic_locations[:,0]),
+                                                            np.min(mic_locations[:,1]),np.max(mic_locations[:,1]),
+                                                            N_gm_x,N_gm_y,levels,max_depth)
+    return footprint
+
+# ------------------------------------------------------------------
+# Plot Refined Noise Contours
+# ------------------------------------------------------------------
+def plot_refined_noise_contour(footprint,PP,save_fig_name):
+    '''Plots the maximum SPL footprint of Contour_Refinement.refine_noise_contour,
+    with the refined contour levels and the evaluated microphones overlaid'''
+
+    X,Y             = np.meshgrid(footprint.raster_x,footprint.raster_y,indexing = 'ij')
+    max_SPL_gm      = footprint.raster_SPL_dBA
+
+    threshold_dbA = footprint.levels[0]
+    threshold_idx = np.where(max_SPL_gm.flatten() > threshold_dbA)[0]
+    print( 'Percentage over thresholds: ' + str( round(len(threshold_idx)*100/max_SPL_gm.size, 2)))
+    print( 'Microphones evaluated: ' + str(footprint.number_of_microphones) + ' of ' + str(footprint.number_of_uniform_microphones))
+
+    filename            = 'Refined_Noise_Contour' + save_fig_name
+    fig                 = plt.figure(filename)
+    fig.set_size_inches(9,6)
+    min_SPL             = 35
+    max_SPL             = 80
+    levs                = np.linspace(min_SPL,max_SPL,10)
+    axes                = fig.add_subplot(1,1,1)
+    CS                  = axes.contourf(X,Y,max_SPL_gm, levels  = levs, cmap=plt.cm.jet, extend='both')
+    axes.contour(X,Y,max_SPL_gm, levels = footprint.levels, colors = 'black', linewidths = PP.line_width)
+    axes.scatter(footprint.microphone_locations[:,0],footprint.microphone_locations[:,1], s = 1, color = 'grey')
+    cbar = fig.colorbar(CS)
+    cbar.ax.set_ylabel('SPL (dBA)', rotation =  90)
+    axes.set_ylabel('y (m)',labelpad = 12)
+    axes.set_xlabel('x (m)')
+    plt.tight_layout()
+    plt.savefig(filename + '.png')
+
+    return
+
 # ----------------------------------------------------------------------
 #  Load results
 # ----------------------------------------------------------------------     
@@ -18,11 +18,13 @@ import pylab as plt
 
 import sys 
 sys.path.append('../../Aircraft_Models/Stopped_Rotor_V2')  
+sys.path.append('../../Aircraft_Models/Mission_Tools')  
 
 import Stopped_Rotor_V2_Vehicle
 import Stopped_Rotor_V2_Analyses 
 import Stopped_Rotor_V2_Missions
 import Stopped_Rotor_V2_Plots  
+import Noise_Metrics
 
 try:
     import vsp 
@@ -89,6 +91,9 @@ def main():
     
     # APPEND MISSION TO SIMULATION 
     mission           = analyses.missions.base
+    if run_noise_model:
+        # accumulate the community noise metrics segment by segment during the evaluation 
+        running_metrics = Noise_Metrics.add_noise_metrics(mission)
     
     # RUN SIMULATION !!
     noise_results     = mission.evaluate()   
@@ -96,6 +101,8 @@ def main():
     # SAVE RESULTS
     filename          = 'SR_V2_TG_Noise_Angle_' + str(true_course_angle_deg) + '_Nx' + str(N_gm_x) + '_Ny' + str(N_gm_y)
     save_results(noise_results,filename)  
+    if run_noise_model:
+        save_results(running_metrics.finalize(),filename + '_Noise_Metrics')
     
     tf = time.time() 
     print ('time taken: '+ str(round(((tf-ti)/60),3)) + ' mins') 